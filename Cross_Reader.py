@@ -1,20 +1,62 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import keyboard
-import pytesseract
-from PIL import ImageGrab, ImageTk, Image 
+# pytesseract, deepl, keyboard, PIL(ImageTk/ImageGrab), NumPy를 쓰는 OCR 모듈은
+# 창이 뜬 뒤 처음 필요할 때 불러옵니다. (시작 시간 단축)
+import sys
 import threading
+import multiprocessing
 import time
-import deepl 
-import pandas as pd
+from collections import OrderedDict
 import config # config.py 파일 임포트 (별도로 존재해야 함)
+from translation_cache import TranslationCache
+import ocr_cache
+from history import HistoryStore
+import translation
+import translators
+import monitors
+from pipeline import TranslationPipeline
+from tracing import Tracer, STAGES
+
+
+# 창 크기 변경이 멈춘 뒤 고품질로 다시 그리기까지의 대기 시간
+RESIZE_DEBOUNCE_MS = 150
+# 리사이즈 캐시의 크기 구간 (px)과 보관 개수
+SIZE_BUCKET = 16
+PHOTO_CACHE_LIMIT = 8
+# 캡처 전에 화면 오버레이를 숨길 때 기다리는 최대 시간과, 숨긴 뒤 화면이 다시 그려질 때까지의 대기 시간 (초)
+OVERLAY_HIDE_TIMEOUT = 0.5
+OVERLAY_REPAINT_SECONDS = 0.05
+# 결과 창 오버레이 뷰를 축소해 보여줄 때 글꼴의 최소 크기 (px)
+PREVIEW_MIN_FONT_PX = 7
+
+
+STAGE_LABELS = (('capture', '캡처'), ('queue', '대기'), ('preprocess', '전처리'), ('detect', '영역 검출'), ('first', '첫 줄'), ('ocr', 'OCR'), ('retry', '재인식'), ('translate', '번역'), ('layout', '배치'), ('total', '전체'))
+
+
+def format_timings(timings):
+    """단계별 소요 시간을 상태 표시줄용 문자열로 만듭니다."""
+    return " · ".join(f"{label} {timings[key] * 1000:.0f}ms" for key, label in STAGE_LABELS if key in timings)
+
+
+def capture_screen(bbox=None):
+    """
+    화면을 캡처하고 걸린 시간과 캡처 위치를 이미지 정보(img.info)에 남깁니다.
+    (mss가 있으면 요청한 영역만 받아와 변환, screen_capture 참고)
+    """
+    import screen_capture
+    return screen_capture.grab(bbox)
 
 
 # ==========================================
 # ContextWindow 클래스 (번역 결과 상세 오버레이 창)
 # ==========================================
 class ContextWindow(tk.Toplevel):
-    def __init__(self, master, img, ocr_data, translated_text):
+    def __init__(self, master, img, ocr_data, translated_text, boxes=None):
+        """
+        translated_text: ocr_data의 각 줄과 1:1로 대응하는 번역 목록,
+        또는 오류/안내 메시지 문자열
+        boxes: 작업 스레드에서 미리 계산한 번역 박스 배치 (layout.layout_lines, 없으면 표시할 때 계산)
+        """
         super().__init__(master)
         self.title("번역 결과 상세")
         self.attributes('-topmost', True)
@@ -25,7 +67,15 @@ class ContextWindow(tk.Toplevel):
         self.img = img
         self.ocr_data = ocr_data 
         self.translated_text = translated_text
+        self.boxes = boxes
         self.display_mode = tk.StringVar(value="OverlayView") 
+        
+        # 렌더링 캐시 (크기 구간별 이미지, 재사용할 캔버스 아이템)
+        self._photo_cache = OrderedDict()
+        self._overlay_items = []
+        self._overlay_geometry = None
+        self._settle_job = None
+        self.overlay_canvas = None
 
         self.create_widgets()
         self.display_mode.trace_add("write", self.update_view) 
@@ -51,9 +101,27 @@ class ContextWindow(tk.Toplevel):
 
     def clear_view(self):
         """메인 뷰 프레임의 모든 위젯을 제거합니다."""
+        self.overlay_canvas = None
         for widget in self.main_view_frame.winfo_children():
             widget.destroy()
     
+    def update_result(self, img, ocr_data, translated_text, boxes=None):
+        """창을 다시 만들지 않고 새 캡처 결과로 내용을 바꿉니다."""
+        previous_img = self.img
+        self.img = img
+        self.ocr_data = ocr_data
+        self.translated_text = translated_text
+        self.boxes = boxes
+        
+        # 같은 캡처에 줄이 추가된 경우(타일 단위 점진 표시)에는 오버레이만 다시 배치합니다.
+        if img is previous_img and self.display_mode.get() == "OverlayView" and self.overlay_canvas is not None:
+            self.display_overlay_image(self.img, self.overlay_canvas, self.ocr_data, self.translated_text)
+            return
+        
+        # 이전 이미지 기준의 렌더링 캐시는 더 이상 맞지 않으므로 비웁니다.
+        self._photo_cache.clear()
+        self.update_view()
+
     def update_view(self, *args):
         """선택된 모드에 따라 뷰를 다시 그립니다."""
         self.clear_view()
@@ -74,13 +142,13 @@ class ContextWindow(tk.Toplevel):
         self.canvas = tk.Canvas(img_frame, bg='white', relief=tk.SUNKEN, borderwidth=1)
         self.canvas.pack(fill='both', expand=True)
         self.display_image(self.img, self.canvas) 
-        self.canvas.bind('<Configure>', lambda e, c=self.canvas: self.display_image(self.img, c))
+        self.canvas.bind('<Configure>', lambda e, c=self.canvas: self._on_canvas_configure(c, self._render_image))
 
         # 2. 번역 텍스트 섹션 (오른쪽)
         text_frame = ttk.LabelFrame(main_frame, text="번역 결과")
         text_frame.pack(side='right', fill='y', padx=5, pady=5)
         
-        ocr_text_list = self.ocr_data['text'].dropna().tolist() if self.ocr_data is not None else ["OCR 데이터 없음"]
+        ocr_text_list = [line.text for line in self.ocr_data] if self.ocr_data is not None else ["OCR 데이터 없음"]
         
         ttk.Label(text_frame, text="[원본 OCR 텍스트]", font=('Arial', 10, 'bold')).pack(anchor='w', pady=(5,0))
         ocr_area = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, height=8, font=("Malgun Gothic", 9))
@@ -90,7 +158,7 @@ class ContextWindow(tk.Toplevel):
         
         ttk.Label(text_frame, text="[번역된 텍스트]", font=('Arial', 10, 'bold')).pack(anchor='w', pady=(10,0))
         trans_area = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, height=15, font=("Malgun Gothic", 11, 'bold'))
-        trans_area.insert(tk.INSERT, self.translated_text)
+        trans_area.insert(tk.INSERT, self._translated_as_text())
         trans_area.config(state=tk.DISABLED)
         trans_area.pack(fill='both', expand=True, padx=5, pady=2)
 
@@ -101,145 +169,267 @@ class ContextWindow(tk.Toplevel):
         
         overlay_canvas = tk.Canvas(main_frame, bg='black') 
         overlay_canvas.pack(fill='both', expand=True)
+        self.overlay_canvas = overlay_canvas
+        
+        # 새 캔버스이므로 재사용할 오버레이 아이템을 초기화합니다.
+        self._overlay_items = []
+        self._overlay_geometry = None
 
         self.display_overlay_image(self.img, overlay_canvas, self.ocr_data, self.translated_text)
         
         overlay_canvas.bind('<Configure>', 
-                            lambda e, c=overlay_canvas: self.display_overlay_image(self.img, c, self.ocr_data, self.translated_text))
+                            lambda e, c=overlay_canvas: self._on_canvas_configure(c, self._render_overlay))
+
+
+    def _translated_as_text(self):
+        if isinstance(self.translated_text, str):
+            return self.translated_text
+        return "\n".join(self.translated_text)
+
+    def _fit_size(self, img, canvas_width, canvas_height):
+        """
+        캔버스에 맞는 표시 배율과 크기를 계산합니다.
+        폭을 SIZE_BUCKET 단위로 맞춰, 창 크기를 조금씩 바꿔도 같은 크기 구간의 캐시를 재사용합니다.
+        """
+        img_width, img_height = img.size
+        ratio = min(canvas_width / img_width, canvas_height / img_height)
+        new_width = max(SIZE_BUCKET, int(img_width * ratio) // SIZE_BUCKET * SIZE_BUCKET)
+        ratio = new_width / img_width
+        new_height = max(1, int(img_height * ratio))
+        return ratio, new_width, new_height
 
+    def _get_photo(self, img, size, high_quality):
+        """크기 구간별로 리사이즈된 PhotoImage를 캐시에서 가져오거나 새로 만듭니다."""
+        for key in ((size, True), (size, high_quality)):
+            if key in self._photo_cache:
+                self._photo_cache.move_to_end(key)
+                return self._photo_cache[key]
 
-    def display_image(self, img, canvas):
+        from PIL import Image, ImageTk
+        # 드래그 중에는 빠른 필터, 크기가 확정되면 LANCZOS로 한 번만 고품질 리사이즈
+        resample = Image.Resampling.LANCZOS if high_quality else Image.Resampling.NEAREST
+        # reducing_gap: 큰 캡처(4K 등)는 먼저 정수 배율로 줄인 뒤 필터를 적용해 임시 메모리와 시간을 줄입니다.
+        photo = ImageTk.PhotoImage(img.resize(size, resample, reducing_gap=3.0))
+        self._photo_cache[(size, high_quality)] = photo
+        while len(self._photo_cache) > PHOTO_CACHE_LIMIT:
+            self._photo_cache.popitem(last=False)
+        return photo
+
+    def _place_image(self, canvas, photo, x, y, anchor):
+        """캔버스의 이미지 아이템을 새로 만들지 않고 이미지/위치만 바꿉니다."""
+        items = canvas.find_withtag('capture')
+        if items:
+            canvas.itemconfig(items[0], image=photo, anchor=anchor)
+            canvas.coords(items[0], x, y)
+        else:
+            canvas.create_image(x, y, image=photo, anchor=anchor, tags='capture')
+        canvas.tag_lower('capture')
+        canvas.image = photo
+
+    def _on_canvas_configure(self, canvas, render):
+        """
+        크기 변경 이벤트를 디바운스합니다.
+        드래그 중에는 저렴한 렌더링만 하고, 크기가 멈추면 고품질로 한 번 다시 그립니다.
+        """
+        if not canvas.find_withtag('capture'):
+            # 처음 그리는 경우에는 바로 고품질로 표시
+            render(canvas, high_quality=True)
+            return
+        
+        render(canvas, high_quality=False)
+        if self._settle_job is not None:
+            self.after_cancel(self._settle_job)
+        self._settle_job = self.after(RESIZE_DEBOUNCE_MS, lambda: self._settle(canvas, render))
+
+    def _settle(self, canvas, render):
+        self._settle_job = None
+        if canvas.winfo_exists():
+            render(canvas, high_quality=True)
+
+    def _render_image(self, canvas, high_quality=True):
+        self.display_image(self.img, canvas, high_quality)
+
+    def _render_overlay(self, canvas, high_quality=True):
+        self.display_overlay_image(self.img, canvas, self.ocr_data, self.translated_text, high_quality)
+
+    def display_image(self, img, canvas, high_quality=True):
         """일반 뷰에서 이미지를 표시"""
         if img is None: return
-        canvas.delete("all")
         canvas_width = canvas.winfo_width()
         canvas_height = canvas.winfo_height()
         if canvas_width < 10 or canvas_height < 10: return
 
-        img_width, img_height = img.size
-        ratio_w = canvas_width / img_width
-        ratio_h = canvas_height / img_height
-        ratio = min(ratio_w, ratio_h)
-        new_width = int(img_width * ratio)
-        new_height = int(img_height * ratio)
-        
-        resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        self.photo = ImageTk.PhotoImage(resized_img)
-        canvas.create_image(canvas_width/2, canvas_height/2, image=self.photo, anchor='center')
-        canvas.image = self.photo
+        ratio, new_width, new_height = self._fit_size(img, canvas_width, canvas_height)
+        self.photo = self._get_photo(img, (new_width, new_height), high_quality)
+        self._place_image(canvas, self.photo, canvas_width/2, canvas_height/2, 'center')
 
-
-    def display_overlay_image(self, img, canvas, ocr_data, translated_text_full):
+    def display_overlay_image(self, img, canvas, ocr_data, translated, high_quality=True):
         """
         오버레이 뷰에서 이미지 위에 번역 텍스트를 덮습니다.
+        드래그 중(high_quality=False)에는 기존 박스/텍스트를 이동·확대만 하고 다시 배치하지 않습니다.
         """
         if img is None: return
-        canvas.delete("all")
         
-        # 캔버스 크기, 이미지 로딩, 비율/위치 계산 로직은 동일
+        # 캔버스 크기, 이미지 로딩, 비율/위치 계산
         canvas_width = canvas.winfo_width()
         canvas_height = canvas.winfo_height()
         if canvas_width < 10 or canvas_height < 10: return
         
-        img_width, img_height = img.size
-        ratio_w = canvas_width / img_width
-        ratio_h = canvas_height / img_height
-        ratio = min(ratio_w, ratio_h)
-        
-        new_width = int(img_width * ratio)
-        new_height = int(img_height * ratio)
-
-        resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        self.overlay_photo = ImageTk.PhotoImage(resized_img)
-        
+        ratio, new_width, new_height = self._fit_size(img, canvas_width, canvas_height)
         img_start_x = (canvas_width - new_width) // 2
         img_start_y = (canvas_height - new_height) // 2
 
-        canvas.create_image(img_start_x, img_start_y, image=self.overlay_photo, anchor='nw')
-        canvas.image = self.overlay_photo
+        self.overlay_photo = self._get_photo(img, (new_width, new_height), high_quality)
+        self._place_image(canvas, self.overlay_photo, img_start_x, img_start_y, 'nw')
+
+        # 이미 그려진 오버레이가 있으면 좌표만 옮기고 배율을 맞춥니다.
+        if not high_quality and self._overlay_geometry is not None and canvas.find_withtag('overlay'):
+            old_ratio, old_x, old_y = self._overlay_geometry
+            factor = ratio / old_ratio
+            canvas.scale('overlay', old_x, old_y, factor, factor)
+            canvas.move('overlay', img_start_x - old_x, img_start_y - old_y)
+            self._overlay_geometry = (ratio, img_start_x, img_start_y)
+            return
+        self._overlay_geometry = (ratio, img_start_x, img_start_y)
         
         # --- OCR 데이터 및 줄 불일치 예외 처리 ---
-        translated_lines = translated_text_full.split('\n')
-        valid_ocr_lines = ocr_data.dropna(subset=['text'])
+        if isinstance(translated, str):
+            translated_lines = [translated]
+        else:
+            translated_lines = translated
+        valid_ocr_lines = ocr_data if ocr_data is not None else []
         
         if len(translated_lines) != len(valid_ocr_lines):
             # 줄 수가 맞지 않으면 중앙에 표시하는 예비 로직으로 대체
+            canvas.delete('overlay')
+            self._overlay_items = []
             x_pos = img_start_x + new_width / 2
             y_pos = img_start_y + new_height / 4
+            # 번역 목록이 아니면 오류/안내 메시지이므로 그대로 표시
+            message = translated if isinstance(translated, str) else "[줄 수 불일치] " + "\n".join(translated)
             canvas.create_text(x_pos, y_pos, 
-                                text="[줄 수 불일치] " + translated_text_full, 
+                                text=message, 
                                 fill="red", font=("Malgun Gothic", 12, "bold"),
-                                width=new_width * 0.9, justify="center", anchor="n")
+                                width=new_width * 0.9, justify="center", anchor="n",
+                                tags='overlay')
             return
             
-        # 3. 줄 단위로 순회하며 텍스트를 이미지 위에 덮어씁니다.
+        # 3. 작업 스레드에서 계산해 둔 박스(이미지 좌표)를 표시 배율에 맞춰 놓기만 합니다.
+        import layout
+        boxes = self.boxes if self.boxes is not None else layout.layout_lines(valid_ocr_lines, translated_lines)
+        metrics = layout.get_metrics()
+        drawn = 0
         
-        # --- 💡 폰트 크기 및 패딩 설정 ---
-        MIN_FONT_SIZE = 10 
-        MAX_FONT_SIZE = 24 
-        PADDING_Y = 8   
-        MIN_GAP = 2     
+        for box in boxes:
+            x1 = box.left * ratio + img_start_x
+            y1 = box.top * ratio + img_start_y
+            x2 = x1 + box.width * ratio
+            y2 = y1 + box.height * ratio
+            font_tuple = metrics.tk_font(max(PREVIEW_MIN_FONT_PX, round(box.font_size * ratio)))
+            wrap_width = box.wrap_width * ratio
+            
+            if drawn < len(self._overlay_items):
+                # 기존 아이템 재사용: 좌표와 글꼴만 갱신
+                rect_id, text_id = self._overlay_items[drawn]
+                canvas.coords(rect_id, x1, y1, x2, y2)
+                canvas.coords(text_id, (x1 + x2) / 2, (y1 + y2) / 2)
+                canvas.itemconfig(text_id, text=box.text, font=font_tuple, width=wrap_width)
+            else:
+                rect_id = canvas.create_rectangle(x1, y1, x2, y2, fill='white', outline='white', tags='overlay')
+                text_id = canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2,
+                                             text=box.text,
+                                             fill="black",
+                                             font=font_tuple,
+                                             width=wrap_width,
+                                             justify="center",
+                                             anchor="center",
+                                             tags='overlay')
+                self._overlay_items.append((rect_id, text_id))
+            drawn += 1
 
-        last_drawn_y_end = img_start_y
-        
-        for i, (index, line) in enumerate(valid_ocr_lines.iterrows()):
-            if i >= len(translated_lines):
-                break
+        # 이전 렌더링에서 남은 아이템 정리
+        for rect_id, text_id in self._overlay_items[drawn:]:
+            canvas.delete(rect_id, text_id)
+        del self._overlay_items[drawn:]
 
-            trans_text = translated_lines[i].strip()
-            if not trans_text:
-                continue 
-            
-            scale_factor = ratio 
 
-            # 캔버스상의 원본 OCR 바운딩 박스 위치 계산
-            bbox_x = line['left'] * scale_factor + img_start_x
-            bbox_y = line['top'] * scale_factor + img_start_y
-            bbox_width = line['width'] * scale_factor
-            bbox_height = line['height'] * scale_factor
-            
-            # 1. 폰트 크기 결정: 
-            optimal_font_size = max(MIN_FONT_SIZE, min(MAX_FONT_SIZE, int(bbox_height * 0.8))) 
-            font_tuple = ("Malgun Gothic", optimal_font_size, "bold")
+# -------------------------------------------------------------
+# ScreenOverlay 클래스 (캡처한 화면 위치에 바로 덮는 투명 오버레이)
+# -------------------------------------------------------------
+class ScreenOverlay(tk.Toplevel):
+    """
+    캡처한 화면 좌표에 번역 줄 박스만 그리는 투명 창입니다. (항상 위, 클릭 통과)
+    캡처 이미지를 복사/리사이즈하지 않고, 캔버스 아이템은 다음 결과에서도 좌표/글자만 바꿔 재사용합니다.
+    """
+    # 이 색으로 칠한 부분은 투명하게 보입니다. (번역 박스에 쓰지 않는 색)
+    TRANSPARENT_COLOR = '#010203'
 
-            # 텍스트 중앙 X 위치
-            text_x = bbox_x + bbox_width / 2
-            text_draw_width = bbox_width * 0.95 
-            
-            # --- 텍스트 실제 높이 측정 ---
-            temp_text_id = canvas.create_text(0, 0, 
-                                            text=trans_text,
-                                            font=font_tuple,
-                                            width=text_draw_width,
-                                            anchor="nw",
-                                            fill="")
-            
-            temp_bbox = canvas.bbox(temp_text_id)
-            actual_text_height = (temp_bbox[3] - temp_bbox[1]) if temp_bbox else bbox_height
-            canvas.delete(temp_text_id)
-
-            # --- Y축 독립성 확보 및 최종 박스 경계 계산 ---
-            current_ideal_y_start = bbox_y - PADDING_Y 
-            safe_y_start = last_drawn_y_end + MIN_GAP
-            final_y_start = max(current_ideal_y_start, safe_y_start) 
-            final_y_end = final_y_start + actual_text_height + (PADDING_Y * 2) 
-            final_text_center_y = (final_y_start + final_y_end) / 2
-            
-            # 6. 배경 박스 그리기
-            canvas.create_rectangle(bbox_x, final_y_start, 
-                                    bbox_x + bbox_width, final_y_end, 
-                                    fill='white', outline='white') 
-            
-            # 7. 번역 텍스트를 중앙에 표시
-            canvas.create_text(text_x, final_text_center_y, 
-                                text=trans_text,
-                                fill="black", 
-                                font=font_tuple, 
-                                width=text_draw_width, 
-                                justify="center",
-                                anchor="center")
-                                
-            last_drawn_y_end = final_y_end
+    def __init__(self, master):
+        super().__init__(master)
+        self.withdraw()
+        self.overrideredirect(True)
+        self.attributes('-topmost', True)
+        self.configure(bg=self.TRANSPARENT_COLOR)
+        try:
+            self.attributes('-transparentcolor', self.TRANSPARENT_COLOR)
+        except tk.TclError:
+            # 색상 키 투명은 Windows 전용이므로 그 외에서는 반투명 창으로 대체합니다.
+            self.attributes('-alpha', 0.85)
+        self.canvas = tk.Canvas(self, bg=self.TRANSPARENT_COLOR, highlightthickness=0, borderwidth=0)
+        self.canvas.pack(fill='both', expand=True)
+        self._items = []
+        self._geometry = None
+        self._styled = False
+        # 캡처에서 제외되면 다음 캡처 전에 창을 숨길 필요가 없습니다. (창이 처음 표시될 때 결정)
+        self.excluded_from_capture = False
+
+    @property
+    def is_visible(self):
+        return self.state() != 'withdrawn'
+
+    def show_result(self, bbox, boxes):
+        """bbox(화면 좌표) 위치에 창을 맞추고 번역 박스(layout.LayoutBox, 캡처 이미지 좌표)를 그립니다."""
+        x1, y1, x2, y2 = bbox
+        geometry = f"{x2 - x1}x{y2 - y1}+{x1}+{y1}"
+        if geometry != self._geometry:
+            self.geometry(geometry)
+            self._geometry = geometry
+        self._draw(boxes)
+        if not self.is_visible:
+            self.deiconify()
+        if not self._styled:
+            # 창 핸들(HWND)은 처음 표시된 뒤에 확정되므로 이때 한 번만 스타일을 바꿉니다.
+            self.update_idletasks()
+            monitors.make_click_through(self)
+            self.excluded_from_capture = monitors.exclude_from_capture(self)
+            self._styled = True
+        self.lift()
+
+    def hide(self):
+        self.withdraw()
+
+    def _draw(self, boxes):
+        """layout으로 계산된 박스를 화면 좌표 그대로 놓습니다. (아이템 재사용)"""
+        import layout
+        canvas = self.canvas
+        metrics = layout.get_metrics()
+        for index, box in enumerate(boxes):
+            x2, y2 = box.left + box.width, box.top + box.height
+            font_tuple = metrics.tk_font(box.font_size)
+            if index < len(self._items):
+                rect_id, text_id = self._items[index]
+                canvas.coords(rect_id, box.left, box.top, x2, y2)
+                canvas.coords(text_id, box.center_x, box.center_y)
+                canvas.itemconfig(text_id, text=box.text, font=font_tuple, width=box.wrap_width)
+            else:
+                rect_id = canvas.create_rectangle(box.left, box.top, x2, y2, fill='white', outline='#888888')
+                text_id = canvas.create_text(box.center_x, box.center_y, text=box.text, fill="black", font=font_tuple,
+                                             width=box.wrap_width, justify="center", anchor="center")
+                self._items.append((rect_id, text_id))
+
+        for rect_id, text_id in self._items[len(boxes):]:
+            canvas.delete(rect_id, text_id)
+        del self._items[len(boxes):]
 
 
 # -------------------------------------------------------------
@@ -260,9 +450,30 @@ class TranslatorApp(tk.Frame):
         self.status_label.pack(side=tk.BOTTOM, fill="x")
         
         self.context_window = None 
+        self.screen_overlay = None 
         self.translator = None 
+        self._translator_settings = None 
+        self.ocr_engine = None 
+        self.tiled_ocr = None 
+        self.region_watcher = None 
+        self.region_diff = None 
+        self.translation_cache = TranslationCache()
+        # 똑같은 화면을 다시 캡처하면 OCR을 건너뛰도록 이미지 내용 해시로 줄 목록을 기억합니다.
+        self.ocr_cache = ocr_cache.OcrCache(ocr_cache.CACHE_FILE if config.is_ocr_cache_persistent() else None,
+                                            max_bytes=config.get_ocr_cache_max_mb() * 2 ** 20,
+                                            max_age=config.get_ocr_cache_max_age())
+        self.tracer = Tracer(config.is_tracing_enabled(), config.get_trace_file())
+        self.stats_window = None
+        # 캡처마다 결과를 번역 기록(history.db)에 남깁니다. (쓰기는 별도 스레드)
+        self.history = HistoryStore() if config.is_history_enabled() else None
+        self.history_window = None
+        self.pipeline = TranslationPipeline(self._ocr_stage, self._translate_stage,
+                                            self._on_pipeline_result, self._on_pipeline_error)
         self.api_check = False 
         self.is_running = False
+        # 백그라운드 엔진 초기화가 끝나면 set 됩니다. (설정 저장과 동시에 적용되지 않도록 잠금 사용)
+        self.engines_ready = threading.Event()
+        self._engine_lock = threading.Lock()
         
         # --- B. 설정 섹션 ---
         self._setup_settings_ui()
@@ -277,6 +488,32 @@ class TranslatorApp(tk.Frame):
         self.capture_mode = tk.StringVar(value="region") 
         ttk.Radiobutton(lf_capture, text="영역 선택 (마우스 드래그)", variable=self.capture_mode, value="region").pack(anchor="w", padx=5)
         ttk.Radiobutton(lf_capture, text="전체 화면", variable=self.capture_mode, value="full").pack(anchor="w", padx=5)
+        ttk.Radiobutton(lf_capture, text="영역 고정 감시 (화면이 바뀔 때만 자동 번역)", variable=self.capture_mode, value="watch").pack(anchor="w", padx=5)
+        
+        self.detect_text_regions = tk.BooleanVar(value=True)
+        ttk.Checkbutton(lf_capture, text="글자 영역만 골라 OCR (빈 화면/그림 영역 건너뛰기)", variable=self.detect_text_regions).pack(anchor="w", padx=5)
+        
+        self.use_screen_overlay = tk.BooleanVar(value=True)
+        ttk.Checkbutton(lf_capture, text="번역을 캡처한 화면 위에 바로 표시 (Esc로 숨기기)", variable=self.use_screen_overlay).pack(anchor="w", padx=5)
+        
+        # 캡처 방식별 OCR 전처리 프리셋 (선택한 캡처 방식에 대해 표시/저장)
+        self.preprocess_presets = dict(config.DEFAULT_PREPROCESS_PRESETS)
+        self.preprocess_presets.update(config.get_preprocess_presets())
+        
+        preset_frame = ttk.Frame(lf_capture)
+        preset_frame.pack(fill="x", padx=5, pady=(0, 5))
+        ttk.Label(preset_frame, text="OCR 전처리 (현재 캡처 방식):").pack(side="left")
+        self.preprocess_preset = tk.StringVar(value=self.preprocess_presets[self.capture_mode.get()])
+        ttk.Combobox(preset_frame, textvariable=self.preprocess_preset, values=list(config.PREPROCESS_PRESET_NAMES),
+                     state="readonly", width=10).pack(side="left", padx=5)
+        self.capture_mode.trace_add("write", lambda *args: self.preprocess_preset.set(self.preprocess_presets[self.capture_mode.get()]))
+        self.preprocess_preset.trace_add("write", lambda *args: self.preprocess_presets.__setitem__(self.capture_mode.get(), self.preprocess_preset.get()))
+        
+        watch_frame = ttk.Frame(lf_capture)
+        watch_frame.pack(fill="x", padx=5, pady=(0, 5))
+        ttk.Label(watch_frame, text="감시 주기 (초당 캡처 횟수):").pack(side="left")
+        self.watch_fps = tk.DoubleVar(value=2.0)
+        ttk.Spinbox(watch_frame, from_=0.5, to=10.0, increment=0.5, width=5, textvariable=self.watch_fps).pack(side="left", padx=5)
 
         # 번역 언어 설정 (원본 언어 코드 필드 추가)
         lf_lang = ttk.LabelFrame(control_frame, text="2. 번역 언어 설정")
@@ -286,7 +523,7 @@ class TranslatorApp(tk.Frame):
         self.target_lang = tk.StringVar(value="KO")
         ttk.Entry(lf_lang, textvariable=self.target_lang).pack(fill="x", padx=5, pady=2)
         
-        ttk.Label(lf_lang, text="원본 언어 코드 (Tesseract, eng, kor, jpn 등)").pack(anchor="w", padx=5, pady=(10,0))
+        ttk.Label(lf_lang, text="원본 언어 코드 (Tesseract, eng, kor, jpn 등 / auto: 자동 감지)").pack(anchor="w", padx=5, pady=(10,0))
         self.source_ocr_lang = tk.StringVar(value="eng")
         ttk.Entry(lf_lang, textvariable=self.source_ocr_lang).pack(fill="x", padx=5, pady=2)
 
@@ -309,11 +546,18 @@ class TranslatorApp(tk.Frame):
         # 실행 버튼
         self.btn_start = ttk.Button(control_frame, text="설정 적용 및 감지 시작", command=self.toggle_listening)
         self.btn_start.pack(fill="x", padx=5, pady=10)
+        
+        ttk.Button(control_frame, text="📊 단계별 처리 시간 통계", command=self.show_stats_window).pack(fill="x", padx=5, pady=(0, 5))
+        ttk.Button(control_frame, text="🕘 번역 기록 (검색/내보내기)", command=self.show_history_window).pack(fill="x", padx=5, pady=(0, 10))
+        
+        # 엔진 초기화는 창을 먼저 그린 뒤 백그라운드에서 진행합니다.
+        self.master.after_idle(self._start_background_init)
 
 
     def start_hotkey_capture(self):
         """단축키 입력을 대기하는 모드로 전환하고 키보드 이벤트를 감지합니다."""
         
+        import keyboard
         self.status_label.config(text="단축키 입력을 대기합니다... (취소: ESC)", foreground="orange")
         self.btn_capture_hotkey.config(text="입력 대기 중...", state=tk.DISABLED)
         
@@ -326,6 +570,7 @@ class TranslatorApp(tk.Frame):
 
     def _capture_first_hotkey_event(self, event):
         """가장 먼저 인식된 키 조합을 단축키로 설정합니다. (keyboard.remove_hotkey 적용)"""
+        import keyboard
         
         if event.event_type == keyboard.KEY_DOWN:
             current_hotkey = keyboard.get_hotkey_name()
@@ -347,6 +592,7 @@ class TranslatorApp(tk.Frame):
         
     def cancel_hotkey_capture(self):
         """ESC 키 등으로 단축키 캡처 모드를 취소합니다. (keyboard.remove_hotkey 적용)"""
+        import keyboard
         
         if hasattr(self, 'key_listener_hook'):
             keyboard.unhook(self.key_listener_hook)
@@ -390,9 +636,13 @@ class TranslatorApp(tk.Frame):
         save_button = ttk.Button(settings_frame, text="설정 저장", command=self.save_settings, style='Accent.TButton')
         save_button.grid(row=1, column=2, padx=5, pady=2)
         
-        settings_frame.grid_columnconfigure(1, weight=1) 
+        # 4. 번역 엔진 선택 (auto: DeepL 우선, 실패/지연 시 오프라인 Argos)
+        ttk.Label(settings_frame, text="번역 엔진:").grid(row=2, column=0, sticky="w", pady=2)
+        self.translator_backend_var = tk.StringVar(value=config.get_translator_backend())
+        ttk.Combobox(settings_frame, textvariable=self.translator_backend_var, values=list(translators.BACKEND_CHOICES),
+                     state="readonly", width=10).grid(row=2, column=1, sticky="w", padx=5, pady=2)
         
-        self.save_settings(initial=True) 
+        settings_frame.grid_columnconfigure(1, weight=1) 
 
     def browse_tesseract_path(self):
         """Tesseract 실행 파일 경로를 탐색합니다."""
@@ -404,61 +654,126 @@ class TranslatorApp(tk.Frame):
             self.tesseract_path_var.set(filepath)
             self.status_label.config(text=f"Tesseract 경로 임시 설정: {filepath}")
 
-    def save_settings(self, initial=False):
+    def _start_background_init(self):
+        """창이 그려진 뒤 Tesseract 탐색, 번역 클라이언트 생성, 모델 미리 로드를 백그라운드에서 시작합니다."""
+        self.status_label.config(text="엔진 준비 중...", foreground="gray")
+        settings = (self.tesseract_path_var.get(), self.api_key_var.get(),
+                    self.translator_backend_var.get(), self.source_ocr_lang.get())
+        threading.Thread(target=self._initialize_engines, args=settings, daemon=True).start()
+
+    def _initialize_engines(self, tess_path, deepl_key, backend, ocr_lang):
+        """(백그라운드 스레드) 엔진을 만들고 OCR 경로 모듈과 언어 모델을 미리 불러옵니다."""
+        import ocr_engine
+        try:
+            found = ocr_engine.find_tesseract_cmd(tess_path)
+            if found and not tess_path:
+                tess_path = found
+                self.master.after(0, lambda: self.tesseract_path_var.set(found))
+            self._apply_engine_settings(tess_path, deepl_key, backend)
+        except ValueError:
+            self.master.after(0, lambda: self.status_label.config(text="번역 엔진 설정 오류! DeepL API 키 또는 엔진 선택 확인 필요.", foreground="red"))
+        except Exception:
+            self.master.after(0, lambda: self.status_label.config(text="설정 적용 오류.", foreground="red"))
+        else:
+            if self.ocr_engine.warm:
+                self.master.after(0, lambda: self.status_label.config(text="설정 불러오기 완료.", foreground="gray"))
+            else:
+                # 빠른 엔진(tesserocr/libtesseract)을 찾지 못하면 캡처마다 tesseract.exe를 실행하므로 알려 줍니다.
+                self.master.after(0, lambda: self.status_label.config(
+                    text="설정 불러오기 완료. (느린 OCR 모드: libtesseract를 찾지 못해 캡처마다 tesseract.exe 실행)",
+                    foreground="orange"))
+            # 첫 캡처에서 쓰는 모듈과 OCR 언어 모델을 미리 불러 둡니다.
+            import recognize  # noqa: F401
+            import screen_capture  # noqa: F401
+            from PIL import ImageTk  # noqa: F401
+            self._warm_up_ocr(ocr_lang)
+        finally:
+            self.engines_ready.set()
+
+    def _apply_engine_settings(self, tess_path, deepl_key, backend):
+        """OCR 엔진과 번역 엔진(라우터)을 설정에 맞게 만듭니다. 번역 엔진을 쓸 수 없으면 ValueError."""
+        import pytesseract
+        import ocr_engine
+        from tiled_ocr import TiledOcr
+        with self._engine_lock:
+            if tess_path:
+                pytesseract.pytesseract.tesseract_cmd = tess_path
+            
+            # 경로가 바뀌었을 수 있으므로 기존 워커를 정리하고 엔진을 새로 만듭니다.
+            if self.ocr_engine is not None:
+                self.ocr_engine.close()
+            self.ocr_engine = ocr_engine.create_engine(tess_path)
+            if self.tiled_ocr is not None:
+                self.tiled_ocr.close()
+            self.tiled_ocr = TiledOcr(tess_path)
+            # 다른 엔진으로 인식한 이전 캡처 결과는 재사용하지 않습니다.
+            if self.region_diff is not None:
+                self.region_diff.forget()
+            
+            # 번역 설정이 그대로면 기존 클라이언트(유지 중인 연결, 사용량 정보)를 계속 씁니다.
+            translator_settings = (backend, deepl_key, config.get_http_translator_url(), config.get_deepl_char_budget())
+            if self.translator is None or translator_settings != self._translator_settings:
+                self.api_check = False
+                if self.translator is not None:
+                    self.translator.close()
+                    self.translator = None
+                self.translator = translators.create_router(*translator_settings)
+                self._translator_settings = translator_settings
+                # 첫 번역 전에 연결(TLS)을 미리 맺어 둡니다.
+                threading.Thread(target=self.translator.warm_up, daemon=True).start()
+            self.api_check = True
+
+    def save_settings(self):
         """현재 Entry 위젯의 내용을 설정 파일에 저장하고 적용합니다."""
         tess_path = self.tesseract_path_var.get()
         deepl_key = self.api_key_var.get()
+        backend = self.translator_backend_var.get()
         
-        current_config = {
+        # config.json에만 있는 선택 항목(east_model_path 등)은 그대로 유지합니다.
+        current_config = dict(config.CONFIG)
+        current_config.update({
             'tesseract_path': tess_path,
-            'deepl_api_key': deepl_key
-        }
+            'deepl_api_key': deepl_key,
+            'translator_backend': backend,
+            'preprocess_presets': self.preprocess_presets
+        })
         
-        if not initial:
-            config.save_config(current_config)
+        config.save_config(current_config)
         
-        # 설정 적용: pytesseract 경로와 DeepL Translator 인스턴스 업데이트
+        # 설정 적용: OCR 엔진과 번역 엔진(라우터) 업데이트
         try:
-            if tess_path:
-                pytesseract.pytesseract.tesseract_cmd = tess_path
-            
-            if deepl_key:
-                self.translator = deepl.Translator(deepl_key)
-                self.api_check = True
-            else:
-                 self.api_check = False
-                 raise ValueError("DeepL API 키가 설정되지 않았습니다.")
-                 
-            if not initial:
-                messagebox.showinfo("설정 저장 완료", "설정이 성공적으로 저장 및 적용되었습니다.")
-                self.status_label.config(text="설정 저장 완료. 감지 시작 가능.", foreground="black")
-            else:
-                self.status_label.config(text="설정 불러오기 완료.", foreground="gray")
-
+            self._apply_engine_settings(tess_path, deepl_key, backend)
+            messagebox.showinfo("설정 저장 완료", "설정이 성공적으로 저장 및 적용되었습니다.")
+            self.status_label.config(text="설정 저장 완료. 감지 시작 가능.", foreground="black")
 
         except ValueError as e:
-            if not initial:
-                messagebox.showerror("DeepL 오류", str(e))
-            self.status_label.config(text="DeepL API 키 오류! 확인 필요.", foreground="red")
+            messagebox.showerror("번역 엔진 오류", str(e))
+            self.status_label.config(text="번역 엔진 설정 오류! DeepL API 키 또는 엔진 선택 확인 필요.", foreground="red")
         except Exception as e:
-            if not initial:
-                messagebox.showerror("오류", f"설정 적용 중 오류 발생: {e}")
+            messagebox.showerror("오류", f"설정 적용 중 오류 발생: {e}")
             self.status_label.config(text="설정 적용 오류.", foreground="red")
             
     def toggle_listening(self):
         # 감지 시작 전 필수 설정값 확인
         hotkey = self.hotkey_var.get()
         tess_path = self.tesseract_path_var.get()
-        deepl_key = self.api_key_var.get()
         
-        if not tess_path or not deepl_key or not self.api_check:
-            messagebox.showerror("설정 필수", "Tesseract 경로와 DeepL API 키를 입력하고 '설정 저장' 버튼을 눌러주세요.")
+        if not self.engines_ready.is_set():
+            messagebox.showinfo("준비 중", "엔진을 준비하고 있습니다. 잠시 후 다시 시도하세요.")
+            return
+        
+        if not tess_path or not self.api_check:
+            messagebox.showerror("설정 필수", "Tesseract 경로와 번역 엔진(DeepL API 키 등)을 설정하고 '설정 저장' 버튼을 눌러주세요.")
             return
 
+        import keyboard
+        
         # 기존 toggle_listening 로직
         if self.is_running:
             try:
+                self.stop_watch()
                 keyboard.unhook_all()
+                self.hide_screen_overlay()
                 self.is_running = False
                 self.btn_start.config(text="설정 적용 및 감지 시작", style='TButton')
                 self.status_label.config(text="대기 중...", foreground="gray")
@@ -468,124 +783,518 @@ class TranslatorApp(tk.Frame):
             try:
                 keyboard.unhook_all()
                 keyboard.add_hotkey(hotkey, self.run_translation_process)
+                # 화면 오버레이는 클릭이 통과하므로 Esc로 숨깁니다. (키 입력은 다른 창에도 그대로 전달)
+                keyboard.add_hotkey('esc', lambda: self.master.after(0, self.hide_screen_overlay))
                 self.is_running = True
+                # 첫 캡처 전에 OCR 언어 모델을 미리 로드 (백그라운드)
+                threading.Thread(target=self._warm_up_ocr, args=(self.source_ocr_lang.get(),), daemon=True).start()
                 self.btn_start.config(text="감지 중지", style='Accent.TButton')
                 self.status_label.config(text=f"단축키 감지 중: {hotkey}", foreground="green")
             except Exception as e:
                 messagebox.showerror("오류", f"단축키 등록 중 오류 발생. 단축키({hotkey})를 확인하세요. (예: ctrl+alt+t)")
 
+    def _warm_up_ocr(self, lang):
+        """OCR 워커를 미리 띄워 첫 캡처의 모델 로드 지연을 없앱니다."""
+        try:
+            if lang.split(':')[0] == 'auto':
+                import script_detect
+                script_detect.warm_up(self.ocr_engine, lang)
+            else:
+                self.ocr_engine.warm_up(lang)
+        except Exception:
+            # 실패하면 첫 캡처에서 다시 시도되고, 그때 오류가 표시됩니다.
+            pass
+
     def run_translation_process(self):
         if not self.is_running:
             return
 
         img = None
         self.master.after(0, lambda: self.status_label.config(text="캡처/번역 처리 중...", foreground="blue"))
+        self._hide_overlay_for_capture()
 
         if self.capture_mode.get() == "full":
-            img = ImageGrab.grab()
-            threading.Thread(target=self.process_image, args=(img,)).start()
+            # 파이프라인에 넣기만 하므로 별도 스레드를 만들지 않습니다.
+            # 마우스 커서가 있는 모니터를 캡처합니다. (알 수 없으면 주 모니터)
+            self.process_image(capture_screen(monitors.cursor_monitor_bbox()))
+        elif self.capture_mode.get() == "watch":
+            # 감시 중에 단축키를 다시 누르면 감시를 종료합니다.
+            if self.region_watcher is not None and self.region_watcher.is_running:
+                self.master.after(0, self.stop_watch)
+            else:
+                self.master.after(0, lambda: SnippingTool(self.master, self.process_image, region_callback=self.start_watch))
         else:
             SnippingTool(self.master, self.process_image)
 
+    def start_watch(self, bbox):
+        """선택한 영역을 고정하고 화면 변화 감시를 시작합니다."""
+        from region_watcher import RegionWatcher
+        self.stop_watch()
+        try:
+            fps = float(self.watch_fps.get())
+        except (tk.TclError, ValueError):
+            fps = 2.0
+        
+        self.region_watcher = RegionWatcher(bbox, self.process_image_and_wait, fps=fps, on_error=self._on_watch_error)
+        self.region_watcher.start()
+        self.status_label.config(text=f"영역 감시 중: {bbox} (단축키를 다시 누르면 종료)", foreground="green")
+
+    def stop_watch(self):
+        """영역 감시를 종료합니다."""
+        if self.region_watcher is not None:
+            self.region_watcher.stop()
+            self.region_watcher = None
+            self.status_label.config(text=f"영역 감시 종료. 단축키 감지 중: {self.hotkey_var.get()}", foreground="green")
+
+    def _on_watch_error(self, error):
+        error_message = str(error)
+        self.master.after(0, lambda: self.status_label.config(text=f"영역 감시 오류: {error_message}", foreground="red"))
+
 
     def process_image(self, img):
         """
-        이미지에서 OCR 데이터를 줄 단위로 그룹화하고 DeepL로 번역합니다.
-        OCR 언어 코드를 설정 값에서 가져와 사용하도록 수정되었습니다.
+        캡처 이미지를 OCR → 번역 파이프라인에 넣습니다.
+        아직 처리 중인 이전 캡처가 있으면 새 캡처가 그것을 대체합니다.
         """
         if img is None: 
             self.master.after(0, lambda: self.status_label.config(text="대기 중...", foreground="gray"))
-            return
+            return None
 
-        ocr_data_for_context = None
-        translated = ""
+        from tiled_ocr import TILE_HEIGHT
         
-        # 설정된 OCR 언어 코드를 가져옵니다.
-        ocr_lang_code = self.source_ocr_lang.get() 
+        # 설정된 OCR/대상 언어 코드를 캡처 시점에 고정합니다.
+        ocr_lang = self.source_ocr_lang.get()
         
-        try:
-            # 1. OCR (위치 정보가 포함된 데이터프레임 받기)
-            data = pytesseract.image_to_data(img, lang=ocr_lang_code, output_type=pytesseract.Output.DATAFRAME)
-            
-            words = data[data.level == 5].dropna(subset=['text']) 
-            
-            line_groups = words.groupby(['page_num', 'block_num', 'par_num', 'line_num'])
-            
-            full_ocr_text = ""
-            line_data_list = [] 
-            
-            for name, group in line_groups:
-                line_text = " ".join(group['text'].tolist()) 
-                
-                if line_text.strip():
-                    full_ocr_text += line_text + "\n" 
-                    
-                    # 줄 전체의 바운딩 박스 계산:
-                    x1 = group['left'].min()
-                    y1 = group['top'].min()
-                    x2 = (group['left'] + group['width']).max()
-                    y2 = (group['top'] + group['height']).max()
-                    
-                    line_data_list.append({
-                        'text': line_text,
-                        'left': x1,
-                        'top': y1,
-                        'width': x2 - x1,
-                        'height': y2 - y1
-                    })
-
-            ocr_data_for_context = pd.DataFrame(line_data_list)
-            
-            if not full_ocr_text.strip():
-                 self.master.after(0, lambda: self.show_context_window(img, None, f"번역할 텍스트를 찾지 못했습니다. (OCR 언어: {ocr_lang_code})"))
-                 return
-            
-            # 2. 번역 (self.translator 사용)
-            result = self.translator.translate_text(
-                text=full_ocr_text.strip(), 
-                target_lang=self.target_lang.get()
+        # 전체 화면처럼 큰 캡처는 타일로 나눠 OCR과 번역을 겹쳐 진행합니다.
+        # (언어 자동 감지는 글자 영역 단위로 이미 병렬 처리하므로 타일로 나누지 않습니다.)
+        tiled = (self.capture_mode.get() == "full" and img.size[1] >= TILE_HEIGHT * 2
+                 and ocr_lang.split(':')[0] != 'auto')
+        
+        # 캡처 시간은 submit 전에 넘겨야 OCR 작업 스레드가 통계를 낼 때 빠지지 않습니다.
+        timings = {'capture': img.info['capture_seconds']} if 'capture_seconds' in img.info else None
+        return self.pipeline.submit(img, ocr_lang, self.target_lang.get(),
+                                    tiled=tiled,
+                                    detect_text=self.detect_text_regions.get(),
+                                    preset=self.preprocess_presets[self.capture_mode.get()],
+                                    timings=timings)
+
+    def process_image_and_wait(self, img):
+        """영역 감시용: 처리가 끝날 때까지 기다려 감시 스레드가 프레임을 쌓지 않게 합니다."""
+        job = self.process_image(img)
+        if job is not None:
+            job.done.wait()
+
+    def _ocr_stage(self, job):
+        """1. OCR (미리 로드된 엔진으로 위치 정보를 받아 줄 단위(OcrLine)로 묶기)"""
+        # 같은 픽셀을 같은 설정으로 OCR 한 적이 있으면 저장된 줄 목록을 그대로 씁니다.
+        # (전처리는 프리셋에 따라 결정되므로 전처리 전 캡처 이미지 + 프리셋으로 키를 만듭니다.)
+        min_conf, retry_conf = config.get_ocr_min_conf(), config.get_ocr_retry_conf()
+        cache_key = self.ocr_cache.make_key(job.img, self.ocr_engine.name, job.ocr_lang, job.preset,
+                                            job.detect_text, config.get_east_model_path() if job.detect_text else '',
+                                            min_conf, retry_conf)
+        cached = self.ocr_cache.get(cache_key)
+        if cached is not None:
+            job.lines = cached
+            return
+        
+        if job.tiled:
+            self._stream_tiles(job, min_conf, retry_conf)
+            # 중간에 취소된 작업은 일부 타일만 인식했으므로 저장하지 않습니다.
+            if not self.pipeline.is_stale(job) and job.lines is not None:
+                self.ocr_cache.put(cache_key, job.lines)
+            return
+        
+        from recognize import recognize
+        
+        def ocr(img):
+            # 영역 차분은 바뀐 띠마다 따로 인식하므로 띠별 단계 시간을 더해 둡니다.
+            band_timings = {}
+            lines = recognize(self.ocr_engine, img, job.ocr_lang,
+                              preset=job.preset,
+                              detect_text=job.detect_text,
+                              east_model_path=config.get_east_model_path(),
+                              timings=band_timings,
+                              min_conf=min_conf,
+                              retry_conf=retry_conf)
+            for name, seconds in band_timings.items():
+                job.timings[name] = job.timings.get(name, 0.0) + seconds
+            return lines
+        
+        # 같은 위치를 같은 설정으로 다시 캡처하면 바뀐 띠만 다시 인식합니다.
+        # (바뀌지 않은 줄은 원문이 같으므로 번역도 번역 메모리에서 바로 채워집니다.)
+        if self.region_diff is None:
+            from region_diff import RegionDiff
+            self.region_diff = RegionDiff()
+        key = (job.img.info.get('bbox'), job.ocr_lang, job.preset, job.detect_text, min_conf, retry_conf)
+        job.lines = self.region_diff.recognize(key, job.img, ocr)
+        self.ocr_cache.put(cache_key, job.lines)
+
+    def _stream_tiles(self, job, min_conf=0, retry_conf=0):
+        """
+        타일을 여러 프로세스에서 병렬로 OCR 하고, 인식이 끝난 타일의 줄부터 바로 번역해
+        상세 창을 점진적으로 채웁니다.
+        """
+        import layout
+        pairs = []
+        tiles = self.tiled_ocr.iter_lines(job.img, job.ocr_lang, lambda: self.pipeline.is_stale(job),
+                                          job.detect_text, config.get_east_model_path(), job.preset,
+                                          min_conf, retry_conf)
+        for index, lines in tiles:
+            if not lines:
+                continue
+            translated = translation.translate_lines(
+                self.translator,
+                self.translation_cache,
+                [line.text for line in lines],
+                job.ocr_lang,
+                job.target_lang
             )
-            translated = result.text
             
-            # 3. 결과 출력
-            self.master.after(0, lambda: self.show_context_window(img, ocr_data_for_context, translated))
+            # 오버레이의 Y축 배치가 위에서 아래로 진행되므로 화면 위치 순서로 정렬합니다.
+            pairs.extend(zip(lines, translated))
+            pairs.sort(key=lambda pair: (pair[0].top, pair[0].left))
+            lines_so_far = [pair[0] for pair in pairs]
+            translated_so_far = [pair[1] for pair in pairs]
             
-        except deepl.exceptions.DeepLException as e:
-            error_message = str(e)
-            self.master.after(0, lambda msg=error_message: self.show_context_window(img, None, f"DeepL API 오류: {msg}"))
-            
-        except pytesseract.TesseractError as e:
-             error_message = str(e)
-             tess_path_current = self.tesseract_path_var.get()
-             self.master.after(0, lambda msg=error_message: self.show_context_window(img, None, f"Tesseract OCR 오류: {msg}. OCR 언어({ocr_lang_code}) 또는 경로({tess_path_current})를 확인하세요."))
-            
-        except Exception as e:
-            error_message = str(e)
-            self.master.after(0, lambda msg=error_message: self.show_context_window(img, None, f"OCR/시스템 오류: {type(e).__name__}: {msg}"))
+            if self.pipeline.is_stale(job):
+                return
+            if 'first' not in job.timings:
+                job.timings['first'] = time.perf_counter() - job.submitted_at
+            boxes = layout.layout_lines(lines_so_far, translated_so_far)
+            self.master.after(0, lambda l=lines_so_far, t=translated_so_far, b=boxes: self.show_context_window(job.img, l, t, b))
         
-        finally:
-             self.master.after(0, lambda: self.status_label.config(text=f"단축키 감지 중: {self.hotkey_var.get()}", foreground="green") if self.is_running else self.status_label.config(text="대기 중...", foreground="gray"))
+        job.lines = [pair[0] for pair in pairs]
+        job.translated = [pair[1] for pair in pairs]
+
+    def _translate_stage(self, job):
+        """2. 번역 (캐시에 없는 줄만 목록으로 묶어 한 번에 전송, 결과는 줄과 1:1 대응)"""
+        if job.translated is not None:
+            # 타일 모드에서는 OCR 단계에서 이미 번역이 끝났습니다.
+            return
+        import script_detect
+        if script_detect.is_auto(job.ocr_lang):
+            # 언어 자동 감지: 줄마다 감지된 언어를 원본 언어로 번역합니다.
+            job.translated = translation.translate_lines_by_lang(
+                self.translator,
+                self.translation_cache,
+                [line.text for line in job.lines],
+                [script_detect.line_lang(line, job.ocr_lang) for line in job.lines],
+                job.target_lang
+            )
+            return
+        job.translated = translation.translate_lines(
+            self.translator,
+            self.translation_cache,
+            [line.text for line in job.lines],
+            job.ocr_lang,
+            job.target_lang
+        )
 
-    def show_context_window(self, img, ocr_data, translated_text):
-        """새로운 상세 창을 띄웁니다."""
-        for child in self.master.winfo_children():
-            if isinstance(child, ContextWindow):
-                child.destroy()
+    def _on_pipeline_result(self, job):
+        """3. 결과 출력 (작업 스레드에서 호출되므로 UI 스레드로 넘깁니다.)"""
+        if job.lines:
+            # 번역 박스 배치(글꼴 크기 탐색, 겹침 해소)는 여기서 계산하고 UI 스레드는 놓기만 합니다.
+            import layout
+            start = time.perf_counter()
+            job.layout = layout.layout_lines(job.lines, job.translated)
+            job.timings['layout'] = time.perf_counter() - start
+        self.tracer.record_timings(job.trace_id, job.timings)
+        if not job.lines:
+            message = f"번역할 텍스트를 찾지 못했습니다. (OCR 언어: {job.ocr_lang})"
+            self.master.after(0, lambda: self._render_result(job, None, message))
+        else:
+            self.master.after(0, lambda: self._render_result(job, job.lines, job.translated))
+            if self.history is not None:
+                self.history.record(job.img, job.lines, job.translated, job.layout, job.timings,
+                                    job.ocr_lang, job.target_lang)
+        self._show_idle_status(format_timings(job.timings))
+
+    def _render_result(self, job, ocr_data, translated_text):
+        """상세 창 표시(렌더링) 시간도 같은 캡처의 추적 기록에 남깁니다."""
+        with self.tracer.span(job.trace_id, 'render'):
+            self.show_context_window(job.img, ocr_data, translated_text, job.layout).update_idletasks()
+
+    def _on_pipeline_error(self, job, e):
+        """단계별 예외를 사용자 메시지로 바꿔 상세 창에 표시합니다."""
+        import pytesseract
+        import ocr_engine
+        error_message = str(e)
+        if isinstance(e, translators.TranslatorError):
+            message = f"번역 오류: {error_message}"
+        elif isinstance(e, pytesseract.TesseractError):
+            tess_path_current = self.tesseract_path_var.get()
+            message = f"Tesseract OCR 오류: {error_message}. OCR 언어({job.ocr_lang}) 또는 경로({tess_path_current})를 확인하세요."
+        elif isinstance(e, ocr_engine.OcrEngineError):
+            message = f"Tesseract OCR 오류: {error_message}. OCR 언어({job.ocr_lang})를 확인하세요."
+        else:
+            message = f"OCR/시스템 오류: {type(e).__name__}: {error_message}"
+        
+        self.tracer.record_timings(job.trace_id, job.timings)
+        self.master.after(0, lambda: self.show_context_window(job.img, None, message))
+        self._show_idle_status(format_timings(job.timings))
+
+    def _show_idle_status(self, detail=""):
+        """처리가 끝난 뒤 상태 표시줄을 감지 상태로 되돌리고 단계별 시간/캐시 적중률을 덧붙입니다."""
+        backend = getattr(self.translator, 'last_backend', None)
+        backend_text = f"번역 엔진 {backend}" if backend else ""
+        suffix = " | ".join(part for part in (detail, backend_text, self.translation_cache.stats_text(),
+                                              self.ocr_cache.stats_text()) if part)
+        self.master.after(0, lambda: self.status_label.config(text=f"단축키 감지 중: {self.hotkey_var.get()} | {suffix}", foreground="green") if self.is_running else self.status_label.config(text=f"대기 중... | {suffix}", foreground="gray"))
+
+    def show_context_window(self, img, ocr_data, translated_text, boxes=None):
+        """
+        결과를 표시하고 표시한 창을 반환합니다. 번역 결과는 화면 오버레이에, 오류/안내 메시지는 상세 창에 표시하며
+        열려 있는 창이 있으면 새로 만들지 않고 내용만 바꿉니다.
+        boxes는 작업 스레드에서 계산한 번역 박스 배치입니다. (UI 스레드는 놓기만 함)
+        """
+        if self._can_use_screen_overlay(ocr_data, translated_text):
+            if boxes is None:
+                import layout
+                boxes = layout.layout_lines(ocr_data, translated_text)
+            if self.screen_overlay is None:
+                self.screen_overlay = ScreenOverlay(self.master)
+            bbox = img.info.get('bbox') or (0, 0, img.size[0], img.size[1])
+            self.screen_overlay.show_result(bbox, boxes)
+            return self.screen_overlay
         
-        ContextWindow(self.master, img, ocr_data, translated_text)
+        self.hide_screen_overlay()
+        if self.context_window is not None and self.context_window.winfo_exists():
+            self.context_window.update_result(img, ocr_data, translated_text, boxes)
+            self.context_window.lift()
+            return self.context_window
+        
+        self.context_window = ContextWindow(self.master, img, ocr_data, translated_text, boxes)
+        return self.context_window
+
+    def _can_use_screen_overlay(self, ocr_data, translated_text):
+        if not self.use_screen_overlay.get() or not ocr_data or isinstance(translated_text, str):
+            return False
+        # 영역 감시는 오버레이가 다음 캡처에 찍히면 화면 변화로 보이므로, 캡처 제외가 되는 경우에만 씁니다.
+        if self.capture_mode.get() == "watch":
+            return self.screen_overlay is not None and self.screen_overlay.excluded_from_capture
+        return True
+
+    def hide_screen_overlay(self):
+        if self.screen_overlay is not None:
+            self.screen_overlay.hide()
+
+    def _hide_overlay_for_capture(self):
+        """
+        (단축키 스레드) 오버레이가 캡처에 찍히지 않도록, 캡처 제외가 안 되는 환경에서는
+        UI 스레드에서 창을 숨기고 화면이 다시 그려질 때까지 기다립니다.
+        """
+        overlay = self.screen_overlay
+        if overlay is None or overlay.excluded_from_capture:
+            return
+        hidden = threading.Event()
+        
+        def hide():
+            if overlay.is_visible:
+                overlay.hide()
+                overlay.update_idletasks()
+            hidden.set()
+        
+        self.master.after(0, hide)
+        if hidden.wait(OVERLAY_HIDE_TIMEOUT):
+            time.sleep(OVERLAY_REPAINT_SECONDS)
+
+    def show_stats_window(self):
+        """단계별 처리 시간 통계 창을 띄웁니다. (이미 열려 있으면 앞으로 가져옴)"""
+        if self.stats_window is not None and self.stats_window.winfo_exists():
+            self.stats_window.lift()
+            return
+        self.stats_window = StatsWindow(self.master, self.tracer)
+
+    def show_history_window(self):
+        """번역 기록 창을 띄웁니다. (이미 열려 있으면 앞으로 가져옴)"""
+        if self.history is None:
+            messagebox.showinfo("번역 기록", "번역 기록이 꺼져 있습니다. (config.json의 history_enabled)")
+            return
+        if self.history_window is not None and self.history_window.winfo_exists():
+            self.history_window.lift()
+            return
+        self.history_window = HistoryWindow(self.master, self.history)
 
     def on_closing(self):
-        """프로그램 종료 시 설정을 저장하고 창을 닫습니다."""
-        self.save_settings(initial=True)
+        """프로그램 종료 시 엔진/캐시를 정리하고 창을 닫습니다."""
+        self.stop_watch()
+        self.pipeline.close()
+        if self.tiled_ocr is not None:
+            self.tiled_ocr.close()
+        self.translation_cache.close()
+        self.ocr_cache.close()
+        if self.history is not None:
+            self.history.close()
+        self.tracer.close()
+        if self.translator is not None:
+            self.translator.close()
+        if self.ocr_engine is not None:
+            self.ocr_engine.close()
         self.master.destroy() 
 
 
+# -------------------------------------------------------------
+# StatsWindow 클래스 (단계별 처리 시간 통계)
+# -------------------------------------------------------------
+class StatsWindow(tk.Toplevel):
+    REFRESH_MS = 1000
+
+    def __init__(self, master, tracer):
+        super().__init__(master)
+        self.title("단계별 처리 시간 (최근 캡처 기준)")
+        self.geometry("460x340")
+        self.tracer = tracer
+
+        columns = ('count', 'p50', 'p95', 'p99')
+        self.tree = ttk.Treeview(self, columns=columns, height=10)
+        self.tree.heading('#0', text="단계")
+        self.tree.column('#0', width=110)
+        for column, title in zip(columns, ("건수", "p50 (ms)", "p95 (ms)", "p99 (ms)")):
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=80, anchor='e')
+        self.tree.pack(fill='both', expand=True, padx=10, pady=(10, 5))
+
+        bottom = ttk.Frame(self)
+        bottom.pack(fill='x', padx=10, pady=(0, 10))
+        self.enabled_var = tk.BooleanVar(value=tracer.enabled)
+        ttk.Checkbutton(bottom, text="추적 사용", variable=self.enabled_var,
+                        command=lambda: setattr(self.tracer, 'enabled', self.enabled_var.get())).pack(side='left')
+        ttk.Button(bottom, text="초기화", command=self.tracer.reset).pack(side='right')
+        trace_file = tracer.trace_file or "(JSONL 기록 꺼짐: config.json의 trace_file 설정)"
+        ttk.Label(self, text=f"기록 파일: {trace_file}", foreground="gray").pack(anchor='w', padx=10, pady=(0, 5))
+
+        self.refresh()
+
+    def refresh(self):
+        """주기적으로 백분위수를 다시 계산해 표를 갱신합니다."""
+        if not self.winfo_exists():
+            return
+        summary = self.tracer.summary()
+        self.tree.delete(*self.tree.get_children())
+        for stage in STAGES:
+            if stage in summary:
+                count, p50, p95, p99 = summary[stage]
+                self.tree.insert('', 'end', text=stage,
+                                 values=(count, f"{p50 * 1000:.1f}", f"{p95 * 1000:.1f}", f"{p99 * 1000:.1f}"))
+        self.after(self.REFRESH_MS, self.refresh)
+
+
+# -------------------------------------------------------------
+# HistoryWindow 클래스 (번역 기록 검색/내보내기)
+# -------------------------------------------------------------
+class HistoryWindow(tk.Toplevel):
+    SEARCH_DEBOUNCE_MS = 250
+    PREVIEW_CHARS = 60
+
+    def __init__(self, master, history):
+        super().__init__(master)
+        self.title("번역 기록")
+        self.geometry("900x560")
+        self.history = history
+        self._search_job = None
+        self.thumbnail_photo = None
+
+        top = ttk.Frame(self)
+        top.pack(fill='x', padx=10, pady=(10, 5))
+        ttk.Label(top, text="검색:").pack(side='left')
+        self.query_var = tk.StringVar()
+        entry = ttk.Entry(top, textvariable=self.query_var)
+        entry.pack(side='left', fill='x', expand=True, padx=5)
+        entry.focus_set()
+        self.query_var.trace_add("write", lambda *args: self._schedule_search())
+        ttk.Button(top, text="CSV 내보내기", command=lambda: self.export('.csv')).pack(side='left', padx=(5, 0))
+        ttk.Button(top, text="JSONL 내보내기", command=lambda: self.export('.jsonl')).pack(side='left', padx=(5, 0))
+
+        body = ttk.PanedWindow(self, orient='horizontal')
+        body.pack(fill='both', expand=True, padx=10, pady=5)
+
+        columns = ('time', 'source', 'translated')
+        self.tree = ttk.Treeview(body, columns=columns, show='headings', selectmode='browse')
+        for column, title, width in zip(columns, ("시간", "원문", "번역"), (130, 220, 220)):
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width)
+        self.tree.bind('<<TreeviewSelect>>', lambda e: self.show_selected())
+        body.add(self.tree, weight=3)
+
+        detail = ttk.Frame(body)
+        self.thumbnail_label = ttk.Label(detail)
+        self.thumbnail_label.pack(anchor='n', pady=(0, 5))
+        self.detail_text = scrolledtext.ScrolledText(detail, wrap=tk.WORD, width=40, font=("Malgun Gothic", 9))
+        self.detail_text.pack(fill='both', expand=True)
+        body.add(detail, weight=2)
+
+        self.status = ttk.Label(self, text="", foreground="gray")
+        self.status.pack(anchor='w', padx=10, pady=(0, 10))
+
+        self.search()
+
+    def _schedule_search(self):
+        """입력이 멈춘 뒤 한 번만 검색합니다."""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DEBOUNCE_MS, self.search)
+
+    def _preview(self, text):
+        text = " / ".join(text.splitlines())
+        return text if len(text) <= self.PREVIEW_CHARS else text[:self.PREVIEW_CHARS] + "…"
+
+    def search(self):
+        self._search_job = None
+        start = time.perf_counter()
+        rows = self.history.search(self.query_var.get())
+        elapsed = time.perf_counter() - start
+        self.tree.delete(*self.tree.get_children())
+        for capture_id, created, ocr_lang, target_lang, source_text, translated_text in rows:
+            self.tree.insert('', 'end', iid=str(capture_id),
+                             values=(time.strftime('%m-%d %H:%M:%S', time.localtime(created)),
+                                     self._preview(source_text), self._preview(translated_text)))
+        self.status.config(text=f"{len(rows)}건 / 전체 {self.history.count()}건 ({elapsed * 1000:.0f}ms)")
+
+    def show_selected(self):
+        selection = self.tree.selection()
+        if not selection:
+            return
+        item = self.history.get(int(selection[0]))
+        if item is None:
+            return
+        if item['thumbnail']:
+            import io
+            from PIL import Image, ImageTk
+            self.thumbnail_photo = ImageTk.PhotoImage(Image.open(io.BytesIO(item['thumbnail'])))
+            self.thumbnail_label.config(image=self.thumbnail_photo)
+        else:
+            self.thumbnail_label.config(image='')
+        lines = [f"{line['text']}\n→ {line['translated']}" for line in item['lines']]
+        timings = format_timings(item['timings'])
+        self.detail_text.config(state=tk.NORMAL)
+        self.detail_text.delete('1.0', tk.END)
+        self.detail_text.insert(tk.END, f"[{item['ocr_lang']} → {item['target_lang']}] {timings}\n\n" + "\n\n".join(lines))
+        self.detail_text.config(state=tk.DISABLED)
+
+    def export(self, extension):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=extension,
+                                            filetypes=[(extension[1:].upper(), '*' + extension)])
+        if not path:
+            return
+        try:
+            count = self.history.export(path, self.query_var.get())
+        except OSError as e:
+            messagebox.showerror("오류", f"내보내기 실패: {e}", parent=self)
+            return
+        self.status.config(text=f"{count}건을 내보냈습니다: {path}")
+
+
 # SnippingTool 클래스 (이전 코드와 동일)
 class SnippingTool(tk.Toplevel):
-    def __init__(self, parent, callback):
+    def __init__(self, parent, callback, region_callback=None):
         super().__init__(parent)
         self.callback = callback
-        self.attributes('-fullscreen', True)
+        # region_callback이 주어지면 캡처하지 않고 선택 영역(bbox)만 넘깁니다.
+        self.region_callback = region_callback
+        # -fullscreen은 주 모니터만 덮으므로, 테두리 없는 창을 가상 데스크톱(모든 모니터) 전체로 펼칩니다.
+        bounds = monitors.virtual_bounds() or (0, 0, self.winfo_screenwidth(), self.winfo_screenheight())
+        self.overrideredirect(True)
+        self.geometry(f"{bounds[2]}x{bounds[3]}+{bounds[0]}+{bounds[1]}")
         self.attributes('-alpha', 0.3)
         self.configure(bg='black')
         self.attributes('-topmost', True)
@@ -599,10 +1308,13 @@ class SnippingTool(tk.Toplevel):
         self.canvas.bind("<ButtonRelease-1>", self.on_button_release)
         self.bind("<Escape>", lambda e: self.destroy())
         self.parent = parent
+        # 테두리 없는 창은 자동으로 키보드 포커스를 받지 않습니다. (Esc 취소용)
+        self.focus_force()
         
     def on_button_press(self, event):
         self.start_x = event.x
         self.start_y = event.y
+        self.start_root = (event.x_root, event.y_root)
         self.rect = self.canvas.create_rectangle(self.start_x, self.start_y, 1, 1, outline='red', width=2)
 
     def on_move_press(self, event):
@@ -610,24 +1322,42 @@ class SnippingTool(tk.Toplevel):
         self.canvas.coords(self.rect, self.start_x, self.start_y, cur_x, cur_y)
 
     def on_button_release(self, event):
-        end_x, end_y = (event.x, event.y)
+        # 캔버스 좌표가 아닌 화면 좌표를 쓰고, 캡처가 쓰는 물리 픽셀 좌표로 바꿉니다.
+        # (보조 모니터는 음수 좌표일 수 있고, DPI 배율이 모니터마다 다를 수 있음)
+        hwnd = monitors.top_level_hwnd(self) if monitors.IS_WINDOWS else None
+        start_x, start_y = monitors.logical_to_physical(hwnd, *self.start_root)
+        end_x, end_y = monitors.logical_to_physical(hwnd, event.x_root, event.y_root)
         self.destroy() 
         self.parent.deiconify() # 메인 창 다시 표시
         
-        x1 = min(self.start_x, end_x)
-        y1 = min(self.start_y, end_y)
-        x2 = max(self.start_x, end_x)
-        y2 = max(self.start_y, end_y)
+        x1 = min(start_x, end_x)
+        y1 = min(start_y, end_y)
+        x2 = max(start_x, end_x)
+        y2 = max(start_y, end_y)
         
         if (x2 - x1) < 10 or (y2 - y1) < 10:
             return
+        
+        if self.region_callback is not None:
+            self.region_callback((x1, y1, x2, y2))
+            return
             
-        img = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+        img = capture_screen(bbox=(x1, y1, x2, y2))
         
-        threading.Thread(target=self.callback, args=(img,)).start()
+        self.callback(img)
 
 
 if __name__ == "__main__":
+    # 패키징된 exe에서 타일 OCR 프로세스 풀이 다시 GUI를 띄우지 않도록 합니다.
+    multiprocessing.freeze_support()
+    
+    # "batch <폴더>" 인자로 실행하면 GUI 없이 일괄 처리만 합니다.
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        import batch
+        sys.exit(batch.main(sys.argv[2:]))
+    
+    # Tk 창을 만들기 전에 모니터별 DPI 인식을 켜야 선택 좌표와 캡처 좌표가 어긋나지 않습니다.
+    monitors.enable_dpi_awareness()
     root = tk.Tk()
     style = ttk.Style(root)
     try:
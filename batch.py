@@ -0,0 +1,195 @@
+"""
+헤드리스 일괄 처리: 스크린샷 폴더를 Tk 없이 OCR/번역해 JSON(및 오버레이 PNG)으로 저장합니다.
+
+사용법:
+    python batch.py 스크린샷폴더 --out 결과폴더 --lang eng --target KO
+    python batch.py 스크린샷폴더 --translator stub      (네트워크 없이 실행)
+    Cross-reader.exe batch 스크린샷폴더 ...             (패키징된 exe)
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageDraw
+
+import config
+import layout
+import ocr_engine
+import script_detect
+import translation
+import translators
+from recognize import recognize
+from translation_cache import TranslationCache
+
+IMAGE_PATTERNS = ('*.png', '*.jpg', '*.jpeg', '*.bmp')
+
+
+def _ocr_file(path, lang, preset, detect_text, east_model_path, min_conf=0, retry_conf=0):
+    """작업 프로세스에서 이미지 파일 하나를 읽어 OCR 합니다. (이미지는 프로세스 간에 주고받지 않음)"""
+    timings = {}
+    start = time.perf_counter()
+    with Image.open(path) as img:
+        lines = recognize(ocr_engine.worker_engine(), img.convert('RGB'), lang, preset, detect_text, east_model_path, timings,
+                          min_conf, retry_conf)
+    timings['ocr'] = time.perf_counter() - start
+    return path, lines, timings
+
+
+def find_images(folder):
+    paths = []
+    for pattern in IMAGE_PATTERNS:
+        paths.extend(glob.glob(os.path.join(folder, pattern)))
+    return sorted(set(paths))
+
+
+def create_translator(name, api_key=''):
+    """--translator 옵션에 맞는 번역기(라우터)를 만듭니다."""
+    try:
+        return translators.create_router(name, api_key, config.get_http_translator_url(),
+                                         config.get_deepl_char_budget())
+    except ValueError as e:
+        raise SystemExit(f"{e} (--deepl-key 또는 config.json의 deepl_api_key)")
+
+
+def render_overlay(img, lines, translated, metrics=None):
+    """
+    캡처 위에 번역 박스를 그린 이미지를 만듭니다.
+    오버레이 창과 같은 layout.layout_lines 배치(글꼴 크기, 줄바꿈, 겹침 밀어내기)를 씁니다.
+    """
+    metrics = metrics or layout.get_metrics()
+    out = img.convert('RGB')
+    draw = ImageDraw.Draw(out)
+    for box in layout.layout_lines(lines, translated, metrics):
+        draw.rectangle((box.left, box.top, box.left + box.width, box.top + box.height),
+                       fill='white', outline='#888888')
+        font = metrics.pil_font(box.font_size)
+        wrapped = layout.wrap_text(metrics, box.text, box.font_size, box.wrap_width)
+        line_height = metrics.line_height(box.font_size)
+        top = box.center_y - line_height * len(wrapped) / 2
+        for i, text in enumerate(wrapped):
+            draw.text((box.center_x, top + i * line_height), text, fill='black', font=font, anchor='ma')
+    return out
+
+
+def write_result(out_dir, path, lines, translated, render=False):
+    """이미지 한 장의 결과를 <이름>.json (선택: <이름>_overlay.png) 으로 저장합니다."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    result = {
+        'image': os.path.basename(path),
+        'lines': [
+            {'text': line.text, 'box': [line.left, line.top, line.width, line.height], 'conf': round(line.conf, 1),
+             'translation': text}
+            for line, text in zip(lines, translated)
+        ],
+    }
+    with open(os.path.join(out_dir, name + '.json'), 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if render:
+        with Image.open(path) as img:
+            render_overlay(img, lines, translated).save(os.path.join(out_dir, name + '_overlay.png'))
+
+
+def run_batch(folder, out_dir, translator, cache, lang='eng', target_lang='KO', tesseract_cmd='',
+              preset='none', detect_text=False, east_model_path='', workers=None, batch_size=16, render=False,
+              min_conf=0, retry_conf=0, engine_factory=None):
+    """
+    폴더의 스크린샷을 프로세스 풀에서 OCR 하고, batch_size 장씩 모아 한 번에 번역합니다.
+    번역과 파일 저장은 메인 프로세스에서 하므로 그동안에도 다른 이미지의 OCR은 계속 진행됩니다.
+    engine_factory를 주면 작업 프로세스의 OCR 엔진을 그 함수로 만듭니다. (기본: ocr_engine.create_engine)
+    처리 통계(dict)를 반환합니다.
+    """
+    paths = find_images(folder)
+    os.makedirs(out_dir, exist_ok=True)
+    stats = {'images': len(paths), 'lines': 0, 'ocr_seconds': 0.0, 'translate_seconds': 0.0}
+    pending = []
+
+    def flush():
+        if not pending:
+            return
+        texts = [line.text for _, lines in pending for line in lines]
+        start = time.perf_counter()
+        if script_detect.is_auto(lang):
+            langs = [script_detect.line_lang(line, lang) for _, lines in pending for line in lines]
+            translated = translation.translate_lines_by_lang(translator, cache, texts, langs, target_lang)
+        else:
+            translated = translation.translate_lines(translator, cache, texts, lang, target_lang)
+        stats['translate_seconds'] += time.perf_counter() - start
+
+        offset = 0
+        for path, lines in pending:
+            write_result(out_dir, path, lines, translated[offset:offset + len(lines)], render)
+            offset += len(lines)
+        stats['lines'] += len(texts)
+        pending.clear()
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=ocr_engine.init_worker,
+                             initargs=(tesseract_cmd, engine_factory)) as executor:
+        futures = [executor.submit(_ocr_file, path, lang, preset, detect_text, east_model_path, min_conf, retry_conf)
+                   for path in paths]
+        for future in futures:
+            path, lines, timings = future.result()
+            stats['ocr_seconds'] += timings['ocr']
+            pending.append((path, lines))
+            if len(pending) >= batch_size:
+                flush()
+        flush()
+
+    stats['seconds'] = time.perf_counter() - start
+    stats['images_per_second'] = len(paths) / stats['seconds'] if stats['seconds'] > 0 else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스크린샷 폴더 일괄 OCR/번역 (GUI 없이 실행)")
+    parser.add_argument('folder', help="스크린샷 폴더")
+    parser.add_argument('--out', default='batch_output', help="결과 저장 폴더")
+    parser.add_argument('--lang', default='eng', help="Tesseract OCR 언어 (eng, kor, jpn 등, auto: 영역별 자동 감지)")
+    parser.add_argument('--target', default='KO', help="DeepL 대상 언어 (KO, EN-US 등)")
+    parser.add_argument('--translator', choices=translators.BACKEND_CHOICES, default=config.get_translator_backend(),
+                        help="번역 엔진 (auto: DeepL 우선, 실패/지연 시 Argos)")
+    parser.add_argument('--deepl-key', default=config.get_deepl_key())
+    parser.add_argument('--tesseract', default=config.get_tesseract_path(), help="tesseract.exe 경로")
+    parser.add_argument('--preset', default='none', help="OCR 전처리 프리셋 (none, fast, ui, accurate)")
+    parser.add_argument('--detect', action='store_true', help="글자 영역만 골라 OCR")
+    parser.add_argument('--min-conf', type=float, default=config.get_ocr_min_conf(),
+                        help="이보다 신뢰도가 낮은 단어는 번역하지 않음 (0~100, 0이면 모두 번역)")
+    parser.add_argument('--retry-conf', type=float, default=config.get_ocr_retry_conf(),
+                        help="이보다 신뢰도가 낮은 줄만 잘라 다시 인식 (0이면 끔)")
+    parser.add_argument('--workers', type=int, default=None, help="OCR 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--batch-size', type=int, default=16, help="한 번에 번역할 이미지 수")
+    parser.add_argument('--render', action='store_true', help="오버레이 PNG도 저장")
+    parser.add_argument('--no-cache', action='store_true', help="번역 메모리(translation_cache.db)를 쓰지 않음")
+    args = parser.parse_args(argv)
+
+    if not ocr_engine.has_warm_engine(args.tesseract):
+        print("느린 OCR 모드: tesserocr/libtesseract를 찾지 못해 이미지마다 tesseract 프로세스를 실행합니다.")
+    translator = create_translator(args.translator, args.deepl_key)
+    cache = TranslationCache(':memory:') if args.no_cache else TranslationCache()
+    try:
+        stats = run_batch(args.folder, args.out, translator, cache,
+                          lang=args.lang, target_lang=args.target, tesseract_cmd=args.tesseract,
+                          preset=args.preset, detect_text=args.detect,
+                          east_model_path=config.get_east_model_path(),
+                          workers=args.workers, batch_size=args.batch_size, render=args.render,
+                          min_conf=args.min_conf, retry_conf=args.retry_conf)
+    finally:
+        cache.close()
+        translator.close()
+
+    print(f"이미지 {stats['images']}장, 줄 {stats['lines']}개, {stats['seconds']:.2f}초 "
+          f"({stats['images_per_second']:.2f}장/초)")
+    print(f"OCR 합계 {stats['ocr_seconds']:.2f}초 (전체 프로세스), 번역 {stats['translate_seconds']:.2f}초, "
+          f"{cache.stats_text()}")
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+화면 캡처 방식별 캡처당 시간과 메모리 비교 (mss / PIL.ImageGrab)
+- frame   : 캡처 버퍼 크기 (mss는 BGRA 뷰, PIL은 RGB 이미지)
+- image   : OCR로 넘길 RGB 이미지 크기 (영역 감시에서 바뀌지 않은 프레임은 만들지 않음)
+- peak    : 캡처를 반복하는 동안 늘어난 프로세스 최대 메모리 (방식마다 새 프로세스에서 측정)
+
+사용법:
+    python benchmarks/bench_capture.py --repeat 30
+    python benchmarks/bench_capture.py --bbox 0 0 800 600
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def peak_memory_bytes():
+    """프로세스 최대 메모리 (psutil이 있으면 사용, 없으면 Unix의 resource)"""
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss)
+    except ImportError:
+        pass
+    try:
+        import resource
+        # Linux는 KB 단위, macOS는 바이트 단위
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        return None
+
+
+def measure(backend, bbox, repeat, convert):
+    """(자식 프로세스에서) 캡처를 repeat번 반복해 결과를 JSON으로 출력합니다."""
+    sys.path.insert(0, ROOT)
+    import screen_capture
+    if backend == 'mss' and screen_capture.mss is None:
+        raise SystemExit("mss 미설치 (pip install mss)")
+    capture = screen_capture.MssCapture() if backend == 'mss' else screen_capture.PilCapture()
+    capture.grab_frame(bbox)  # 핸들 생성/첫 호출 비용 제외
+    baseline = peak_memory_bytes()
+
+    timings = []
+    frame_bytes = image_bytes = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frame = capture.grab_frame(bbox)
+        if convert:
+            img = frame.to_image()
+            image_bytes = img.width * img.height * len(img.getbands())
+        timings.append(time.perf_counter() - start)
+        frame_bytes = frame.nbytes
+        del frame
+    capture.close()
+
+    peak = peak_memory_bytes()
+    timings.sort()
+    print(json.dumps({
+        'p50': timings[len(timings) // 2],
+        'frame': frame_bytes,
+        'image': image_bytes,
+        'peak': (peak - baseline) if peak is not None and baseline is not None else None,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화면 캡처 방식별 시간/메모리 벤치마크")
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--bbox', type=int, nargs=4, default=None, help="left top right bottom (기본: 주 모니터 전체)")
+    parser.add_argument('--child', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    bbox = tuple(args.bbox) if args.bbox else None
+
+    if args.child:
+        measure(args.child[0], bbox, args.repeat, args.child[1] == 'convert')
+        return
+
+    print(f"반복 {args.repeat}회, 영역 {bbox or '주 모니터 전체'}")
+    print(f"{'방식':<16}{'p50(ms)':>10}{'frame(MB)':>12}{'image(MB)':>12}{'peak(MB)':>12}")
+    for backend in ('mss', 'pil'):
+        for mode in ('convert', 'frame'):
+            command = [sys.executable, os.path.abspath(__file__), '--repeat', str(args.repeat), '--child', backend, mode]
+            if bbox:
+                command += ['--bbox'] + [str(v) for v in bbox]
+            result = subprocess.run(command, capture_output=True, text=True, cwd=ROOT)
+            label = f"{backend} ({'변환' if mode == 'convert' else '버퍼만'})"
+            if result.returncode != 0:
+                last = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "실패"
+                print(f"{label:<16}건너뜀: {last}")
+                continue
+            row = json.loads(result.stdout.strip().splitlines()[-1])
+            peak = f"{row['peak'] / 2 ** 20:>12.1f}" if row['peak'] is not None else f"{'-':>12}"
+            print(f"{label:<16}{row['p50'] * 1000:>10.1f}{row['frame'] / 2 ** 20:>12.1f}"
+                  f"{row['image'] / 2 ** 20:>12.1f}{peak}")
+
+
+if __name__ == '__main__':
+    main()
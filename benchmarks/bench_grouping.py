@@ -0,0 +1,108 @@
+"""
+OCR 결과 줄 그룹화 비교: pandas DataFrame/groupby 방식 vs ocr_model.group_lines
+모듈 import 시간도 함께 측정합니다. (pandas는 설치된 경우에만 비교)
+
+사용법:
+    python benchmarks/bench_grouping.py --lines 40 --repeat 200
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ocr_model import group_lines  # noqa: E402
+
+
+def make_data(line_count, words_per_line=8):
+    """Output.DICT 형식의 합성 OCR 데이터를 만듭니다. (블록/문단/줄 행 포함)"""
+    data = {k: [] for k in ('level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+                            'left', 'top', 'width', 'height', 'conf', 'text')}
+
+    def add(level, line, word, left, top, width, height, text):
+        data['level'].append(level)
+        data['page_num'].append(1)
+        data['block_num'].append(1 + line // 10)
+        data['par_num'].append(1)
+        data['line_num'].append(1 + line % 10)
+        data['word_num'].append(word)
+        data['left'].append(left)
+        data['top'].append(top)
+        data['width'].append(width)
+        data['height'].append(height)
+        data['conf'].append(-1 if level != 5 else 90)
+        data['text'].append(text)
+
+    for line in range(line_count):
+        add(4, line, 0, 10, line * 30, 600, 24, '')
+        for word in range(words_per_line):
+            add(5, line, word + 1, 10 + word * 70, line * 30, 60, 24, f"w{line}_{word}")
+    return data
+
+
+def group_with_pandas(data):
+    """기존 process_image의 pandas 그룹화 로직"""
+    import pandas as pd
+    df = pd.DataFrame(data)
+    words = df[(df.level == 5) & (df.text.str.strip() != '')]
+    rows = []
+    for _, group in words.groupby(['page_num', 'block_num', 'par_num', 'line_num']):
+        x1 = group['left'].min()
+        y1 = group['top'].min()
+        x2 = (group['left'] + group['width']).max()
+        y2 = (group['top'] + group['height']).max()
+        rows.append({'text': " ".join(group['text'].tolist()),
+                     'left': x1, 'top': y1, 'width': x2 - x1, 'height': y2 - y1})
+    lines = pd.DataFrame(rows)
+    return [row['text'] for _, row in lines.iterrows()]
+
+
+def import_time(module):
+    """새 인터프리터에서 모듈 import에 걸리는 시간(ms)을 잽니다."""
+    code = f"import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=root)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip()) * 1000
+
+
+def bench(func, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 줄 그룹화/임포트 시간 벤치마크")
+    parser.add_argument('--lines', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    data = make_data(args.lines)
+    print(f"줄 {args.lines}개, 반복 {args.repeat}회 (중앙값)")
+
+    try:
+        import pandas  # noqa: F401
+        has_pandas = True
+    except ImportError:
+        has_pandas = False
+
+    print(f"{'방식':<16}{'그룹화(ms)':>12}{'import(ms)':>12}")
+    if has_pandas:
+        imp = import_time('pandas')
+        print(f"{'pandas':<16}{bench(group_with_pandas, data, args.repeat):>12.3f}{imp:>12.1f}")
+    else:
+        print("pandas 미설치: 기존 방식 비교는 건너뜁니다.")
+
+    imp = import_time('ocr_model')
+    print(f"{'group_lines':<16}{bench(group_lines, data, args.repeat):>12.3f}{imp:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+OCR 엔진별 캡처당 지연 시간 비교 (cold: 캡처마다 tesseract 프로세스 실행 / warm: 미리 로드된 워커 재사용)
+
+사용법:
+    python benchmarks/bench_ocr.py --tesseract "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+    python benchmarks/bench_ocr.py --images 샘플폴더 --lang kor
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ocr_engine  # noqa: E402
+
+SAMPLE_LINES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Press START to continue your adventure.",
+    "Settings  Audio  Video  Controls",
+    "HP 120/150   MP 45/60   Lv. 23",
+]
+
+
+def make_samples():
+    """고정된 합성 샘플 이미지 세트를 만듭니다. (실행마다 동일)"""
+    samples = []
+    for count in (1, 2, 4):
+        img = Image.new('RGB', (640, 40 * count + 20), 'white')
+        draw = ImageDraw.Draw(img)
+        for i in range(count):
+            draw.text((10, 10 + i * 40), SAMPLE_LINES[i], fill='black', font_size=24)
+        samples.append(img)
+    return samples
+
+
+def load_samples(folder):
+    paths = sorted(glob.glob(os.path.join(folder, '*.png')) + glob.glob(os.path.join(folder, '*.jpg')))
+    return [Image.open(p).convert('RGB') for p in paths]
+
+
+def measure(engine, samples, lang, repeat):
+    """첫 캡처(모델 로드 포함) 시간과 이후 캡처당 시간을 측정합니다."""
+    start = time.perf_counter()
+    engine.image_to_data(samples[0], lang)
+    first = time.perf_counter() - start
+
+    timings = []
+    for _ in range(repeat):
+        for img in samples:
+            start = time.perf_counter()
+            engine.image_to_data(img, lang)
+            timings.append(time.perf_counter() - start)
+    return first, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 엔진 cold/warm 지연 시간 벤치마크")
+    parser.add_argument('--images', help="샘플 이미지 폴더 (생략 시 합성 이미지 사용)")
+    parser.add_argument('--lang', default='eng')
+    parser.add_argument('--tesseract', default='', help="tesseract.exe 경로")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    samples = load_samples(args.images) if args.images else make_samples()
+    if not samples:
+        sys.exit("샘플 이미지가 없습니다.")
+
+    engines = [ocr_engine.PytesseractEngine(args.tesseract)]
+    if ocr_engine.tesserocr is not None:
+        engines.append(ocr_engine.TesserocrEngine(args.tesseract))
+    else:
+        print("tesserocr 미설치: tesserocr 엔진은 건너뜁니다. (pip install tesserocr)")
+    if ocr_engine.find_libtesseract(args.tesseract):
+        engines.append(ocr_engine.LibTesseractEngine(args.tesseract))
+    else:
+        print("libtesseract를 찾지 못해 libtesseract 엔진은 건너뜁니다.")
+
+    print(f"샘플 {len(samples)}장 x {args.repeat}회, 언어={args.lang}")
+    print(f"{'엔진':<12}{'첫 캡처(ms)':>14}{'평균(ms)':>12}{'p95(ms)':>12}")
+    for engine in engines:
+        first, timings = measure(engine, samples, args.lang, args.repeat)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"{engine.name:<12}{first * 1000:>14.1f}{statistics.mean(timings) * 1000:>12.1f}{p95 * 1000:>12.1f}")
+        engine.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+영역 병렬 OCR 효과 측정: 한 가지 문자만 있는 화면(가장 흔한 경우)을 언어 자동 감지 경로(script_detect)로
+인식할 때, 언어별 워커 수(workers_per_lang)에 따라 캡처당 시간이 어떻게 달라지는지 비교합니다.
+영역들은 스레드 풀에서 병렬로 돌지만 같은 언어의 영역은 그 언어의 워커 수만큼만 동시에 인식됩니다.
+
+Tesseract가 없거나 --simulate 를 주면, 영역마다 정해진 시간(ms) 동안 GIL을 놓고 기다리는 가상 엔진으로
+워커 풀 폭의 효과만 측정합니다. (--cores 로 가정할 코어 수 지정)
+
+사용법:
+    python benchmarks/bench_parallel_ocr.py --tesseract "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+    python benchmarks/bench_parallel_ocr.py --simulate 40 --cores 8
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ocr_engine  # noqa: E402
+import script_detect  # noqa: E402
+import text_regions  # noqa: E402
+
+PANEL_TEXT = ["Quest complete! You received 350 gold.", "Press START to continue.",
+              "HP 120/150   MP 45/60", "Settings  Audio  Video"]
+
+
+def make_screen(columns=4, rows=4, size=(1920, 1080)):
+    """서로 떨어진 글상자 columns x rows개가 있는 합성 화면 (영역 검출이 상자마다 영역 하나를 찾음)"""
+    img = Image.new('RGB', size, 'white')
+    draw = ImageDraw.Draw(img)
+    cell_w, cell_h = size[0] // columns, size[1] // rows
+    for row in range(rows):
+        for col in range(columns):
+            x, y = col * cell_w + 30, row * cell_h + 40
+            for i in range(2):
+                draw.text((x, y + i * 30), PANEL_TEXT[(row + col + i) % len(PANEL_TEXT)], fill='black', font_size=20)
+    return img
+
+
+class SimulatedEngine(ocr_engine._PooledEngine):
+    """인식 대신 seconds 동안 기다리는 가상 엔진 (Tesseract처럼 인식 중에는 GIL을 놓음)"""
+    name = 'simulated'
+
+    def __init__(self, seconds, workers_per_lang=None):
+        super().__init__(workers_per_lang=workers_per_lang)
+        self.seconds = seconds
+
+    def _create_api(self, lang):
+        return object()
+
+    def _end_api(self, api):
+        pass
+
+    def image_to_data(self, img, lang, psm=None):
+        api = self._acquire(lang)
+        try:
+            time.sleep(self.seconds)
+            return {key: [] for key in ocr_engine.DATA_KEYS}
+        finally:
+            self._release(lang, api)
+
+    def languages(self):
+        return ['eng']
+
+
+def open_engine(args, workers):
+    if args.simulate:
+        return SimulatedEngine(args.simulate / 1000, workers)
+    if ocr_engine.tesserocr is not None:
+        return ocr_engine.TesserocrEngine(args.tesseract, workers)
+    return ocr_engine.LibTesseractEngine(args.tesseract, workers)
+
+
+def measure(engine, img, spec, repeat):
+    """워커를 미리 만든 뒤(첫 캡처) 캡처당 시간 목록을 잽니다."""
+    script_detect.recognize_auto(engine, img, spec)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        script_detect.recognize_auto(engine, img, spec)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="언어별 워커 수에 따른 영역 병렬 OCR 시간 비교")
+    parser.add_argument('--tesseract', default='', help="tesseract.exe 경로")
+    parser.add_argument('--lang', default='eng', help="화면의 언어 (auto:<lang> 으로 인식)")
+    parser.add_argument('--simulate', type=float, default=0, help="가상 엔진의 영역당 인식 시간 (ms)")
+    parser.add_argument('--cores', type=int, default=ocr_engine.WORKERS_PER_LANG, help="가정할 코어 수 (기본: 이 PC)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not args.simulate and not ocr_engine.has_warm_engine(args.tesseract):
+        print("tesserocr/libtesseract를 찾지 못해 가상 엔진(영역당 40ms)으로 측정합니다.")
+        args.simulate = 40
+    # 영역 OCR 스레드 풀은 처음 쓸 때 이 폭으로 만들어집니다.
+    ocr_engine.WORKERS_PER_LANG = args.cores
+
+    img = make_screen()
+    regions = text_regions.detect_regions(img)
+    spec = f"{script_detect.AUTO_LANG}:{args.lang}"
+    print(f"화면 {img.size[0]}x{img.size[1]}, 글자 영역 {len(regions)}개, 코어 {args.cores}, "
+          f"엔진 {'가상 (%.0fms/영역)' % args.simulate if args.simulate else '실제 Tesseract'}")
+    print(f"{'언어별 워커':>10}{'평균(ms)':>12}{'최소(ms)':>12}{'배속':>8}")
+    baseline = None
+    for workers in sorted({2, args.cores}):
+        engine = open_engine(args, workers)
+        try:
+            timings = measure(engine, img, spec, args.repeat)
+        finally:
+            engine.close()
+        mean = statistics.mean(timings)
+        baseline = baseline or mean
+        print(f"{workers:>10}{mean * 1000:>12.1f}{min(timings) * 1000:>12.1f}{baseline / mean:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+OCR 전처리 프리셋별 단계 지연 시간과 (Tesseract가 있으면) 인식 정확도(CER)를 비교합니다.
+
+사용법:
+    python benchmarks/bench_preprocess.py
+    python benchmarks/bench_preprocess.py --tesseract "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import preprocess  # noqa: E402
+from ocr_model import group_lines  # noqa: E402
+
+SAMPLE_TEXT = ["Open the inventory to equip items", "Auto-save is enabled", "Quest log updated"]
+
+# (이름, 배경색, 글자색, 글자 크기, 이미지 크기)
+SAMPLES = [
+    ("밝은 테마/작은 글자", (245, 245, 245), (30, 30, 30), 11, (640, 120)),
+    ("다크 테마", (25, 28, 36), (220, 220, 220), 16, (800, 160)),
+    ("큰 제목", (255, 255, 255), (0, 0, 0), 72, (1800, 420)),
+    ("전체 화면 크기", (200, 210, 220), (20, 20, 60), 18, (1920, 1080)),
+]
+
+
+def make_sample(background, foreground, font_size, size):
+    img = Image.new('RGB', size, background)
+    draw = ImageDraw.Draw(img)
+    for i, line in enumerate(SAMPLE_TEXT):
+        draw.text((10, 10 + i * font_size * 1.6), line, fill=foreground, font_size=font_size)
+    return img
+
+
+def cer(expected, actual):
+    """문자 오류율 (레벤슈타인 거리 / 정답 길이)"""
+    prev = list(range(len(actual) + 1))
+    for i, a in enumerate(expected, 1):
+        cur = [i]
+        for j, b in enumerate(actual, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (a != b)))
+        prev = cur
+    return prev[-1] / max(1, len(expected))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 전처리 프리셋 벤치마크")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--tesseract', default='', help="지정하면 프리셋별 CER도 측정")
+    parser.add_argument('--lang', default='eng')
+    args = parser.parse_args()
+
+    engine = None
+    if args.tesseract:
+        import ocr_engine
+        engine = ocr_engine.create_engine(args.tesseract)
+
+    expected = "\n".join(SAMPLE_TEXT)
+    for name, background, foreground, font_size, size in SAMPLES:
+        img = make_sample(background, foreground, font_size, size)
+        print(f"\n[{name}] {size[0]}x{size[1]}, 글자 {font_size}px")
+        for preset in preprocess.PRESETS:
+            totals = []
+            stage_times = {}
+            for _ in range(args.repeat):
+                timings = {}
+                start = time.perf_counter()
+                processed, scale = preprocess.preprocess(img, preset, timings)
+                totals.append(time.perf_counter() - start)
+                for stage, seconds in timings.items():
+                    stage_times.setdefault(stage, []).append(seconds)
+
+            stages = " ".join(f"{stage}={statistics.median(v) * 1000:.1f}" for stage, v in stage_times.items())
+            line = f"  {preset:<9} 전체 {statistics.median(totals) * 1000:6.1f}ms  배율 {scale:.2f}  {stages}"
+
+            if engine is not None:
+                start = time.perf_counter()
+                data = preprocess.rescale_data(engine.image_to_data(processed, args.lang), scale)
+                ocr_time = time.perf_counter() - start
+                actual = "\n".join(l.text for l in group_lines(data))
+                line += f"  | OCR {ocr_time * 1000:.0f}ms CER {cer(expected, actual):.1%}"
+            print(line)
+
+    if engine is not None:
+        engine.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+영역 차분 OCR 비교: 채팅 로그처럼 한 줄씩 추가되며 위로 밀리는 화면을 연속 캡처했을 때
+매번 전체를 OCR 하는 경우와 region_diff.RegionDiff로 바뀐 띠만 OCR 하는 경우의
+OCR 시간, OCR 한 행 수, 번역 API로 보낸 줄 수(번역 메모리 적용 후)를 비교합니다.
+
+사용법:
+    python benchmarks/bench_region_diff.py --captures 20
+    python benchmarks/bench_region_diff.py --tesseract "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+"""
+import argparse
+import os
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ocr_engine  # noqa: E402
+import translation  # noqa: E402
+from recognize import recognize  # noqa: E402
+from region_diff import RegionDiff  # noqa: E402
+from translation_cache import TranslationCache  # noqa: E402
+
+LINE_HEIGHT = 32
+
+
+def render_chat(messages, width=640, height=480):
+    """아래쪽부터 메시지를 채운 채팅 창 이미지를 만듭니다. (새 메시지가 오면 위로 밀림)"""
+    img = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(img)
+    visible = messages[-(height // LINE_HEIGHT):]
+    y = height - LINE_HEIGHT * len(visible)
+    for message in visible:
+        draw.text((10, y + 4), message, fill='black', font_size=20)
+        y += LINE_HEIGHT
+    return img
+
+
+def run(captures, ocr, use_diff):
+    """captures장의 연속 캡처를 처리해 (OCR 초, OCR 행 수, 전체 행 수, 번역 요청 줄 수)를 반환합니다."""
+    translator = translation.StubTranslator()
+    cache = TranslationCache(':memory:')
+    diff = RegionDiff()
+    messages = [f"[user{i % 3}] chat message number {i}" for i in range(12)]
+    ocr_seconds = 0.0
+    rows_ocr = rows_total = 0
+
+    for i in range(captures):
+        messages.append(f"[user{i % 3}] new message {i} arrived")
+        img = render_chat(messages)
+        start = time.perf_counter()
+        if use_diff:
+            lines = diff.recognize('chat', img, ocr)
+        else:
+            lines = ocr(img)
+            rows_ocr += img.size[1]
+            rows_total += img.size[1]
+        ocr_seconds += time.perf_counter() - start
+        translation.translate_lines(translator, cache, [line.text for line in lines], 'eng', 'KO')
+
+    if use_diff:
+        rows_ocr, rows_total = diff.rows_ocr, diff.rows_total
+    cache.close()
+    return ocr_seconds, rows_ocr, rows_total, translator.characters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영역 차분 OCR 벤치마크 (채팅 로그 스크롤)")
+    parser.add_argument('--captures', type=int, default=20)
+    parser.add_argument('--tesseract', default='', help="tesseract.exe 경로")
+    parser.add_argument('--lang', default='eng')
+    args = parser.parse_args()
+
+    engine = ocr_engine.create_engine(args.tesseract)
+    engine.warm_up(args.lang)
+
+    def ocr(img):
+        return recognize(engine, img, args.lang)
+
+    print(f"캡처 {args.captures}장 ({engine.name})")
+    print(f"{'방식':<10}{'OCR(s)':>10}{'OCR 행 비율':>14}{'번역 글자 수':>14}")
+    for name, use_diff in (('전체', False), ('차분', True)):
+        seconds, rows_ocr, rows_total, characters = run(args.captures, ocr, use_diff)
+        print(f"{name:<10}{seconds:>10.2f}{rows_ocr / rows_total:>14.1%}{characters:>14}")
+    engine.close()
+
+
+if __name__ == '__main__':
+    main()
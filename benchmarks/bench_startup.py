@@ -0,0 +1,122 @@
+"""
+시작 시간 벤치마크: 새 프로세스에서 Cross_Reader를 띄워
+- import       : Cross_Reader 모듈 import 시간
+- window       : 프로세스 시작 → 첫 창이 그려질 때까지 (time-to-first-window)
+- engines      : 프로세스 시작 → 백그라운드 엔진 초기화 완료까지
+- translation  : 프로세스 시작 → 합성 캡처 한 장의 OCR/번역 결과가 나올 때까지 (time-to-first-translation)
+을 잽니다. 번역은 stub 번역기로 하므로 네트워크 없이 동작합니다. (창을 띄울 디스플레이 필요)
+창을 띄우기 전에 불러오지 않게 된 무거운 모듈의 import 시간도 참고용으로 함께 출력합니다.
+
+사용법:
+    python benchmarks/bench_startup.py --repeat 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_grouping import import_time  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스에서 실행할 코드: 각 시점을 프로세스 시작 기준 초로 JSON 출력
+CHILD = r"""
+import json, time
+start_wall = time.time()
+start = time.perf_counter()
+import tkinter as tk
+import Cross_Reader
+marks = {'start_wall': start_wall, 'import': time.perf_counter() - start}
+try:
+    root = tk.Tk()
+except tk.TclError as e:
+    marks['error'] = f"창을 띄울 수 없음: {e}"
+    print(json.dumps(marks))
+    raise SystemExit
+root.withdraw()
+app = Cross_Reader.TranslatorApp(root)
+root.deiconify()
+root.update()
+marks['window'] = time.perf_counter() - start
+
+def wait_engines():
+    if not app.engines_ready.is_set():
+        root.after(5, wait_engines)
+        return
+    marks['engines'] = time.perf_counter() - start
+    import translators
+    from PIL import Image, ImageDraw
+    app.translator = translators.create_router('stub')
+    img = Image.new('RGB', (480, 120), 'white')
+    ImageDraw.Draw(img).text((10, 40), "Startup benchmark sample text", fill='black')
+    job = app.pipeline.submit(img, 'eng', 'KO', preset='none')
+
+    def wait_job():
+        if not job.done.is_set():
+            root.after(5, wait_job)
+            return
+        marks['translation'] = time.perf_counter() - start
+        if not job.lines:
+            marks['error'] = "OCR 결과 없음 (Tesseract 경로/언어 확인)"
+        print(json.dumps(marks))
+        app.on_closing()
+    wait_job()
+
+root.after(0, wait_engines)
+root.mainloop()
+"""
+
+HEAVY_MODULES = ('pytesseract', 'deepl', 'keyboard', 'PIL.ImageTk', 'numpy', 'recognize', 'tiled_ocr')
+
+
+def run_once():
+    launched = time.time()
+    result = subprocess.run([sys.executable, '-c', CHILD], capture_output=True, text=True, cwd=ROOT, timeout=120)
+    lines = [line for line in result.stdout.splitlines() if line.startswith('{')]
+    if not lines:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "출력 없음")
+    marks = json.loads(lines[-1])
+    # 인터프리터 기동 시간을 더해 '프로세스 시작' 기준으로 맞춥니다.
+    boot = marks.pop('start_wall') - launched
+    for key in ('window', 'engines', 'translation'):
+        if key in marks:
+            marks[key] += boot
+    marks['interpreter'] = boot
+    return marks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간(첫 창/첫 번역) 벤치마크")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(args.repeat):
+        try:
+            runs.append(run_once())
+        except Exception as e:
+            print(f"실행 실패: {type(e).__name__}: {e}")
+            break
+
+    if runs:
+        print(f"반복 {len(runs)}회 (중앙값, ms)")
+        for key in ('interpreter', 'import', 'window', 'engines', 'translation'):
+            values = [run[key] for run in runs if key in run]
+            if values:
+                print(f"{key:<14}{statistics.median(values) * 1000:>10.1f}")
+        errors = {run['error'] for run in runs if 'error' in run}
+        for error in errors:
+            print(f"참고: {error}")
+
+    print("\n창을 띄우기 전에는 불러오지 않는 모듈의 import 시간 (ms)")
+    for module in HEAVY_MODULES:
+        elapsed = import_time(module)
+        print(f"{module:<14}{elapsed:>10.1f}" if elapsed is not None else f"{module:<14}{'미설치':>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""
+OCR + 번역 파이프라인 회귀 벤치마크: golden_corpus의 합성 스크린샷(언어/글꼴/크기/테마 조합)을
+GUI 없이 recognize → 번역(StubTranslator, 네트워크 없음) → layout_lines 순서로 처리하고
+다음 값을 측정합니다.
+- ocr      : 캡처당 OCR 지연 시간 (recognize 전체, p50/p95)
+- cer/wer  : 정답 문장과 비교한 글자/단어 오류율 (한중일처럼 띄어쓰기가 없는 언어는 공백 무시, WER 생략)
+- group    : 줄 그룹화 시간
+- retry    : 신뢰도가 낮은 줄 재인식 시간 (ocr에 포함)
+- chars    : 번역으로 보낸 글자 수 (잡음 단어를 뺀 뒤)
+- translate: 번역 단계 시간 (번역 메모리 포함)
+- layout   : 오버레이 박스 배치 시간
+- peak     : 실행 중 프로세스 최대 메모리
+
+결과는 커밋 해시와 함께 JSONL 기록 파일에 한 줄씩 추가되며, 같은 머신/설정의 직전 기록과 비교해
+나빠진 값을 표시합니다. Tesseract가 없거나 --no-ocr 이면 OCR 대신 정답 단어 박스로
+그룹화/번역/배치만 측정합니다.
+
+사용법:
+    python benchmarks/bench_suite.py --tesseract "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+    python benchmarks/bench_suite.py --langs eng kor --sizes 14 20 --themes light dark
+    python benchmarks/bench_suite.py --min-conf 0 --retry-conf 0   (신뢰도 필터/재인식 끄고 비교)
+    python benchmarks/bench_suite.py --no-ocr --fail-on-regression
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config  # noqa: E402
+import translation  # noqa: E402
+from bench_capture import peak_memory_bytes  # noqa: E402
+from golden_corpus import CORPUS_SIZES, CORPUS_TEXT, CORPUS_THEMES, NO_SPACE_LANGS, build_corpus  # noqa: E402
+from layout import get_metrics, layout_lines  # noqa: E402
+from ocr_model import group_lines  # noqa: E402
+from translation_cache import TranslationCache  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_FILE = os.path.join(ROOT, 'benchmarks', 'bench_history.jsonl')
+# 직전 기록보다 이 비율 이상 느려지거나(시간/메모리) 오류율이 이만큼 늘면 회귀로 표시합니다.
+TIME_REGRESSION = 0.15
+# 수 ms 이하 구간은 잡음이 크므로 절대 차이도 이 값(ms) 이상일 때만 표시합니다.
+MIN_TIME_DELTA_MS = 1.0
+ERROR_RATE_REGRESSION = 0.01
+
+
+def edit_distance(ref, hyp):
+    """두 시퀀스(문자열 또는 단어 목록)의 레벤슈타인 거리"""
+    if len(ref) < len(hyp):
+        ref, hyp = hyp, ref
+    previous = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        current = [i]
+        for j, h in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (r != h)))
+        previous = current
+    return previous[-1]
+
+
+def normalize(lines, lang):
+    """비교용 텍스트: 줄마다 공백을 하나로 줄이고, 띄어쓰기가 없는 언어는 공백을 모두 없앱니다."""
+    if lang in NO_SPACE_LANGS:
+        return ["".join(line.split()) for line in lines]
+    return [" ".join(line.split()) for line in lines]
+
+
+def error_rates(ref_lines, hyp_lines, lang):
+    """(CER, WER). WER은 띄어쓰기가 없는 언어면 None"""
+    ref = normalize(ref_lines, lang)
+    hyp = normalize(hyp_lines, lang)
+    ref_text, hyp_text = "\n".join(ref), "\n".join(hyp)
+    cer = edit_distance(ref_text, hyp_text) / max(1, len(ref_text))
+    if lang in NO_SPACE_LANGS:
+        return cer, None
+    ref_words, hyp_words = ref_text.split(), hyp_text.split()
+    return cer, edit_distance(ref_words, hyp_words) / max(1, len(ref_words))
+
+
+def git_commit():
+    """(커밋 해시, 수정 중인 파일 여부). git이 없으면 (None, None)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def open_engine(tesseract_cmd):
+    """OCR 엔진과 설치된 언어 목록. Tesseract를 쓸 수 없으면 (None, 이유)"""
+    try:
+        import ocr_engine
+        engine = ocr_engine.create_engine(tesseract_cmd)
+        return engine, set(engine.languages())
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def run_sample(sample, engine, preset, repeat, translator, cache, target_lang, min_conf=0, retry_conf=0):
+    """샘플 한 장을 repeat번 처리해 단계별 시간(초 목록)과 오류율, 번역 글자 수를 반환합니다."""
+    result = {'ocr': [], 'group': [], 'retry': [], 'translate': [], 'layout': []}
+    metrics = get_metrics()
+    lines = []
+    for _ in range(repeat):
+        timings = {}
+        start = time.perf_counter()
+        if engine is not None:
+            from recognize import recognize
+            lines = recognize(engine, sample.image, sample.lang, preset, timings=timings,
+                              min_conf=min_conf, retry_conf=retry_conf)
+            result['ocr'].append(time.perf_counter() - start)
+            result['retry'].append(timings.get('retry', 0.0))
+        else:
+            lines = group_lines(sample.data)
+            timings['group'] = time.perf_counter() - start
+        result['group'].append(timings['group'])
+
+        texts = [line.text for line in lines]
+        start = time.perf_counter()
+        translated = translation.translate_lines(translator, cache, texts, sample.lang, target_lang)
+        result['translate'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        layout_lines(lines, translated, metrics)
+        result['layout'].append(time.perf_counter() - start)
+
+    lines = sorted(lines, key=lambda line: (line.top, line.left))
+    result['cer'], result['wer'] = error_rates(sample.lines, [line.text for line in lines], sample.lang)
+    result['chars'] = sum(len(line.text) for line in lines)
+    return result
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[int((len(values) - 1) * q)]
+
+
+def summarize(results):
+    """샘플별 결과 목록을 ms 단위 지표 딕셔너리로 묶습니다."""
+    summary = {}
+    ocr = [s for r in results for s in r['ocr']]
+    if ocr:
+        summary['ocr_p50_ms'] = _percentile(ocr, 0.50) * 1000
+        summary['ocr_p95_ms'] = _percentile(ocr, 0.95) * 1000
+    for name in ('group', 'retry', 'translate', 'layout'):
+        values = [s for r in results for s in r[name]]
+        if values:
+            summary[f'{name}_ms'] = statistics.mean(values) * 1000
+    summary['chars'] = statistics.mean(r['chars'] for r in results)
+    summary['cer'] = statistics.mean(r['cer'] for r in results)
+    wers = [r['wer'] for r in results if r['wer'] is not None]
+    if wers:
+        summary['wer'] = statistics.mean(wers)
+    return {k: round(v, 4) for k, v in summary.items()}
+
+
+def load_previous(path, key):
+    """기록 파일에서 같은 비교 키(머신/모드/설정)를 가진 마지막 기록 (없으면 None)"""
+    previous = None
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('key') == key:
+                    previous = entry
+    except OSError:
+        pass
+    return previous
+
+
+def find_regressions(current, previous):
+    """(그룹, 지표, 이전 값, 현재 값) 중 나빠진 것들"""
+    regressions = []
+    for group, metrics in current.items():
+        before = previous.get(group, {})
+        for name, value in metrics.items():
+            old = before.get(name)
+            if old is None:
+                continue
+            if name in ('cer', 'wer'):
+                worse = value - old >= ERROR_RATE_REGRESSION
+            elif name.endswith('_ms'):
+                worse = value > old * (1 + TIME_REGRESSION) and value - old >= MIN_TIME_DELTA_MS
+            else:
+                worse = value > old * (1 + TIME_REGRESSION)
+            if worse:
+                regressions.append((group, name, old, value))
+    return regressions
+
+
+def print_table(metrics):
+    names = ['ocr_p50_ms', 'ocr_p95_ms', 'group_ms', 'retry_ms', 'translate_ms', 'layout_ms', 'chars', 'cer', 'wer']
+    names = [n for n in names if any(n in m for m in metrics.values())]
+    print(f"{'':<10}" + "".join(f"{n:>14}" for n in names))
+    for group, values in metrics.items():
+        cells = "".join(f"{values[n]:>14.3f}" if n in values else f"{'-':>14}" for n in names)
+        print(f"{group:<10}{cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정답 스크린샷 기반 OCR+번역 파이프라인 회귀 벤치마크")
+    parser.add_argument('--tesseract', default='', help="tesseract.exe 경로")
+    parser.add_argument('--no-ocr', action='store_true', help="OCR 없이 정답 단어 박스로 그룹화/번역/배치만 측정")
+    parser.add_argument('--langs', nargs='+', default=list(CORPUS_TEXT))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(CORPUS_SIZES))
+    parser.add_argument('--themes', nargs='+', default=list(CORPUS_THEMES), choices=list(CORPUS_THEMES))
+    parser.add_argument('--fonts-per-lang', type=int, default=2)
+    parser.add_argument('--preset', default='none', help="전처리 프리셋")
+    parser.add_argument('--min-conf', type=float, default=config.get_ocr_min_conf(), help="잡음 단어 신뢰도 기준")
+    parser.add_argument('--retry-conf', type=float, default=config.get_ocr_retry_conf(), help="재인식할 줄 신뢰도 기준")
+    parser.add_argument('--target', default='KO', help="번역 대상 언어 코드 (StubTranslator에 전달)")
+    parser.add_argument('--repeat', type=int, default=3, help="샘플당 반복 횟수")
+    parser.add_argument('--history', default=HISTORY_FILE, help="결과 기록 파일 (JSONL)")
+    parser.add_argument('--no-record', action='store_true', help="기록 파일에 추가하지 않음")
+    parser.add_argument('--fail-on-regression', action='store_true', help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    engine = None
+    installed = None
+    if not args.no_ocr:
+        engine, installed = open_engine(args.tesseract)
+        if engine is None:
+            print(f"OCR 엔진을 쓸 수 없어 OCR 없이 측정합니다. ({installed})")
+
+    langs = args.langs
+    if engine is not None:
+        missing = [lang for lang in langs if lang not in installed]
+        for lang in missing:
+            print(f"{lang}: Tesseract 언어 데이터가 없어 건너뜀")
+        langs = [lang for lang in langs if lang in installed]
+
+    samples, skipped = build_corpus(langs, args.sizes, args.themes, args.fonts_per_lang)
+    for lang in skipped:
+        print(f"{lang}: 설치된 글꼴이 없어 건너뜀")
+    if not samples:
+        sys.exit("측정할 샘플이 없습니다.")
+
+    if engine is not None:
+        # 언어 데이터 로드(첫 캡처) 비용은 지연 시간에서 제외합니다.
+        for lang in sorted({s.lang for s in samples}):
+            engine.warm_up(lang)
+    translator = translation.StubTranslator()
+    mode = 'ocr' if engine is not None else 'golden'
+    print(f"샘플 {len(samples)}장 x {args.repeat}회, 모드={mode}"
+          + (f", 엔진={engine.name}, 프리셋={args.preset}" if engine is not None else ""))
+
+    by_lang = {}
+    start = time.perf_counter()
+    for sample in samples:
+        # 샘플마다 빈 번역 메모리로 시작해 번역 단계에서 매번 같은 일을 하도록 합니다.
+        cache = TranslationCache(':memory:')
+        by_lang.setdefault(sample.lang, []).append(
+            run_sample(sample, engine, args.preset, args.repeat, translator, cache, args.target,
+                       args.min_conf, args.retry_conf))
+    elapsed = time.perf_counter() - start
+    if engine is not None:
+        engine.close()
+
+    metrics = {lang: summarize(results) for lang, results in by_lang.items()}
+    metrics['all'] = summarize([r for results in by_lang.values() for r in results])
+    peak = peak_memory_bytes()
+    if peak is not None:
+        metrics['all']['peak_mb'] = round(peak / 2 ** 20, 1)
+
+    print_table(metrics)
+    print(f"총 {elapsed:.1f}초" + (f", 최대 메모리 {metrics['all']['peak_mb']} MB" if peak is not None else ""))
+
+    commit, dirty = git_commit()
+    key = {'host': platform.node(), 'mode': mode, 'engine': engine.name if engine is not None else None,
+           'preset': args.preset, 'min_conf': args.min_conf, 'retry_conf': args.retry_conf, 'langs': sorted(by_lang), 'sizes': args.sizes, 'themes': args.themes,
+           'fonts_per_lang': args.fonts_per_lang, 'repeat': args.repeat}
+    previous = load_previous(args.history, key)
+    regressions = find_regressions(metrics, previous['metrics']) if previous else []
+    if previous:
+        print(f"비교 대상: {previous.get('commit')} ({previous.get('time')})")
+        for group, name, old, value in regressions:
+            print(f"  회귀: {group}.{name} {old} → {value}")
+        if not regressions:
+            print("  회귀 없음")
+
+    if not args.no_record:
+        entry = {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': commit, 'dirty': dirty,
+                 'python': platform.python_version(), 'key': key, 'samples': len(samples),
+                 'metrics': metrics}
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        print(f"기록: {args.history}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+텍스트 영역 사전 검출(pre-pass) 효과 측정: 검출 시간/영역 재현율, 그리고 (Tesseract가 있으면)
+사전 검출 유무에 따른 OCR 시간과 단어 재현율을 비교합니다.
+
+사용법:
+    python benchmarks/bench_text_regions.py
+    python benchmarks/bench_text_regions.py --tesseract "C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import text_regions  # noqa: E402
+
+WORDS = ["Start", "Options", "Inventory", "Quest", "Save", "Load", "Continue", "Exit",
+         "Health", "Mana", "Level", "Attack", "Defense", "Speed", "Gold", "Map"]
+
+
+def make_screenshot(seed, size=(1920, 1080)):
+    """그래픽 요소와 몇 줄의 텍스트가 섞인 합성 스크린샷과 정답(단어, 박스)을 만듭니다."""
+    rng = random.Random(seed)
+    img = Image.new('RGB', size, (30, 40, 60))
+    draw = ImageDraw.Draw(img)
+
+    # 글자가 아닌 그래픽 요소 (단색 패널, 그라데이션 막대)
+    for _ in range(6):
+        x, y = rng.randrange(0, size[0] - 300), rng.randrange(0, size[1] - 200)
+        draw.rectangle((x, y, x + rng.randrange(100, 300), y + rng.randrange(50, 200)),
+                       fill=(rng.randrange(40, 120), rng.randrange(40, 120), rng.randrange(40, 120)))
+
+    truth = []
+    for _ in range(8):
+        text = " ".join(rng.sample(WORDS, 3))
+        font_size = rng.choice((14, 18, 24, 32))
+        x, y = rng.randrange(0, size[0] - 500), rng.randrange(0, size[1] - 60)
+        draw.text((x, y), text, fill=(240, 240, 240), font_size=font_size)
+        truth.append((text, draw.textbbox((x, y), text, font_size=font_size)))
+    return img, truth
+
+
+def box_recall(truth, regions):
+    """정답 텍스트 박스가 검출 영역 안에 (면적 90% 이상) 들어간 비율"""
+    found = 0
+    for _, (x1, y1, x2, y2) in truth:
+        area = max(1, (x2 - x1) * (y2 - y1))
+        for rx1, ry1, rx2, ry2 in regions:
+            ix = max(0, min(x2, rx2) - max(x1, rx1))
+            iy = max(0, min(y2, ry2) - max(y1, ry1))
+            if ix * iy >= area * 0.9:
+                found += 1
+                break
+    return found / max(1, len(truth))
+
+
+def word_recall(truth, data):
+    expected = [w for text, _ in truth for w in text.split()]
+    recognized = {w.strip() for w in data['text'] if w.strip()}
+    return sum(1 for w in expected if w in recognized) / max(1, len(expected))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 영역 사전 검출 벤치마크")
+    parser.add_argument('--samples', type=int, default=5)
+    parser.add_argument('--tesseract', default='', help="지정하면 OCR 시간/단어 재현율도 비교")
+    parser.add_argument('--lang', default='eng')
+    args = parser.parse_args()
+
+    screenshots = [make_screenshot(seed) for seed in range(args.samples)]
+
+    detect_times, recalls, coverage = [], [], []
+    for img, truth in screenshots:
+        start = time.perf_counter()
+        regions = text_regions.detect_regions(img)
+        detect_times.append(time.perf_counter() - start)
+        recalls.append(box_recall(truth, regions))
+        covered = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in regions)
+        coverage.append(covered / (img.size[0] * img.size[1]))
+
+    print(f"샘플 {args.samples}장 (1920x1080)")
+    print(f"검출 시간 중앙값: {statistics.median(detect_times) * 1000:.1f}ms")
+    print(f"영역 재현율 평균: {statistics.mean(recalls):.1%}")
+    print(f"OCR 대상 면적 비율 평균: {statistics.mean(coverage):.1%}")
+
+    if not args.tesseract:
+        return
+
+    import ocr_engine
+    engine = ocr_engine.create_engine(args.tesseract)
+    print(f"{'방식':<12}{'OCR(ms)':>10}{'단어 재현율':>12}")
+    for label, use_detection in (("전체 이미지", False), ("사전 검출", True)):
+        times, word_recalls = [], []
+        for img, truth in screenshots:
+            start = time.perf_counter()
+            if use_detection:
+                data = text_regions.ocr_with_detection(engine, img, args.lang)
+            else:
+                data = engine.image_to_data(img, args.lang)
+            times.append(time.perf_counter() - start)
+            word_recalls.append(word_recall(truth, data))
+        print(f"{label:<12}{statistics.median(times) * 1000:>10.1f}{statistics.mean(word_recalls):>12.1%}")
+    engine.close()
+
+
+if __name__ == '__main__':
+    main()
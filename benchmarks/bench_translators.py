@@ -0,0 +1,94 @@
+"""
+번역 백엔드 비교: 같은 합성 OCR 결과(줄 목록)를 각 백엔드로 번역해 지연 시간과 처리량을 잽니다.
+- stub   : 네트워크 없는 가짜 번역기 (하한선)
+- http   : 로컬 HTTP 번역 서버 (mock_translate_server, --http-latency 로 지연 흉내)
+- router : 429를 섞어 보내는 HTTP 서버 → stub 대체 (라우터의 대체 비용)
+- argos  : Argos Translate 오프라인 모델 (설치된 경우)
+- deepl  : DeepL API (--deepl-key 를 준 경우, 사용량이 차감됩니다)
+
+사용법:
+    python benchmarks/bench_translators.py --lines 40 --repeat 20 --http-latency 0.05
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import translation  # noqa: E402
+import translators  # noqa: E402
+from bench_grouping import make_data  # noqa: E402
+from mock_translate_server import start_in_background  # noqa: E402
+from ocr_model import group_lines  # noqa: E402
+from translation_cache import TranslationCache  # noqa: E402
+
+
+def bench(translator, texts, source_lang, target_lang, repeat):
+    """캡처 한 건 분량(texts)을 번역 메모리 없이 repeat번 번역해 (p50, p95, 초당 줄 수)를 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        cache = TranslationCache(':memory:')
+        start = time.perf_counter()
+        translation.translate_lines(translator, cache, texts, source_lang, target_lang)
+        timings.append(time.perf_counter() - start)
+        cache.close()
+    timings.sort()
+    total = sum(timings)
+    return (statistics.median(timings) * 1000,
+            timings[int((len(timings) - 1) * 0.95)] * 1000,
+            len(texts) * repeat / total if total > 0 else 0.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역 백엔드 지연 시간/처리량 벤치마크")
+    parser.add_argument('--lines', type=int, default=40, help="캡처 한 건의 줄 수")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--source', default='eng', help="OCR 언어 코드")
+    parser.add_argument('--target', default='KO', help="대상 언어 코드")
+    parser.add_argument('--http-latency', type=float, default=0.05, help="로컬 HTTP 서버 응답 지연 (초)")
+    parser.add_argument('--rate-limit', type=float, default=0.3, help="router 항목에서 429로 응답할 비율")
+    parser.add_argument('--deepl-key', default='', help="DeepL API 키 (주면 DeepL도 측정)")
+    args = parser.parse_args()
+
+    # 모든 백엔드가 같은 OCR 결과를 번역하도록 줄 목록을 한 번만 만듭니다.
+    texts = [line.text for line in group_lines(make_data(args.lines))]
+
+    http_server, http_url = start_in_background(latency=args.http_latency)
+    limited_server, limited_url = start_in_background(latency=args.http_latency, rate_limit=args.rate_limit)
+
+    candidates = [
+        ('stub', lambda: translation.StubTranslator()),
+        ('http', lambda: translators.HttpBackend(http_url)),
+        # 429를 받으면 Retry-After(1초) 동안 stub으로 대체됩니다.
+        ('router', lambda: translators.TranslatorRouter([translators.HttpBackend(limited_url),
+                                                         translation.StubTranslator()])),
+    ]
+    if translators.ArgosBackend.is_installed():
+        candidates.append(('argos', translators.ArgosBackend))
+    if args.deepl_key:
+        candidates.append(('deepl', lambda: translators.DeepLBackend(args.deepl_key)))
+
+    print(f"줄 {len(texts)}개/캡처, 반복 {args.repeat}회, HTTP 지연 {args.http_latency * 1000:.0f}ms")
+    print(f"{'백엔드':<10}{'p50(ms)':>10}{'p95(ms)':>10}{'줄/초':>10}")
+    try:
+        for name, factory in candidates:
+            try:
+                translator = factory()
+                p50, p95, throughput = bench(translator, texts, args.source, args.target, args.repeat)
+            except Exception as e:
+                print(f"{name:<10}건너뜀: {type(e).__name__}: {e}")
+                continue
+            print(f"{name:<10}{p50:>10.1f}{p95:>10.1f}{throughput:>10.0f}")
+            if isinstance(translator, translators.TranslatorRouter):
+                for backend, (calls, failures, latency, _) in translator.stats().items():
+                    latency_text = f"{latency * 1000:.1f}ms" if latency is not None else "-"
+                    print(f"{'':<10}  {backend}: 호출 {calls}, 실패 {failures}, 평균 {latency_text}")
+    finally:
+        http_server.shutdown()
+        limited_server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+벤치마크용 정답(golden) 스크린샷 모음: 알고 있는 문장을 언어/글꼴/크기/테마별로 그려
+합성 캡처 이미지와 정답 줄 목록, 단어 박스(Output.DICT 형식)를 만듭니다.
+같은 글꼴 파일이면 실행마다 픽셀 단위로 같은 이미지가 나옵니다.
+
+사용법 (이미지와 정답 JSON을 폴더로 저장해 눈으로 확인):
+    python benchmarks/golden_corpus.py --out golden_corpus
+"""
+import argparse
+import json
+import os
+import re
+
+from PIL import Image, ImageDraw, ImageFont
+
+# 언어별 정답 문장 (게임/앱 화면에 흔한 UI 문구와 대사)
+CORPUS_TEXT = {
+    'eng': [
+        "The quick brown fox jumps over the lazy dog.",
+        "Press START to continue your adventure.",
+        "Settings  Audio  Video  Controls",
+        "HP 120/150   MP 45/60   Lv. 23",
+        "Quest complete! You received 350 gold.",
+        "Are you sure you want to quit without saving?",
+    ],
+    'kor': [
+        "다람쥐 헌 쳇바퀴에 타고파",
+        "계속하려면 시작 버튼을 누르세요",
+        "설정  소리  화면  조작",
+        "퀘스트 완료! 350 골드를 받았습니다.",
+        "저장하지 않고 종료하시겠습니까?",
+    ],
+    'jpn': [
+        "いろはにほへと ちりぬるを",
+        "スタートボタンを押してください",
+        "設定 サウンド 画面 操作",
+        "クエスト完了！350ゴールドを獲得しました。",
+        "保存せずに終了しますか？",
+    ],
+    'chi_sim': [
+        "敏捷的棕色狐狸跳过了懒狗",
+        "按开始键继续冒险",
+        "设置 声音 画面 操作",
+        "任务完成！获得350金币。",
+        "确定不保存就退出吗？",
+    ],
+}
+
+# 언어별 글꼴 후보 (Windows / Linux / macOS 순). 설치된 것만 사용합니다.
+CORPUS_FONTS = {
+    'eng': ('arial.ttf', 'times.ttf', 'consola.ttf',
+            'DejaVuSans.ttf', 'DejaVuSerif.ttf', 'DejaVuSansMono.ttf', 'Helvetica.ttc'),
+    'kor': ('malgun.ttf', 'gulim.ttc', 'NanumGothic.ttf', 'NanumMyeongjo.ttf',
+            'NotoSansCJK-Regular.ttc', 'AppleSDGothicNeo.ttc'),
+    'jpn': ('meiryo.ttc', 'msgothic.ttc', 'YuGothM.ttc',
+            'NotoSansCJK-Regular.ttc', 'ヒラギノ角ゴシック W3.ttc'),
+    'chi_sim': ('msyh.ttc', 'simsun.ttc', 'NotoSansCJK-Regular.ttc', 'PingFang.ttc'),
+}
+
+# 글자 크기 (px)
+CORPUS_SIZES = (14, 20, 28)
+
+# 테마: (배경색, 글자색)
+CORPUS_THEMES = {
+    'light': ('#ffffff', '#000000'),
+    'dark': ('#1e1e1e', '#dcdcdc'),
+    'game': ('#14213d', '#fca311'),
+}
+
+# 단어를 공백으로 나누지 않는 언어 (정확도 비교 시 공백을 무시하고 WER은 계산하지 않음)
+NO_SPACE_LANGS = ('jpn', 'chi_sim', 'chi_tra')
+
+MARGIN = 16
+LINE_SPACING = 1.8
+
+
+class GoldenSample:
+    """합성 캡처 한 장과 그 정답"""
+    __slots__ = ('name', 'lang', 'font', 'size', 'theme', 'image', 'lines', 'data')
+
+    def __init__(self, name, lang, font, size, theme, image, lines, data):
+        self.name = name
+        self.lang = lang
+        self.font = font
+        self.size = size
+        self.theme = theme
+        self.image = image
+        self.lines = lines
+        self.data = data
+
+    def to_json(self):
+        return {'name': self.name, 'lang': self.lang, 'font': self.font, 'size': self.size,
+                'theme': self.theme, 'lines': self.lines}
+
+
+def available_fonts(lang, limit=2):
+    """언어의 글꼴 후보 중 설치된 것을 최대 limit개 반환합니다."""
+    found = []
+    for name in CORPUS_FONTS.get(lang, ()):
+        try:
+            ImageFont.truetype(name, 20)
+        except OSError:
+            continue
+        found.append(name)
+        if len(found) >= limit:
+            break
+    return found
+
+
+def _empty_data():
+    return {k: [] for k in ('level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+                            'left', 'top', 'width', 'height', 'conf', 'text')}
+
+
+def render_sample(lang, font_name, size, theme, lines=None):
+    """
+    문장들을 한 줄씩 그린 이미지와, 각 단어의 실제 박스로 만든 Output.DICT 형식 정답 데이터를 반환합니다.
+    (정답 데이터는 OCR 없이 줄 그룹화/배치만 측정할 때 씁니다)
+    """
+    lines = lines or CORPUS_TEXT[lang]
+    background, foreground = CORPUS_THEMES[theme]
+    font = ImageFont.truetype(font_name, size)
+    line_step = round(size * LINE_SPACING)
+    width = MARGIN * 2 + max(round(font.getlength(line)) for line in lines)
+    height = MARGIN * 2 + line_step * len(lines)
+
+    img = Image.new('RGB', (width, height), background)
+    draw = ImageDraw.Draw(img)
+    data = _empty_data()
+    for line_num, line in enumerate(lines, 1):
+        top = MARGIN + (line_num - 1) * line_step
+        draw.text((MARGIN, top), line, fill=foreground, font=font)
+        for word_num, match in enumerate(re.finditer(r'\S+', line), 1):
+            # 단어 앞까지 그린 폭만큼 띄운 위치에서 단어의 실제 박스를 잽니다.
+            word = match.group()
+            x1, y1, x2, y2 = draw.textbbox((MARGIN + font.getlength(line[:match.start()]), top), word, font=font)
+            data['level'].append(5)
+            data['page_num'].append(1)
+            data['block_num'].append(1)
+            data['par_num'].append(1)
+            data['line_num'].append(line_num)
+            data['word_num'].append(word_num)
+            data['left'].append(round(x1))
+            data['top'].append(round(y1))
+            data['width'].append(round(x2 - x1))
+            data['height'].append(round(y2 - y1))
+            data['conf'].append(100)
+            data['text'].append(word)
+    return img, data
+
+
+def build_corpus(langs=None, sizes=CORPUS_SIZES, themes=None, fonts_per_lang=2):
+    """
+    언어 x 글꼴 x 크기 x 테마 조합의 GoldenSample 목록과, 글꼴이 없어 건너뛴 언어 목록을 반환합니다.
+    """
+    samples = []
+    skipped = []
+    for lang in langs or list(CORPUS_TEXT):
+        fonts = available_fonts(lang, fonts_per_lang)
+        if not fonts:
+            skipped.append(lang)
+            continue
+        for font_name in fonts:
+            for size in sizes:
+                for theme in themes or list(CORPUS_THEMES):
+                    img, data = render_sample(lang, font_name, size, theme)
+                    name = f"{lang}-{os.path.splitext(font_name)[0]}-{size}px-{theme}"
+                    samples.append(GoldenSample(name, lang, font_name, size, theme, img,
+                                                list(CORPUS_TEXT[lang]), data))
+    return samples, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정답 스크린샷 모음을 이미지/JSON으로 저장")
+    parser.add_argument('--out', default='golden_corpus', help="저장할 폴더")
+    parser.add_argument('--langs', nargs='+', default=None, help=f"언어 (기본: {' '.join(CORPUS_TEXT)})")
+    args = parser.parse_args()
+
+    samples, skipped = build_corpus(args.langs)
+    os.makedirs(args.out, exist_ok=True)
+    for sample in samples:
+        sample.image.save(os.path.join(args.out, sample.name + '.png'))
+        with open(os.path.join(args.out, sample.name + '.json'), 'w', encoding='utf-8') as f:
+            json.dump(sample.to_json(), f, ensure_ascii=False, indent=2)
+    print(f"{len(samples)}장 저장: {args.out}")
+    for lang in skipped:
+        print(f"{lang}: 설치된 글꼴이 없어 건너뜀 ({', '.join(CORPUS_FONTS[lang])})")
+
+
+if __name__ == '__main__':
+    main()
@@ -23,6 +23,11 @@ def save_config(config_data):
     with open(CONFIG_FILE, 'w') as f:
         json.dump(config_data, f, indent=4)
 
+# OCR 전처리 프리셋 이름(단계 구성은 preprocess.PRESETS)과 캡처 방식별 기본값
+# 창을 띄울 때 NumPy를 불러오지 않도록 이름만 여기에 둡니다.
+PREPROCESS_PRESET_NAMES = ('none', 'fast', 'ui', 'accurate')
+DEFAULT_PREPROCESS_PRESETS = {'region': 'ui', 'full': 'fast', 'watch': 'ui'}
+
 # 프로그램 시작 시 설정 불러오기
 CONFIG = load_config()
 
@@ -30,4 +35,59 @@ def get_tesseract_path():
     return CONFIG.get('tesseract_path', '')
 
 def get_deepl_key():
-    return CONFIG.get('deepl_api_key', '')
\ No newline at end of file
+    return CONFIG.get('deepl_api_key', '')
+
+def get_preprocess_presets():
+    """캡처 방식(region/full/watch)별 OCR 전처리 프리셋 이름"""
+    return CONFIG.get('preprocess_presets', {})
+
+def is_tracing_enabled():
+    """단계별 처리 시간 추적 사용 여부 (기본: 사용)"""
+    return CONFIG.get('tracing_enabled', True)
+
+def get_trace_file():
+    """(선택) 단계별 처리 시간을 JSONL로 남길 파일 경로. 비어 있으면 파일에 기록하지 않습니다."""
+    return CONFIG.get('trace_file', '')
+
+def get_translator_backend():
+    """번역 엔진 선택 (auto, deepl, argos, http, stub). auto는 DeepL 우선, 실패/지연 시 Argos로 대체합니다."""
+    return CONFIG.get('translator_backend', 'auto')
+
+def get_http_translator_url():
+    """(선택) HTTP 번역 서버 주소 (translator_backend가 http일 때 사용)"""
+    return CONFIG.get('http_translator_url', 'http://127.0.0.1:8765/translate')
+
+def get_deepl_char_budget():
+    """
+    (선택) DeepL 과금 주기(한 달) 동안 쓸 최대 글자 수. 넘으면 다른 엔진을 씁니다. (0이면 제한 없음)
+    사용량은 DeepL 계정의 get_usage 값이므로 다른 프로그램에서 쓴 글자도 포함되고, 프로그램을 다시 시작해도 이어집니다.
+    """
+    return CONFIG.get('deepl_char_budget', 0)
+
+def is_ocr_cache_persistent():
+    """OCR 결과 캐시를 파일(ocr_cache.db)에도 저장해 다음 실행에서 재사용할지 여부 (기본: 메모리만)"""
+    return CONFIG.get('ocr_cache_persistent', False)
+
+def get_ocr_cache_max_mb():
+    """OCR 결과 메모리 캐시 최대 크기(MB)"""
+    return CONFIG.get('ocr_cache_max_mb', 8)
+
+def get_ocr_cache_max_age():
+    """OCR 결과 캐시 항목 유효 시간(초). 지나면 같은 화면도 다시 OCR 합니다."""
+    return CONFIG.get('ocr_cache_max_age', 3600)
+
+def is_history_enabled():
+    """캡처마다 OCR/번역 결과와 썸네일을 번역 기록(history.db)에 남길지 여부 (기본: 사용)"""
+    return CONFIG.get('history_enabled', True)
+
+def get_ocr_min_conf():
+    """OCR 단어 신뢰도(0~100)가 이 값보다 낮으면 잡음으로 보고 번역하지 않습니다. (0이면 모두 번역)"""
+    return CONFIG.get('ocr_min_conf', 30)
+
+def get_ocr_retry_conf():
+    """줄 신뢰도가 이 값보다 낮으면 그 줄만 잘라 더 크게 키워 다시 인식합니다. (0이면 다시 인식하지 않음)"""
+    return CONFIG.get('ocr_retry_conf', 60)
+
+def get_east_model_path():
+    """(선택) OpenCV EAST 텍스트 검출 모델(.pb) 경로. 비어 있으면 NumPy 방식으로 검출합니다."""
+    return CONFIG.get('east_model_path', '')
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""
+DeepL 클라이언트 계층: deepl.Translator 하나를 계속 재사용하면서
+- 시작 시 연결을 미리 맺고(warm_up), 한동안 쓰지 않아도 연결이 끊기지 않게 유지하고,
+- 같은 내용의 요청이 동시에 들어오면 한 번만 보내 결과를 나눠 주고,
+- 429/일시 오류는 Retry-After를 따르는 지수 백오프(지터 포함)로 다시 시도하고,
+- 사용량은 로컬에서 세어 get_usage()는 가끔만 호출합니다.
+"""
+import random
+import threading
+import time
+
+import deepl
+
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+# 재시도 대기를 모두 합쳐 이 시간을 넘길 것 같으면 바로 실패시켜 다른 번역 엔진으로 넘깁니다.
+RETRY_BUDGET_SECONDS = 10.0
+# 사용량 조회 주기: 이 시간이 지났거나 마지막 조회 뒤 이만큼 보냈을 때만 get_usage()를 호출합니다.
+USAGE_CHECK_SECONDS = 600
+USAGE_CHECK_CHARACTERS = 20000
+# 마지막 요청 뒤 이 시간 동안은, 연결이 이만큼 쉬면 가벼운 요청으로 연결을 유지합니다.
+KEEPALIVE_IDLE_SECONDS = 45
+KEEPALIVE_WINDOW_SECONDS = 600
+
+
+class _InFlight:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def backoff_delay(attempt, retry_after=None):
+    """attempt번째 재시도 전 대기 시간. Retry-After가 있으면 따르고, 없으면 지터를 준 지수 백오프"""
+    if retry_after is not None:
+        return retry_after + random.uniform(0, BACKOFF_BASE_SECONDS)
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+    # full jitter: 동시에 429를 받은 요청들이 같은 순간에 다시 몰리지 않게 합니다.
+    return random.uniform(0, delay)
+
+
+def _is_retryable(error):
+    if isinstance(error, deepl.TooManyRequestsException):
+        return True
+    if isinstance(error, deepl.ConnectionException):
+        return error.should_retry
+    status = getattr(error, 'http_status_code', None)
+    return status is not None and status >= 500
+
+
+class DeepLClient:
+    """deepl.Translator를 감싸는 재사용 클라이언트 (여러 스레드에서 함께 써도 됩니다)."""
+
+    def __init__(self, api_key):
+        # 재시도는 이 계층에서 하므로 라이브러리 자체 재시도(Retry-After 무시, 최대 수 분 대기)는 끕니다.
+        # deepl 모듈 전역 설정이라 이 프로세스의 다른 deepl.Translator에도 적용됩니다.
+        # (import만으로 바뀌지 않도록 클라이언트를 만들 때 설정)
+        deepl.http_client.max_network_retries = 0
+        self.api_key = api_key
+        self.translator = deepl.Translator(api_key)
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._last_request = 0.0
+        # 429 응답의 Retry-After. 응답 훅은 요청을 보낸 스레드에서 실행되므로 스레드별로 둡니다.
+        # (여러 번역 스레드가 동시에 요청해도 자기 요청의 값만 읽음)
+        self._local = threading.local()
+        self._closed = threading.Event()
+        self._keepalive_thread = None
+
+        # 사용량: 마지막 get_usage() 값 + 그 뒤 로컬에서 보낸 글자 수
+        self.character_count = None
+        self.character_limit = None
+        self._usage_checked_at = 0.0
+        self._characters_since_check = 0
+
+        self._install_retry_after_hook()
+
+    def _install_retry_after_hook(self):
+        """
+        deepl 예외에는 응답 헤더가 없으므로, 세션 응답 훅에서 429의 Retry-After를 기억해 둡니다.
+        SDK 내부 속성(_client._session)에 기대므로, 구조가 바뀌어 찾지 못하면 훅 없이
+        지수 백오프만 사용합니다.
+        """
+        session = getattr(getattr(self.translator, '_client', None), '_session', None)
+        hooks = getattr(session, 'hooks', None)
+        if not isinstance(hooks, dict) or not isinstance(hooks.get('response'), list):
+            return
+
+        def remember_retry_after(response, *args, **kwargs):
+            if response.status_code == 429:
+                value = response.headers.get('Retry-After', '')
+                self._local.retry_after = float(value) if value.isdigit() else None
+
+        hooks['response'].append(remember_retry_after)
+
+    # ---------------------------------------------------------
+    # 연결 유지
+    # ---------------------------------------------------------
+    def warm_up(self):
+        """TLS 연결을 미리 맺고 사용량을 채워 둡니다. 이후 연결 유지 스레드를 시작합니다."""
+        self.refresh_usage()
+        if self._keepalive_thread is None:
+            self._keepalive_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
+            self._keepalive_thread.start()
+
+    def _keepalive_loop(self):
+        while not self._closed.wait(KEEPALIVE_IDLE_SECONDS / 3):
+            idle = time.monotonic() - self._last_request
+            # 최근에 쓴 적이 있고 연결이 쉬고 있을 때만 깨웁니다. (오래 안 쓰면 그냥 둠)
+            if KEEPALIVE_IDLE_SECONDS <= idle < KEEPALIVE_WINDOW_SECONDS:
+                try:
+                    self.refresh_usage()
+                except deepl.DeepLException:
+                    pass
+
+    # ---------------------------------------------------------
+    # 사용량
+    # ---------------------------------------------------------
+    def refresh_usage(self):
+        """get_usage()로 사용량을 다시 읽습니다. (연결 유지용 요청도 겸함)"""
+        self._last_request = time.monotonic()
+        usage = self.translator.get_usage()
+        with self._lock:
+            if usage.character.valid:
+                self.character_count = usage.character.count
+                self.character_limit = usage.character.limit
+            self._usage_checked_at = time.monotonic()
+            self._characters_since_check = 0
+
+    def used_characters(self):
+        """이번 과금 주기에 계정에서 쓴 글자 수 추정값 (get_usage 값 + 그 뒤 보낸 글자 수, 모르면 None)"""
+        with self._lock:
+            if self.character_count is None:
+                return None
+            return self.character_count + self._characters_since_check
+
+    def remaining_characters(self):
+        """남은 글자 수 추정값 (사용량을 아직 모르면 None)"""
+        with self._lock:
+            if self.character_limit is None:
+                return None
+            return self.character_limit - self.character_count - self._characters_since_check
+
+    def _usage_check_due(self):
+        with self._lock:
+            return (time.monotonic() - self._usage_checked_at >= USAGE_CHECK_SECONDS
+                    or self._characters_since_check >= USAGE_CHECK_CHARACTERS)
+
+    # ---------------------------------------------------------
+    # 번역
+    # ---------------------------------------------------------
+    def translate_text(self, texts, target_lang):
+        """
+        같은 (텍스트 목록, 대상 언어) 요청이 이미 진행 중이면 그 결과를 기다려 함께 받습니다.
+        """
+        key = (tuple(texts), target_lang)
+        with self._lock:
+            flight = self._in_flight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._in_flight[key] = _InFlight()
+
+        if not owner:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._translate_with_retry(list(texts), target_lang)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.event.set()
+
+    def _translate_with_retry(self, texts, target_lang):
+        characters = sum(len(text) for text in texts)
+        if self._usage_check_due():
+            try:
+                self.refresh_usage()
+            except deepl.DeepLException:
+                # 사용량 조회 실패는 번역을 막지 않습니다.
+                pass
+        remaining = self.remaining_characters()
+        if remaining is not None and remaining < characters:
+            raise deepl.QuotaExceededException(f"남은 글자 수 {max(0, remaining)}자 (요청 {characters}자)")
+
+        spent = 0.0
+        for attempt in range(MAX_RETRIES + 1):
+            self._local.retry_after = None
+            self._last_request = time.monotonic()
+            try:
+                results = self.translator.translate_text(texts, target_lang=target_lang)
+            except deepl.DeepLException as e:
+                retry_after = self._local.retry_after
+                if attempt == MAX_RETRIES or not _is_retryable(e):
+                    e.retry_after = retry_after
+                    raise
+                delay = backoff_delay(attempt, retry_after)
+                if spent + delay > RETRY_BUDGET_SECONDS:
+                    e.retry_after = retry_after
+                    raise
+                spent += delay
+                time.sleep(delay)
+                continue
+
+            with self._lock:
+                self._characters_since_check += characters
+            return results
+
+    def close(self):
+        self._closed.set()
+        self.translator.close()
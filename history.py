@@ -0,0 +1,299 @@
+"""
+번역 기록 저장소: 캡처마다 OCR 줄, 박스, 번역, 단계별 시간과 압축 썸네일을 SQLite에 남기고
+FTS5 전문 검색 색인으로 지난 캡처를 빠르게 찾습니다. CSV/JSONL로 내보낼 수 있습니다.
+
+기록은 큐에 넣기만 하고 별도 스레드가 모아서 한 트랜잭션으로 씁니다. (캡처/번역 경로를 막지 않음)
+큐에는 원본 프레임 대신 정수 배율로 줄인 작은 사본만 넣어, 쓰기가 밀려도 전체 화면 이미지를 붙잡아 두지 않습니다.
+썸네일 리사이즈와 JPEG 인코딩은 쓰기 스레드에서 합니다.
+"""
+import csv
+import io
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import config
+
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(config.CONFIG_FILE)), 'history.db')
+# 썸네일 최대 크기(px)와 JPEG 품질
+THUMBNAIL_SIZE = 320
+THUMBNAIL_QUALITY = 70
+# 쓰기 스레드가 한 번에 모아 쓰는 최대 건수와, 첫 건을 받은 뒤 더 모으며 기다리는 시간 (초)
+BATCH_SIZE = 50
+FLUSH_SECONDS = 1.0
+# 쓰기가 밀려 큐가 이만큼 차면 새 기록은 버립니다. (메모리가 계속 늘지 않도록)
+MAX_PENDING = 200
+# 검색 결과 최대 건수
+SEARCH_LIMIT = 500
+# trigram 색인은 3글자 미만 검색어를 찾지 못하므로 그보다 짧으면 LIKE로 찾습니다.
+MIN_FTS_QUERY = 3
+
+_STOP = object()
+
+CSV_COLUMNS = ('id', 'created', 'ocr_lang', 'target_lang', 'source_text', 'translated_text')
+
+
+def reduce_for_thumbnail(img):
+    """썸네일 크기의 두 배 정도까지 정수 배율로 줄인 사본 (Image.reduce: 픽셀 평균 한 번이라 가벼움)"""
+    factor = max(1, max(img.size) // (THUMBNAIL_SIZE * 2))
+    return img.reduce(factor)
+
+
+def make_thumbnail(img):
+    """캡처 이미지를 긴 변 THUMBNAIL_SIZE 이하의 JPEG 바이트로 만듭니다."""
+    from PIL import Image
+    scale = min(1.0, THUMBNAIL_SIZE / max(img.size))
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    thumb = img.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0) if scale < 1 else img
+    if thumb.mode != 'RGB':
+        thumb = thumb.convert('RGB')
+    buffer = io.BytesIO()
+    thumb.save(buffer, 'JPEG', quality=THUMBNAIL_QUALITY)
+    return buffer.getvalue()
+
+
+def _fts_phrase(text):
+    """검색어를 FTS5 구문 문자열로 감쌉니다. (연산자/특수문자를 그대로 찾도록)"""
+    return '"' + text.replace('"', '""') + '"'
+
+
+class HistoryStore:
+    """
+    번역 기록 저장소. record()는 큐에 넣고 바로 반환하며, 검색/내보내기는 별도 읽기 연결을 씁니다.
+    (쓰기 스레드와 읽기 연결이 같은 파일을 따로 열므로 path는 ':memory:'가 아닌 파일 경로여야 합니다.)
+    """
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.fts = False
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=MAX_PENDING)
+        self._read_lock = threading.Lock()
+        self._reader = None
+        self._writer = None
+
+        try:
+            db = sqlite3.connect(path)
+            self._create_schema(db)
+            db.close()
+            self._reader = sqlite3.connect(path, check_same_thread=False)
+        except sqlite3.Error:
+            # DB 파일을 열 수 없으면 기록하지 않습니다.
+            self._reader = None
+            return
+        self._writer = threading.Thread(target=self._write_loop, name='history-writer', daemon=True)
+        self._writer.start()
+
+    def _create_schema(self, db):
+        # WAL: 쓰기 스레드가 쓰는 동안에도 기록 창에서 검색할 수 있습니다.
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS captures ("
+            " id INTEGER PRIMARY KEY,"
+            " created REAL NOT NULL,"
+            " ocr_lang TEXT,"
+            " target_lang TEXT,"
+            " bbox TEXT,"
+            " source_text TEXT NOT NULL,"
+            " translated_text TEXT NOT NULL,"
+            " lines TEXT NOT NULL,"
+            " timings TEXT NOT NULL,"
+            " thumbnail BLOB)"
+        )
+        try:
+            # trigram 토크나이저(SQLite 3.34+)는 띄어쓰기가 없는 한국어/일본어도 부분 문자열로 찾을 수 있습니다.
+            try:
+                db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS captures_fts USING fts5("
+                           "source_text, translated_text, content='captures', content_rowid='id', tokenize='trigram')")
+            except sqlite3.OperationalError as e:
+                if 'trigram' not in str(e):
+                    raise
+                db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS captures_fts USING fts5("
+                           "source_text, translated_text, content='captures', content_rowid='id')")
+            db.execute("CREATE TRIGGER IF NOT EXISTS captures_ai AFTER INSERT ON captures BEGIN"
+                       " INSERT INTO captures_fts(rowid, source_text, translated_text)"
+                       " VALUES (new.id, new.source_text, new.translated_text); END")
+            db.execute("CREATE TRIGGER IF NOT EXISTS captures_ad AFTER DELETE ON captures BEGIN"
+                       " INSERT INTO captures_fts(captures_fts, rowid, source_text, translated_text)"
+                       " VALUES ('delete', old.id, old.source_text, old.translated_text); END")
+            self.fts = True
+        except sqlite3.OperationalError:
+            # FTS5 없이 빌드된 SQLite에서는 LIKE 검색으로 대체합니다.
+            self.fts = False
+        db.commit()
+
+    # ------------------------------------------------------------------
+    # 기록 (캡처 경로에서 호출)
+    # ------------------------------------------------------------------
+    def record(self, img, lines, translated, boxes=None, timings=None, ocr_lang='', target_lang=''):
+        """
+        캡처 한 건을 쓰기 큐에 넣습니다. 큐가 가득 차면 버리고 False를 반환합니다.
+        호출한 스레드(파이프라인 작업 스레드)에서는 이미지를 reduce_for_thumbnail로 줄이기만 하고,
+        썸네일 인코딩은 쓰기 스레드에서 합니다.
+        """
+        if self._writer is None:
+            return False
+        if self._queue.full():
+            self.dropped += 1
+            return False
+        bbox = img.info.get('bbox') if img is not None else None
+        small = reduce_for_thumbnail(img) if img is not None else None
+        entry = (time.time(), bbox, small, list(lines), list(translated), list(boxes) if boxes else None,
+                 dict(timings or {}), ocr_lang, target_lang)
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _to_row(self, entry):
+        created, bbox, small, lines, translated, boxes, timings, ocr_lang, target_lang = entry
+        thumbnail = None
+        if small is not None:
+            try:
+                thumbnail = make_thumbnail(small)
+            except (OSError, ValueError):
+                thumbnail = None
+        items = [{'text': line.text, 'translated': text, 'box': [line.left, line.top, line.width, line.height]}
+                 for line, text in zip(lines, translated)]
+        if boxes:
+            # 빈 번역 줄은 배치 박스가 없으므로 번역문으로 줄을 찾아 붙입니다.
+            layout_by_text = {}
+            for box in boxes:
+                layout_by_text.setdefault(box.text, []).append(
+                    [box.left, box.top, box.width, box.height, box.font_size])
+            for item in items:
+                placed = layout_by_text.get(" ".join(item['translated'].split()))
+                if placed:
+                    item['layout'] = placed.pop(0)
+        return (created, ocr_lang, target_lang, json.dumps(list(bbox)) if bbox else None,
+                "\n".join(line.text for line in lines), "\n".join(translated),
+                json.dumps(items, ensure_ascii=False),
+                json.dumps({k: round(v, 6) for k, v in timings.items()}), thumbnail)
+
+    def _write_loop(self):
+        db = sqlite3.connect(self.path)
+        try:
+            while True:
+                entry = self._queue.get()
+                if entry is _STOP:
+                    return
+                batch = [entry]
+                deadline = time.monotonic() + FLUSH_SECONDS
+                stop = False
+                while len(batch) < BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        entry = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if entry is _STOP:
+                        stop = True
+                        break
+                    batch.append(entry)
+                rows = [self._to_row(entry) for entry in batch]
+                del batch
+                try:
+                    db.executemany("INSERT INTO captures (created, ocr_lang, target_lang, bbox, source_text,"
+                                   " translated_text, lines, timings, thumbnail) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   rows)
+                    db.commit()
+                except sqlite3.Error:
+                    db.rollback()
+                if stop:
+                    return
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 검색/조회/내보내기 (기록 창에서 호출)
+    # ------------------------------------------------------------------
+    def search(self, text='', limit=SEARCH_LIMIT):
+        """
+        원문/번역에 text가 들어간 기록을 최신순으로 반환합니다. (text가 비면 최근 기록)
+        각 항목: (id, created, ocr_lang, target_lang, source_text, translated_text)
+        """
+        if self._reader is None:
+            return []
+        text = text.strip()
+        columns = "c.id, c.created, c.ocr_lang, c.target_lang, c.source_text, c.translated_text"
+        with self._read_lock:
+            if not text:
+                return self._reader.execute(f"SELECT {columns} FROM captures c ORDER BY c.id DESC LIMIT ?",
+                                            (limit,)).fetchall()
+            if self.fts and len(text) >= MIN_FTS_QUERY:
+                return self._reader.execute(
+                    f"SELECT {columns} FROM captures_fts f JOIN captures c ON c.id = f.rowid"
+                    " WHERE captures_fts MATCH ? ORDER BY c.id DESC LIMIT ?", (_fts_phrase(text), limit)).fetchall()
+            pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            return self._reader.execute(
+                f"SELECT {columns} FROM captures c WHERE c.source_text LIKE ? ESCAPE '\\'"
+                " OR c.translated_text LIKE ? ESCAPE '\\' ORDER BY c.id DESC LIMIT ?",
+                (pattern, pattern, limit)).fetchall()
+
+    def get(self, capture_id):
+        """기록 한 건의 상세 (dict, 썸네일은 JPEG 바이트). 없으면 None."""
+        if self._reader is None:
+            return None
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT id, created, ocr_lang, target_lang, bbox, source_text, translated_text, lines, timings,"
+                " thumbnail FROM captures WHERE id = ?", (capture_id,)).fetchone()
+        if row is None:
+            return None
+        return {'id': row[0], 'created': row[1], 'ocr_lang': row[2], 'target_lang': row[3],
+                'bbox': json.loads(row[4]) if row[4] else None, 'source_text': row[5], 'translated_text': row[6],
+                'lines': json.loads(row[7]), 'timings': json.loads(row[8]), 'thumbnail': row[9]}
+
+    def count(self):
+        if self._reader is None:
+            return 0
+        with self._read_lock:
+            return self._reader.execute("SELECT COUNT(*) FROM captures").fetchone()[0]
+
+    def export(self, path, text='', fmt=None):
+        """
+        검색 결과(text가 비면 전체)를 CSV 또는 JSONL로 저장하고 건수를 반환합니다.
+        fmt를 주지 않으면 파일 확장자(.csv/.jsonl)로 정합니다. JSONL에는 줄별 박스/시간도 들어갑니다.
+        """
+        fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+        ids = [row[0] for row in self.search(text, limit=-1)]
+        with open(path, 'w', encoding='utf-8-sig' if fmt == 'csv' else 'utf-8', newline='') as f:
+            writer = csv.writer(f) if fmt == 'csv' else None
+            if writer is not None:
+                writer.writerow(CSV_COLUMNS)
+            for capture_id in reversed(ids):
+                item = self.get(capture_id)
+                if item is None:
+                    continue
+                item['created'] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(item['created']))
+                if writer is not None:
+                    writer.writerow([item[column] for column in CSV_COLUMNS])
+                else:
+                    del item['thumbnail']
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        return len(ids)
+
+    def clear(self):
+        """모든 기록을 지웁니다."""
+        if self._reader is None:
+            return
+        with self._read_lock:
+            self._reader.execute("DELETE FROM captures")
+            self._reader.commit()
+
+    def close(self):
+        """큐에 남은 기록을 모두 쓴 뒤 연결을 닫습니다."""
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join(timeout=5)
+            self._writer = None
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
@@ -0,0 +1,237 @@
+"""
+오버레이 번역 박스 배치: 줄마다 OCR 박스의 폭/높이에 들어가는 가장 큰 글꼴 크기를 이진 탐색으로 고르고,
+번역이 길어 박스가 늘어나 겹치면 한 번의 훑기로 아래로 밀어냅니다.
+
+글자 폭/줄 높이는 PIL 글꼴 메트릭(캐시)으로 계산하므로 Tk 스레드가 아닌 작업 스레드에서 실행할 수 있고,
+UI 스레드는 계산이 끝난 박스를 캔버스에 놓기만 합니다.
+Tk 글꼴 크기는 픽셀 단위(음수 크기)로 넘겨 PIL 측정값과 맞춥니다.
+"""
+import heapq
+import threading
+
+from PIL import ImageFont
+
+# (PIL 글꼴 파일, 같은 글꼴의 Tk 글꼴 이름) 찾는 순서
+LAYOUT_FONTS = (('malgunbd.ttf', 'Malgun Gothic'),
+                ('NanumGothicBold.ttf', 'NanumGothic'),
+                ('DejaVuSans-Bold.ttf', 'DejaVu Sans'))
+# 글꼴 크기 범위 (px)
+MIN_FONT_PX = 11
+MAX_FONT_PX = 40
+# 박스 안쪽 여백과, 늘어난 박스끼리 최소 간격 (px)
+PADDING_X = 2
+PADDING_Y = 1
+MIN_GAP = 2
+# 단어 폭은 이 크기에서 한 번 재고 크기에 비례해 계산합니다.
+REFERENCE_PX = 100
+WIDTH_CACHE_LIMIT = 20000
+
+
+class FontMetrics:
+    """
+    글꼴 메트릭 캐시. 단어 폭은 기준 크기에서 한 번만 측정하고, 줄 높이는 크기별로 한 번만 구합니다.
+    여러 작업 스레드에서 함께 쓸 수 있도록 FreeType 호출은 락으로 보호합니다.
+    """
+    def __init__(self, fonts=LAYOUT_FONTS):
+        self.path = None
+        self.family = fonts[0][1] if fonts else 'TkDefaultFont'
+        for path, family in fonts:
+            try:
+                ImageFont.truetype(path, REFERENCE_PX)
+            except OSError:
+                continue
+            self.path, self.family = path, family
+            break
+        self._fonts = {}
+        self._widths = {}
+        self._heights = {}
+        self._lock = threading.Lock()
+
+    def _font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            if self.path is not None:
+                font = ImageFont.truetype(self.path, size)
+            else:
+                font = ImageFont.load_default(size)
+            self._fonts[size] = font
+        return font
+
+    def text_width(self, text, size):
+        """size(px)로 그린 text의 폭 (px)"""
+        width = self._widths.get(text)
+        if width is None:
+            with self._lock:
+                if len(self._widths) >= WIDTH_CACHE_LIMIT:
+                    self._widths.clear()
+                width = self._widths[text] = self._font(REFERENCE_PX).getlength(text)
+        return width * size / REFERENCE_PX
+
+    def line_height(self, size):
+        """size(px) 글꼴의 한 줄 높이 (px)"""
+        height = self._heights.get(size)
+        if height is None:
+            with self._lock:
+                ascent, descent = self._font(size).getmetrics()
+                height = self._heights[size] = ascent + descent
+        return height
+
+    def pil_font(self, size):
+        """size(px)의 PIL 글꼴 (일괄 처리에서 오버레이 PNG를 그릴 때 사용)"""
+        with self._lock:
+            return self._font(size)
+
+    def tk_font(self, size):
+        """같은 크기로 보이는 Tk 글꼴 (음수 크기 = 픽셀 단위)"""
+        return (self.family, -size, "bold")
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """프로그램 전체가 함께 쓰는 글꼴 메트릭 (처음 호출할 때 글꼴을 찾음)"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = FontMetrics()
+        return _metrics
+
+
+class LayoutBox:
+    """번역 한 줄을 그릴 박스 (이미지 좌표). 글자는 (center_x, center_y)를 중심으로 wrap_width 폭에서 줄바꿈합니다."""
+    __slots__ = ('left', 'top', 'width', 'height', 'text', 'font_size', 'wrap_width')
+
+    def __init__(self, left, top, width, height, text, font_size, wrap_width):
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.text = text
+        self.font_size = font_size
+        self.wrap_width = wrap_width
+
+    @property
+    def center_x(self):
+        return self.left + self.width / 2
+
+    @property
+    def center_y(self):
+        return self.top + self.height / 2
+
+    def __repr__(self):
+        return f"LayoutBox({self.text!r}, {self.left}, {self.top}, {self.width}, {self.height}, {self.font_size}px)"
+
+
+def count_wrapped_lines(metrics, text, size, max_width):
+    """Tk처럼 공백 단위로 줄바꿈했을 때의 줄 수 (한 단어가 폭보다 길면 글자 단위로 나뉨)"""
+    space = metrics.text_width(' ', size)
+    lines = 1
+    used = 0.0
+    for word in text.split(' '):
+        width = metrics.text_width(word, size)
+        if used and used + space + width <= max_width:
+            used += space + width
+            continue
+        if used:
+            lines += 1
+        if width > max_width:
+            # 공백 없는 긴 단어(한중일 문장 등)는 폭마다 잘립니다.
+            full, used = divmod(width, max_width)
+            lines += int(full)
+        else:
+            used = width
+    return lines
+
+
+def wrap_text(metrics, text, size, max_width):
+    """count_wrapped_lines와 같은 규칙으로 줄바꿈한 줄 목록 (PIL로 직접 그릴 때 사용)"""
+    space = metrics.text_width(' ', size)
+    lines = []
+    current = ''
+    used = 0.0
+    for word in text.split(' '):
+        width = metrics.text_width(word, size)
+        if current and used + space + width <= max_width:
+            current += ' ' + word
+            used += space + width
+            continue
+        if current:
+            lines.append(current)
+        if width > max_width:
+            # 공백 없는 긴 단어는 폭을 넘기 전까지 글자 단위로 자릅니다.
+            current, used = '', 0.0
+            for char in word:
+                char_width = metrics.text_width(char, size)
+                if current and used + char_width > max_width:
+                    lines.append(current)
+                    current, used = '', 0.0
+                current += char
+                used += char_width
+        else:
+            current, used = word, width
+    lines.append(current)
+    return lines
+
+
+def fit_font_size(metrics, text, box_width, box_height, min_size=MIN_FONT_PX, max_size=MAX_FONT_PX):
+    """
+    박스 폭 안에서 줄바꿈했을 때 박스 높이에 들어가는 가장 큰 글꼴 크기와 그때의 글자 높이를 찾습니다.
+    (크기가 클수록 높이가 단조 증가하므로 이진 탐색. 최소 크기로도 넘치면 최소 크기)
+    """
+    wrap_width = max(1.0, box_width - PADDING_X * 2)
+    max_size = max(min_size, min(max_size, int(box_height)))
+
+    def height_at(size):
+        return count_wrapped_lines(metrics, text, size, wrap_width) * metrics.line_height(size)
+
+    lo, hi = min_size, max_size
+    best = min_size
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if height_at(mid) + PADDING_Y * 2 <= box_height:
+            best = mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return best, height_at(best)
+
+
+def resolve_overlaps(boxes):
+    """
+    위쪽부터 훑으며, 가로로 겹치는 이미 놓인 박스와 세로로 겹치면 그 아래로 내립니다.
+    아직 아래쪽 끝이 지나가지 않은 박스(k개)만 힙에 남겨 비교하므로 O(n log n + n·k)입니다.
+    화면 글줄은 세로로 거의 겹치지 않아 k가 작으므로 실제로는 정렬 비용이 대부분입니다.
+    (같은 높이에 나란히 있는 열끼리는 서로 밀어내지 않음)
+    """
+    active = []  # (아래쪽 끝, 순번, 박스)
+    for order, box in enumerate(sorted(boxes, key=lambda b: (b.top, b.left))):
+        while active and active[0][0] <= box.top:
+            heapq.heappop(active)
+        right = box.left + box.width
+        top = box.top
+        for bottom, _, other in active:
+            if other.left < right and box.left < other.left + other.width and bottom + MIN_GAP > top:
+                top = bottom + MIN_GAP
+        box.top = top
+        heapq.heappush(active, (box.top + box.height, order, box))
+    return boxes
+
+
+def layout_lines(lines, translated, metrics=None):
+    """
+    OCR 줄(OcrLine)과 번역 목록으로 이미지 좌표의 LayoutBox 목록을 만듭니다. (빈 번역 줄은 건너뜀)
+    작업 스레드에서 호출하는 것을 전제로 하며 Tk를 사용하지 않습니다.
+    """
+    metrics = metrics or get_metrics()
+    boxes = []
+    for line, text in zip(lines, translated):
+        text = " ".join(text.split())
+        if not text:
+            continue
+        size, text_height = fit_font_size(metrics, text, line.width, line.height)
+        height = max(line.height, text_height + PADDING_Y * 2)
+        boxes.append(LayoutBox(line.left, line.top, line.width, height, text, size,
+                               max(1.0, line.width - PADDING_X * 2)))
+    return resolve_overlaps(boxes)
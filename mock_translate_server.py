@@ -0,0 +1,75 @@
+"""
+로컬 HTTP 번역 서버(테스트용). translators.HttpBackend 가 사용하는 JSON 형식으로 응답합니다.
+실제로 번역하지 않고 원문 앞에 대상 언어 코드를 붙여 돌려주며,
+지연 시간과 429(요청 과다) 비율을 지정해 라우터의 대체 동작을 시험할 수 있습니다.
+
+사용법:
+    python mock_translate_server.py --port 8765 --latency 0.05 --rate-limit 0.1
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_server(port=8765, latency=0.0, rate_limit=0.0, host='127.0.0.1'):
+    """지정한 지연 시간(초)과 429 응답 비율(0~1)로 동작하는 서버를 만듭니다. (port=0이면 빈 포트)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+            if latency:
+                time.sleep(latency)
+
+            if rate_limit and random.random() < rate_limit:
+                self.send_response(429)
+                self.send_header('Retry-After', '1')
+                self.end_headers()
+                return
+
+            target = (request.get('target_lang') or '').upper()
+            body = json.dumps({'translations': [f"[{target}] {text}" for text in request['texts']]},
+                              ensure_ascii=False).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # 요청마다 로그를 찍으면 벤치마크 시간이 왜곡되므로 끕니다.
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def start_in_background(port=0, latency=0.0, rate_limit=0.0):
+    """서버를 데몬 스레드에서 띄우고 (서버, 번역 URL)을 반환합니다."""
+    server = make_server(port, latency, rate_limit)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/translate"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 HTTP 번역 서버 (테스트용)")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="응답마다 더할 지연 시간 (초)")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="429로 응답할 비율 (0~1)")
+    args = parser.parse_args()
+
+    server = make_server(args.port, args.latency, args.rate_limit)
+    print(f"http://127.0.0.1:{args.port}/translate 에서 대기 중 (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
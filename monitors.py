@@ -0,0 +1,211 @@
+"""
+다중 모니터/DPI 처리: 모니터 목록(물리 픽셀), 가상 데스크톱 범위,
+Tk(논리) 좌표 → 물리 픽셀 변환과 오버레이 창 속성(클릭 통과, 캡처 제외)을 제공합니다.
+(Windows는 ctypes, 그 외는 mss/Tk 정보 사용)
+창을 띄우기 전에 불리므로 무거운 모듈은 import 하지 않습니다.
+"""
+import ctypes
+import sys
+
+IS_WINDOWS = sys.platform == 'win32'
+
+if IS_WINDOWS:
+    from ctypes import wintypes
+
+# SetProcessDpiAwareness / GetProcessDpiAwareness / GetDpiForMonitor 상수 (DPI 인식 수준)
+PROCESS_DPI_UNAWARE = 0
+PROCESS_SYSTEM_DPI_AWARE = 1
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+MDT_EFFECTIVE_DPI = 0
+DEFAULT_DPI = 96
+# GetSystemMetrics: 가상 데스크톱(모든 모니터) 범위
+SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN = 76, 77, 78, 79
+# 오버레이 창 확장 스타일 (마우스 입력 통과, 포커스 받지 않음)과 화면 캡처 제외 (Windows 10 2004 이상)
+GWL_EXSTYLE = -20
+WS_EX_LAYERED = 0x00080000
+WS_EX_TRANSPARENT = 0x00000020
+WS_EX_NOACTIVATE = 0x08000000
+WDA_EXCLUDEFROMCAPTURE = 0x11
+
+# 이 프로세스의 DPI 인식 수준. 모니터별 인식일 때만 Tk 좌표가 모든 모니터에서 물리 픽셀과 같습니다.
+_dpi_awareness = PROCESS_DPI_UNAWARE
+
+
+class Monitor:
+    """모니터 하나의 물리 픽셀 범위와 배율(DPI/96)"""
+    __slots__ = ('left', 'top', 'width', 'height', 'scale')
+
+    def __init__(self, left, top, width, height, scale=1.0):
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.scale = scale
+
+    @property
+    def bbox(self):
+        return (self.left, self.top, self.left + self.width, self.top + self.height)
+
+    def contains(self, x, y):
+        return self.left <= x < self.left + self.width and self.top <= y < self.top + self.height
+
+    def __repr__(self):
+        return f"Monitor({self.left}, {self.top}, {self.width}x{self.height}, x{self.scale:g})"
+
+
+def enable_dpi_awareness():
+    """
+    (Windows) 프로세스를 모니터별 DPI 인식 모드로 바꿔, Tk 좌표와 캡처 좌표가 모두 물리 픽셀이 되게 합니다.
+    Tk 창을 만들기 전에 호출해야 합니다. 모니터별 인식이 되면 True.
+    (시스템 DPI 인식만 되면 False: 배율이 다른 모니터의 좌표는 logical_to_physical에서 계속 변환합니다.)
+    """
+    global _dpi_awareness
+    if not IS_WINDOWS:
+        return False
+    try:
+        shcore = ctypes.windll.shcore
+        if shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE) == 0:
+            _dpi_awareness = PROCESS_PER_MONITOR_DPI_AWARE
+        else:
+            # 매니페스트 등으로 이미 정해져 있으면 실패하므로 실제 수준을 읽어 옵니다.
+            level = ctypes.c_int(PROCESS_DPI_UNAWARE)
+            if shcore.GetProcessDpiAwareness(None, ctypes.byref(level)) == 0:
+                _dpi_awareness = level.value
+    except (AttributeError, OSError):
+        # Windows 8.1 이전: 시스템 DPI 인식만 가능
+        if ctypes.windll.user32.SetProcessDPIAware():
+            _dpi_awareness = PROCESS_SYSTEM_DPI_AWARE
+    return _dpi_awareness == PROCESS_PER_MONITOR_DPI_AWARE
+
+
+def dpi_awareness():
+    """현재 DPI 인식 수준 (PROCESS_DPI_UNAWARE / PROCESS_SYSTEM_DPI_AWARE / PROCESS_PER_MONITOR_DPI_AWARE)"""
+    return _dpi_awareness
+
+
+def _monitor_scale(hmonitor):
+    try:
+        dpi_x, dpi_y = wintypes.UINT(), wintypes.UINT()
+        if ctypes.windll.shcore.GetDpiForMonitor(hmonitor, MDT_EFFECTIVE_DPI,
+                                                 ctypes.byref(dpi_x), ctypes.byref(dpi_y)) == 0:
+            return dpi_x.value / DEFAULT_DPI
+    except (AttributeError, OSError):
+        pass
+    return 1.0
+
+
+def _list_monitors_windows():
+    monitors = []
+
+    class MONITORINFO(ctypes.Structure):
+        _fields_ = [('cbSize', wintypes.DWORD), ('rcMonitor', wintypes.RECT),
+                    ('rcWork', wintypes.RECT), ('dwFlags', wintypes.DWORD)]
+
+    def callback(hmonitor, hdc, rect, data):
+        info = MONITORINFO()
+        info.cbSize = ctypes.sizeof(MONITORINFO)
+        ctypes.windll.user32.GetMonitorInfoW(hmonitor, ctypes.byref(info))
+        r = info.rcMonitor
+        monitor = Monitor(r.left, r.top, r.right - r.left, r.bottom - r.top, _monitor_scale(hmonitor))
+        # 주 모니터(MONITORINFOF_PRIMARY)를 맨 앞에 둡니다.
+        if info.dwFlags & 1:
+            monitors.insert(0, monitor)
+        else:
+            monitors.append(monitor)
+        return True
+
+    proc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC,
+                              ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+    ctypes.windll.user32.EnumDisplayMonitors(None, None, proc(callback), 0)
+    return monitors
+
+
+def list_monitors():
+    """모든 모니터를 주 모니터부터 반환합니다. (알 수 없으면 빈 목록)"""
+    if IS_WINDOWS:
+        return _list_monitors_windows()
+    try:
+        import mss
+        with mss.mss() as session:
+            return [Monitor(m['left'], m['top'], m['width'], m['height']) for m in session.monitors[1:]]
+    except Exception:
+        return []
+
+
+def virtual_bounds():
+    """
+    오버레이 창을 펼칠 가상 데스크톱 범위 (left, top, width, height)를 이 프로세스의 좌표계(Tk 좌표)로 반환합니다.
+    알 수 없으면 None (호출 측에서 Tk 화면 크기 사용)
+    """
+    if IS_WINDOWS:
+        metrics = ctypes.windll.user32.GetSystemMetrics
+        return (metrics(SM_XVIRTUALSCREEN), metrics(SM_YVIRTUALSCREEN),
+                metrics(SM_CXVIRTUALSCREEN), metrics(SM_CYVIRTUALSCREEN))
+    monitors = list_monitors()
+    if not monitors:
+        return None
+    left = min(m.left for m in monitors)
+    top = min(m.top for m in monitors)
+    right = max(m.left + m.width for m in monitors)
+    bottom = max(m.top + m.height for m in monitors)
+    return (left, top, right - left, bottom - top)
+
+
+def logical_to_physical(hwnd, x, y):
+    """
+    창(hwnd) 기준 논리 좌표(Tk 화면 좌표)를 그 점이 있는 모니터의 물리 픽셀 좌표로 바꿉니다.
+    모니터별 DPI 인식 모드이거나 Windows가 아니면 그대로 반환합니다.
+    (시스템 DPI 인식만으로는 시스템 배율과 다른 모니터의 좌표가 여전히 논리 좌표라 변환합니다.)
+    """
+    if not IS_WINDOWS or _dpi_awareness == PROCESS_PER_MONITOR_DPI_AWARE:
+        return x, y
+    point = wintypes.POINT(int(x), int(y))
+    try:
+        if ctypes.windll.user32.LogicalToPhysicalPointForPerMonitorDPI(hwnd, ctypes.byref(point)):
+            return point.x, point.y
+    except AttributeError:
+        pass
+    return x, y
+
+
+def top_level_hwnd(widget):
+    """Tk 위젯이 속한 최상위 창의 HWND (Windows 전용)"""
+    GA_ROOT = 2
+    return ctypes.windll.user32.GetAncestor(widget.winfo_id(), GA_ROOT)
+
+
+def make_click_through(widget):
+    """(Windows) 창이 마우스 입력을 받지 않고 아래 창으로 통과시키게 합니다. 성공하면 True."""
+    if not IS_WINDOWS:
+        return False
+    user32 = ctypes.windll.user32
+    hwnd = top_level_hwnd(widget)
+    style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+    user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_LAYERED | WS_EX_TRANSPARENT | WS_EX_NOACTIVATE)
+    return True
+
+
+def exclude_from_capture(widget):
+    """(Windows 10 2004 이상) 창을 화면 캡처에서 제외합니다. 성공하면 True."""
+    if not IS_WINDOWS:
+        return False
+    try:
+        return bool(ctypes.windll.user32.SetWindowDisplayAffinity(top_level_hwnd(widget), WDA_EXCLUDEFROMCAPTURE))
+    except AttributeError:
+        return False
+
+
+def cursor_monitor_bbox():
+    """마우스 커서가 있는 모니터의 물리 픽셀 범위 (알 수 없으면 None = 주 모니터)"""
+    if not IS_WINDOWS:
+        return None
+    point = wintypes.POINT()
+    try:
+        if not ctypes.windll.user32.GetPhysicalCursorPos(ctypes.byref(point)):
+            return None
+    except AttributeError:
+        ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
+    for monitor in list_monitors():
+        if monitor.contains(point.x, point.y):
+            return monitor.bbox
+    return None
@@ -0,0 +1,186 @@
+"""
+OCR 결과 캐시: 캡처 이미지의 픽셀 내용 해시 + OCR 설정(언어/프리셋 등)을 키로
+줄 목록(OcrLine)을 기억해 두고, 똑같은 화면을 다시 캡처하면 Tesseract를 건너뜁니다.
+메모리에서는 크기(바이트)와 유효 시간으로 제한하고, 원하면 SQLite 파일에도 저장합니다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import config
+from ocr_model import OcrLine, OcrWord
+
+try:
+    import xxhash
+except ImportError:
+    # xxhash가 없으면 표준 라이브러리의 blake2b를 씁니다. (느리지만 4K 한 장도 수십 ms 이내)
+    xxhash = None
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(config.CONFIG_FILE)), 'ocr_cache.db')
+# 메모리 캐시 최대 크기(바이트, 줄/단어 개수로 추정)와 항목 유효 시간(초)
+MAX_MEMORY_BYTES = 8 * 2 ** 20
+MAX_AGE_SECONDS = 3600
+# 디스크 캐시 최대 크기 (저장한 JSON 바이트 합)
+MAX_DISK_BYTES = 64 * 2 ** 20
+# 디스크 정리(만료/크기 초과 삭제)는 이 횟수만큼 저장할 때마다 한 번 합니다.
+PRUNE_EVERY = 50
+# 항목 하나의 대략적인 메모리 크기 추정용 (파이썬 객체 오버헤드)
+ENTRY_OVERHEAD = 200
+WORD_OVERHEAD = 150
+
+
+def image_digest(img):
+    """이미지 크기/모드/픽셀 바이트의 해시 (16바이트 16진 문자열)"""
+    header = f"{img.mode}:{img.size[0]}x{img.size[1]}".encode()
+    if xxhash is not None:
+        h = xxhash.xxh3_128(header)
+    else:
+        h = hashlib.blake2b(header, digest_size=16)
+    h.update(img.tobytes())
+    return h.hexdigest()
+
+
+def _estimate_size(lines):
+    size = ENTRY_OVERHEAD
+    for line in lines:
+        size += ENTRY_OVERHEAD + len(line.text) * 2
+        size += WORD_OVERHEAD * len(line.words)
+    return size
+
+
+def lines_to_json(lines):
+    return json.dumps([[list(line.key), [[w.text, w.left, w.top, w.width, w.height, w.conf] for w in line.words]]
+                       for line in lines], ensure_ascii=False)
+
+
+def lines_from_json(data):
+    # page_num 자리의 (타일 번호, 페이지)/(언어, 영역 번호)는 JSON에서 리스트가 되므로 튜플로 되돌립니다.
+    return [OcrLine(tuple(tuple(part) if isinstance(part, list) else part for part in key),
+                    [OcrWord(*word) for word in words])
+            for key, words in json.loads(data)]
+
+
+class OcrCache:
+    """
+    (이미지 해시, OCR 설정) → 줄 목록 캐시입니다.
+    path가 None이면 메모리에만 두고, 경로를 주면 SQLite에도 저장해 다음 실행에서 재사용합니다.
+    캐시된 줄 목록은 여러 캡처가 함께 쓰므로 호출 측에서 수정하지 않아야 합니다.
+    """
+    def __init__(self, path=None, max_bytes=MAX_MEMORY_BYTES, max_age=MAX_AGE_SECONDS, max_disk_bytes=MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._db = None
+
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS ocr_results ("
+                    " key TEXT PRIMARY KEY,"
+                    " created REAL NOT NULL,"
+                    " lines TEXT NOT NULL)"
+                )
+                self._prune_disk()
+            except sqlite3.Error:
+                # DB 파일을 열 수 없으면 메모리 캐시만 사용합니다.
+                self._db = None
+
+    @staticmethod
+    def make_key(img, *settings):
+        """이미지 내용 해시와 OCR 설정 값들로 캐시 키를 만듭니다."""
+        return "|".join([image_digest(img)] + [str(value) for value in settings])
+
+    def _remember(self, key, lines, created):
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+        size = _estimate_size(lines)
+        self._memory[key] = (lines, created, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._memory) > 1:
+            _, (_, _, evicted) = self._memory.popitem(last=False)
+            self._bytes -= evicted
+
+    def get(self, key):
+        """캐시된 줄 목록을 반환합니다. 없거나 유효 시간이 지났으면 None."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[1] <= self.max_age:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._memory[key]
+                self._bytes -= entry[2]
+
+            if self._db is not None:
+                row = self._db.execute("SELECT created, lines FROM ocr_results WHERE key = ?", (key,)).fetchone()
+                if row is not None and now - row[0] <= self.max_age:
+                    lines = lines_from_json(row[1])
+                    self._remember(key, lines, row[0])
+                    self.hits += 1
+                    return lines
+
+            self.misses += 1
+            return None
+
+    def put(self, key, lines):
+        created = time.time()
+        with self._lock:
+            self._remember(key, lines, created)
+            if self._db is None:
+                return
+            try:
+                self._db.execute("INSERT OR REPLACE INTO ocr_results VALUES (?, ?, ?)",
+                                 (key, created, lines_to_json(lines)))
+                self._puts += 1
+                if self._puts % PRUNE_EVERY == 0:
+                    self._prune_disk()
+                self._db.commit()
+            except sqlite3.Error:
+                pass
+
+    def _prune_disk(self):
+        """만료된 항목을 지우고, 크기를 넘으면 오래된 항목부터 지웁니다. (락을 잡은 상태에서 호출)"""
+        self._db.execute("DELETE FROM ocr_results WHERE created < ?", (time.time() - self.max_age,))
+        total = self._db.execute("SELECT COALESCE(SUM(LENGTH(lines)), 0) FROM ocr_results").fetchone()[0]
+        if total > self.max_disk_bytes:
+            cutoff = None
+            for created, size in self._db.execute("SELECT created, LENGTH(lines) FROM ocr_results ORDER BY created"):
+                if total <= self.max_disk_bytes:
+                    break
+                total -= size
+                cutoff = created
+            if cutoff is not None:
+                self._db.execute("DELETE FROM ocr_results WHERE created <= ?", (cutoff,))
+        self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM ocr_results")
+                self._db.commit()
+
+    def stats_text(self):
+        """상태 표시줄용 적중 횟수 문자열"""
+        return f"OCR 캐시 적중 {self.hits}/{self.hits + self.misses}"
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,486 @@
+import ctypes
+import ctypes.util
+import glob
+import os
+import queue
+import shutil
+import threading
+
+try:
+    import pytesseract
+except ImportError:
+    # tesserocr나 libtesseract를 쓰면 pytesseract 없이도 동작합니다. (PytesseractEngine만 못 씀)
+    pytesseract = None
+
+try:
+    import tesserocr
+except ImportError:
+    # tesserocr(libtesseract 바인딩)가 없으면 pytesseract 방식으로 대체합니다.
+    tesserocr = None
+
+
+# 경로가 설정되지 않았을 때 찾아볼 기본 설치 위치 (Windows 설치 프로그램 기본값)
+DEFAULT_TESSERACT_PATHS = (r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+                           r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe')
+
+# 글자 방향/문자 체계(script) 검출용 언어 데이터 (osd.traineddata)
+OSD_LANG = 'osd'
+
+# 페이지 분할 모드(PSM): 한 줄짜리 잘라낸 이미지를 다시 인식할 때 사용 (Tesseract/tesserocr 공통 번호)
+PSM_SINGLE_LINE = 7
+
+# 언어별 최대 워커(Tesseract 인스턴스) 수. 영역 OCR 스레드 풀(script_detect)도 이 폭을 써서
+# 한 가지 문자만 있는 화면에서도 영역들이 모든 코어에서 동시에 인식됩니다. (워커는 동시에 필요할 때만 만듦)
+WORKERS_PER_LANG = os.cpu_count() or 2
+
+# pytesseract.Output.DICT 와 같은 키 구성
+DATA_KEYS = ('level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+             'left', 'top', 'width', 'height', 'conf', 'text')
+
+
+class OcrEngineError(RuntimeError):
+    """OCR 엔진 초기화/인식 실패 시 발생하는 오류입니다."""
+
+
+class PytesseractEngine:
+    """
+    캡처마다 tesseract.exe 프로세스를 새로 실행하는 기존 방식의 엔진입니다.
+    (모델을 매번 다시 로드하고 임시 파일을 거칩니다.)
+    """
+    name = "pytesseract"
+    # 캡처마다 tesseract.exe를 새로 실행하는 느린(cold) 방식
+    warm = False
+
+    def __init__(self, tesseract_cmd=''):
+        if pytesseract is None:
+            raise OcrEngineError("pytesseract가 설치되지 않았습니다")
+        if tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        self._languages = None
+
+    def image_to_data(self, img, lang, psm=None):
+        """이미지를 인식해 Output.DICT 형식의 단어 데이터를 반환합니다. (psm: 페이지 분할 모드, 기본은 자동)"""
+        return pytesseract.image_to_data(img, lang=lang, config=f'--psm {psm}' if psm is not None else '',
+                                         output_type=pytesseract.Output.DICT)
+
+    def detect_script(self, img):
+        """문자 체계(Latin, Hangul, Japanese, Han 등)와 신뢰도를 반환합니다. 글자가 너무 적으면 None."""
+        try:
+            osd = pytesseract.image_to_osd(img, output_type=pytesseract.Output.DICT)
+        except pytesseract.TesseractError:
+            return None
+        return osd['script'], float(osd['script_conf'])
+
+    def languages(self):
+        """설치된 언어 데이터 목록 (처음 한 번만 조회)"""
+        if self._languages is None:
+            self._languages = pytesseract.get_languages(config='')
+        return self._languages
+
+    def warm_up(self, lang):
+        pass
+
+    def close(self):
+        pass
+
+
+class _PooledEngine:
+    """
+    언어별로 Tesseract 인스턴스(워커)를 미리 로드해 두고 캡처 사이에 재사용하는 엔진의 공통 부분입니다.
+    하위 클래스는 _create_api(lang)와 _end_api(api)를 구현합니다.
+    """
+    name = "pooled"
+    warm = True
+
+    def __init__(self, tesseract_cmd='', workers_per_lang=None):
+        self.tessdata_path = self._find_tessdata(tesseract_cmd)
+        self.workers_per_lang = workers_per_lang or WORKERS_PER_LANG
+        self._languages = None
+        self._pools = {}
+        self._created = {}
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _find_tessdata(tesseract_cmd):
+        """tesseract.exe 옆의 tessdata 폴더를 찾습니다. (없으면 기본 경로 사용)"""
+        if tesseract_cmd:
+            candidate = os.path.join(os.path.dirname(tesseract_cmd), 'tessdata')
+            if os.path.isdir(candidate):
+                return candidate
+        return os.environ.get('TESSDATA_PREFIX', '')
+
+    def _acquire(self, lang):
+        """해당 언어의 대기 중인 워커를 꺼냅니다. 여유가 있으면 새로 만듭니다."""
+        with self._lock:
+            if self._closed:
+                raise OcrEngineError("OCR 엔진이 닫혔습니다")
+            pool = self._pools.setdefault(lang, queue.Queue())
+            if pool.empty() and self._created.get(lang, 0) < self.workers_per_lang:
+                self._created[lang] = self._created.get(lang, 0) + 1
+                create_new = True
+            else:
+                create_new = False
+
+        if create_new:
+            try:
+                return self._create_api(lang)
+            except OcrEngineError:
+                with self._lock:
+                    self._created[lang] -= 1
+                raise
+        api = pool.get()
+        if api is None:
+            # close()가 넣은 종료 표시: 같은 풀을 기다리는 다른 스레드도 깨우도록 다시 넣습니다.
+            pool.put(None)
+            raise OcrEngineError("OCR 엔진이 닫혔습니다")
+        return api
+
+    def _release(self, lang, api):
+        """워커를 풀에 돌려놓습니다. 인식 중에 엔진이 닫혔으면 여기서 해제합니다."""
+        with self._lock:
+            pool = None if self._closed else self._pools.get(lang)
+            if pool is not None:
+                pool.put(api)
+                return
+        self._end_api(api)
+
+    def warm_up(self, lang):
+        """첫 캡처 전에 언어 모델을 미리 로드해 둡니다."""
+        self._release(lang, self._acquire(lang))
+
+    def close(self):
+        """
+        대기 중인 워커만 해제합니다. 인식 중인 워커는 끝난 뒤 _release에서 해제되므로,
+        설정 변경으로 엔진을 바꿀 때 OCR 작업이 돌고 있어도 닫을 수 있습니다.
+        """
+        with self._lock:
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+            self._created.clear()
+        for pool in pools:
+            while True:
+                try:
+                    api = pool.get_nowait()
+                except queue.Empty:
+                    break
+                if api is not None:
+                    self._end_api(api)
+            # 워커를 기다리던 스레드를 깨웁니다.
+            pool.put(None)
+
+
+class TesserocrEngine(_PooledEngine):
+    """
+    언어별로 libtesseract 인스턴스를 미리 로드해 재사용하는 엔진입니다. (tesserocr 바인딩)
+    이미지는 임시 파일 없이 메모리에서 바로 전달됩니다.
+    """
+    name = "tesserocr"
+
+    def _create_api(self, lang):
+        # OSD 워커는 인식 없이 방향/문자 체계만 검출하는 모드로 만듭니다.
+        options = {'psm': tesserocr.PSM.OSD_ONLY} if lang == OSD_LANG else {}
+        try:
+            if self.tessdata_path:
+                return tesserocr.PyTessBaseAPI(path=self.tessdata_path, lang=lang, **options)
+            return tesserocr.PyTessBaseAPI(lang=lang, **options)
+        except RuntimeError as e:
+            raise OcrEngineError(f"언어 데이터({lang}) 로드 실패: {e}")
+
+    @staticmethod
+    def _end_api(api):
+        api.End()
+
+    def image_to_data(self, img, lang, psm=None):
+        """이미지를 인식해 Output.DICT 형식의 단어 데이터를 반환합니다. (psm: 페이지 분할 모드, 기본은 자동)"""
+        api = self._acquire(lang)
+        previous_psm = None
+        try:
+            if psm is not None:
+                # 워커는 다른 캡처와 함께 쓰므로 끝나면 원래 모드로 되돌립니다.
+                previous_psm = api.GetPageSegMode()
+                api.SetPageSegMode(psm)
+            api.SetImage(img)
+            api.Recognize()
+            return self._collect_words(api)
+        finally:
+            api.Clear()
+            if previous_psm is not None:
+                api.SetPageSegMode(previous_psm)
+            self._release(lang, api)
+
+    def detect_script(self, img):
+        """문자 체계(Latin, Hangul, Japanese, Han 등)와 신뢰도를 반환합니다. 글자가 너무 적으면 None."""
+        api = self._acquire(OSD_LANG)
+        try:
+            api.SetImage(img)
+            osd = api.DetectOrientationScript()
+        finally:
+            api.Clear()
+            self._release(OSD_LANG, api)
+        if not osd or not osd.get('script_name'):
+            return None
+        return osd['script_name'], float(osd['script_conf'])
+
+    def languages(self):
+        """설치된 언어 데이터 목록 (처음 한 번만 조회)"""
+        if self._languages is None:
+            if self.tessdata_path:
+                self._languages = list(tesserocr.get_languages(self.tessdata_path)[1])
+            else:
+                self._languages = list(tesserocr.get_languages()[1])
+        return self._languages
+
+    @staticmethod
+    def _collect_words(api):
+        """ResultIterator를 한 번 순회하며 블록/문단/줄/단어 번호를 매깁니다."""
+        data = {key: [] for key in DATA_KEYS}
+        ril = tesserocr.RIL
+        it = api.GetIterator()
+        if it is None:
+            return data
+
+        block_num = par_num = line_num = word_num = 0
+        for word in tesserocr.iterate_level(it, ril.WORD):
+            if word.IsAtBeginningOf(ril.BLOCK):
+                block_num += 1
+                par_num = line_num = 0
+            if word.IsAtBeginningOf(ril.PARA):
+                par_num += 1
+                line_num = 0
+            if word.IsAtBeginningOf(ril.TEXTLINE):
+                line_num += 1
+                word_num = 0
+            word_num += 1
+
+            box = word.BoundingBox(ril.WORD)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            data['level'].append(5)
+            data['page_num'].append(1)
+            data['block_num'].append(block_num)
+            data['par_num'].append(par_num)
+            data['line_num'].append(line_num)
+            data['word_num'].append(word_num)
+            data['left'].append(x1)
+            data['top'].append(y1)
+            data['width'].append(x2 - x1)
+            data['height'].append(y2 - y1)
+            data['conf'].append(word.Confidence(ril.WORD))
+            data['text'].append(word.GetUTF8Text(ril.WORD) or '')
+        return data
+
+
+def find_tesseract_cmd(tesseract_cmd=''):
+    """설정된 경로가 없으면 PATH와 기본 설치 위치에서 tesseract 실행 파일을 찾습니다. (못 찾으면 '')"""
+    if tesseract_cmd:
+        return tesseract_cmd
+    found = shutil.which('tesseract')
+    if found:
+        return found
+    for path in DEFAULT_TESSERACT_PATHS:
+        if os.path.isfile(path):
+            return path
+    return ''
+
+
+def find_libtesseract(tesseract_cmd=''):
+    """
+    libtesseract 공유 라이브러리 경로를 찾습니다. (못 찾으면 '')
+    Windows 설치본은 tesseract.exe 옆에 libtesseract-5.dll 등이 함께 들어 있습니다.
+    """
+    cmd = find_tesseract_cmd(tesseract_cmd)
+    if cmd:
+        found = sorted(glob.glob(os.path.join(os.path.dirname(cmd), 'libtesseract*.dll')), reverse=True)
+        if found:
+            return found[0]
+    return ctypes.util.find_library('tesseract') or ''
+
+
+_libs = {}
+_libs_lock = threading.Lock()
+
+
+def _load_libtesseract(path):
+    """libtesseract C API를 불러오고 함수 인자/반환 타입을 지정합니다. (경로별로 한 번만)"""
+    with _libs_lock:
+        lib = _libs.get(path)
+        if lib is not None:
+            return lib
+        folder = os.path.dirname(path)
+        if folder and hasattr(os, 'add_dll_directory'):
+            # 같은 폴더의 leptonica 등 의존 DLL을 찾을 수 있게 합니다.
+            os.add_dll_directory(folder)
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError as e:
+            raise OcrEngineError(f"libtesseract 로드 실패: {e}")
+
+        handle, text, c_int, c_float = ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_float
+        signatures = {
+            'TessBaseAPICreate': ([], handle),
+            'TessBaseAPIDelete': ([handle], None),
+            'TessBaseAPIInit3': ([handle, text, text], c_int),
+            'TessBaseAPISetPageSegMode': ([handle, c_int], None),
+            'TessBaseAPIGetPageSegMode': ([handle], c_int),
+            'TessBaseAPISetImage': ([handle, text, c_int, c_int, c_int, c_int], None),
+            'TessBaseAPISetSourceResolution': ([handle, c_int], None),
+            'TessBaseAPIRecognize': ([handle, handle], c_int),
+            'TessBaseAPIGetTsvText': ([handle, c_int], handle),
+            'TessBaseAPIDetectOrientationScript': ([handle, ctypes.POINTER(c_int), ctypes.POINTER(c_float),
+                                                    ctypes.POINTER(text), ctypes.POINTER(c_float)], c_int),
+            'TessBaseAPIClear': ([handle], None),
+            'TessDeleteText': ([handle], None),
+        }
+        for name, (argtypes, restype) in signatures.items():
+            func = getattr(lib, name)
+            func.argtypes = argtypes
+            func.restype = restype
+        _libs[path] = lib
+        return lib
+
+
+def parse_tsv(tsv):
+    """Tesseract TSV 출력(헤더 없음)을 Output.DICT 형식으로 바꿉니다."""
+    data = {key: [] for key in DATA_KEYS}
+    for row in tsv.splitlines():
+        fields = row.split('\t', 11)
+        if len(fields) < 11:
+            continue
+        if len(fields) == 11:
+            fields.append('')
+        for key, value in zip(DATA_KEYS[:10], fields):
+            data[key].append(int(value))
+        data['conf'].append(float(fields[10]))
+        data['text'].append(fields[11])
+    return data
+
+
+class LibTesseractEngine(_PooledEngine):
+    """
+    tesserocr 없이 Tesseract 설치본의 libtesseract를 ctypes로 직접 불러 쓰는 엔진입니다.
+    TesserocrEngine과 같이 언어별 워커를 프로세스 안에 로드해 두고, 이미지는 메모리의 픽셀 버퍼로 넘깁니다.
+    (tesserocr는 Windows에서 설치가 어려워 대신 사용합니다)
+    """
+    name = "libtesseract"
+    # Tesseract PSM 번호 (인식 없이 방향/문자 체계만 검출)
+    PSM_OSD_ONLY = 0
+    # 해상도 정보가 없는 화면 캡처에 쓰는 기본 DPI (tesserocr와 같은 값)
+    SOURCE_DPI = 70
+
+    def __init__(self, tesseract_cmd='', workers_per_lang=None, library_path=''):
+        super().__init__(tesseract_cmd, workers_per_lang)
+        self._lib = _load_libtesseract(library_path or find_libtesseract(tesseract_cmd))
+
+    def _create_api(self, lang):
+        api = self._lib.TessBaseAPICreate()
+        datapath = self.tessdata_path.encode() if self.tessdata_path else None
+        if self._lib.TessBaseAPIInit3(api, datapath, lang.encode()) != 0:
+            self._lib.TessBaseAPIDelete(api)
+            raise OcrEngineError(f"언어 데이터({lang}) 로드 실패")
+        if lang == OSD_LANG:
+            self._lib.TessBaseAPISetPageSegMode(api, self.PSM_OSD_ONLY)
+        return api
+
+    def _end_api(self, api):
+        self._lib.TessBaseAPIDelete(api)
+
+    def _set_image(self, api, img):
+        if img.mode not in ('L', 'RGB'):
+            img = img.convert('RGB')
+        channels = 1 if img.mode == 'L' else 3
+        self._lib.TessBaseAPISetImage(api, img.tobytes(), img.width, img.height, channels, img.width * channels)
+        self._lib.TessBaseAPISetSourceResolution(api, self.SOURCE_DPI)
+
+    def image_to_data(self, img, lang, psm=None):
+        """이미지를 인식해 Output.DICT 형식의 단어 데이터를 반환합니다. (psm: 페이지 분할 모드, 기본은 자동)"""
+        lib = self._lib
+        api = self._acquire(lang)
+        previous_psm = None
+        try:
+            if psm is not None:
+                # 워커는 다른 캡처와 함께 쓰므로 끝나면 원래 모드로 되돌립니다.
+                previous_psm = lib.TessBaseAPIGetPageSegMode(api)
+                lib.TessBaseAPISetPageSegMode(api, psm)
+            self._set_image(api, img)
+            if lib.TessBaseAPIRecognize(api, None) != 0:
+                raise OcrEngineError("인식 실패")
+            tsv = lib.TessBaseAPIGetTsvText(api, 0)
+            if not tsv:
+                return {key: [] for key in DATA_KEYS}
+            try:
+                data = parse_tsv(ctypes.string_at(tsv).decode('utf-8', 'replace'))
+            finally:
+                lib.TessDeleteText(tsv)
+            # 블록/문단/줄 행도 함께 나오지만 줄 그룹화는 단어 행(level 5)만 씁니다.
+            return data
+        finally:
+            lib.TessBaseAPIClear(api)
+            if previous_psm is not None:
+                lib.TessBaseAPISetPageSegMode(api, previous_psm)
+            self._release(lang, api)
+
+    def detect_script(self, img):
+        """문자 체계(Latin, Hangul, Japanese, Han 등)와 신뢰도를 반환합니다. 글자가 너무 적으면 None."""
+        api = self._acquire(OSD_LANG)
+        degrees, orient_conf = ctypes.c_int(), ctypes.c_float()
+        script, script_conf = ctypes.c_char_p(), ctypes.c_float()
+        try:
+            self._set_image(api, img)
+            found = self._lib.TessBaseAPIDetectOrientationScript(
+                api, ctypes.byref(degrees), ctypes.byref(orient_conf), ctypes.byref(script), ctypes.byref(script_conf))
+        finally:
+            self._lib.TessBaseAPIClear(api)
+            self._release(OSD_LANG, api)
+        if not found or not script.value:
+            return None
+        return script.value.decode(), float(script_conf.value)
+
+    def languages(self):
+        """설치된 언어 데이터 목록 (처음 한 번만 조회)"""
+        if self._languages is None:
+            if self.tessdata_path:
+                self._languages = sorted(os.path.splitext(name)[0] for name in os.listdir(self.tessdata_path)
+                                         if name.endswith('.traineddata'))
+            elif pytesseract is not None:
+                self._languages = pytesseract.get_languages(config='')
+            else:
+                self._languages = []
+        return self._languages
+
+
+# 프로세스 풀(타일 OCR, 일괄 처리)의 작업 프로세스마다 한 번만 만드는 OCR 엔진 (언어 모델을 프로세스 안에서 재사용)
+_worker_engine = None
+
+
+def init_worker(tesseract_cmd='', factory=None):
+    """ProcessPoolExecutor initializer: 작업 프로세스의 OCR 엔진을 만듭니다. (factory가 없으면 create_engine)"""
+    global _worker_engine
+    _worker_engine = (factory or create_engine)(tesseract_cmd)
+
+
+def worker_engine():
+    """init_worker로 만든 이 작업 프로세스의 OCR 엔진"""
+    return _worker_engine
+
+
+def has_warm_engine(tesseract_cmd=''):
+    """모델을 미리 로드해 재사용하는 엔진(tesserocr 또는 libtesseract)을 쓸 수 있는지 여부"""
+    return tesserocr is not None or bool(find_libtesseract(tesseract_cmd))
+
+
+def create_engine(tesseract_cmd=''):
+    """
+    사용 가능한 가장 빠른 OCR 엔진을 만듭니다. (tesserocr → libtesseract 직접 호출 → tesseract.exe 실행)
+    마지막 방식은 캡처마다 프로세스 실행/모델 로드/임시 파일이 생기므로 엔진의 warm 속성이 False입니다.
+    """
+    if tesserocr is not None:
+        return TesserocrEngine(tesseract_cmd)
+    if find_libtesseract(tesseract_cmd):
+        try:
+            return LibTesseractEngine(tesseract_cmd)
+        except OcrEngineError:
+            pass
+    return PytesseractEngine(tesseract_cmd)
@@ -0,0 +1,94 @@
+class OcrWord:
+    """OCR로 인식된 단어 하나 (이미지 좌표 기준). conf는 Tesseract 신뢰도(0~100, 모르면 -1)"""
+    __slots__ = ('text', 'left', 'top', 'width', 'height', 'conf')
+
+    def __init__(self, text, left, top, width, height, conf=-1.0):
+        self.text = text
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.conf = conf
+
+    def __repr__(self):
+        return f"OcrWord({self.text!r}, {self.left}, {self.top}, {self.width}, {self.height}, conf={self.conf:.0f})"
+
+
+class OcrLine:
+    """같은 (페이지, 블록, 문단, 줄) 번호를 가진 단어들을 묶은 한 줄"""
+    __slots__ = ('key', 'words', 'text', 'left', 'top', 'width', 'height', 'conf')
+
+    def __init__(self, key, words):
+        self.key = key
+        self.words = words
+        self.text = " ".join(w.text for w in words)
+
+        # 줄 전체의 바운딩 박스 계산
+        x1 = min(w.left for w in words)
+        y1 = min(w.top for w in words)
+        x2 = max(w.left + w.width for w in words)
+        y2 = max(w.top + w.height for w in words)
+        self.left = x1
+        self.top = y1
+        self.width = x2 - x1
+        self.height = y2 - y1
+
+        # 줄 신뢰도: 신뢰도를 아는 단어들의 글자 수 가중 평균 (모두 모르면 -1)
+        known = [(w.conf, len(w.text)) for w in words if w.conf >= 0]
+        chars = sum(n for _, n in known)
+        self.conf = sum(c * n for c, n in known) / chars if chars else -1.0
+
+    def __repr__(self):
+        return f"OcrLine({self.text!r}, {self.left}, {self.top}, {self.width}, {self.height}, conf={self.conf:.0f})"
+
+
+def group_lines(data):
+    """
+    pytesseract Output.DICT 형식의 데이터를 한 번 순회하며 줄 단위로 묶습니다.
+    빈 단어는 제외하며, 줄 순서는 Tesseract 출력 순서를 따릅니다.
+    """
+    groups = {}
+    texts = data['text']
+    levels = data['level']
+    for i in range(len(texts)):
+        if levels[i] != 5:
+            continue
+        text = texts[i]
+        if not text or not text.strip():
+            continue
+
+        key = (data['page_num'][i], data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        word = OcrWord(text.strip(), data['left'][i], data['top'][i], data['width'][i], data['height'][i],
+                       float(data['conf'][i]))
+        if key in groups:
+            groups[key].append(word)
+        else:
+            groups[key] = [word]
+
+    return [OcrLine(key, words) for key, words in groups.items()]
+
+
+def filter_lines(lines, min_conf):
+    """
+    신뢰도가 min_conf보다 낮은 단어(아이콘/테두리를 글자로 잘못 읽은 잡음 등)를 빼고,
+    남은 단어가 없는 줄은 버립니다. 신뢰도를 모르는 단어(-1)는 남깁니다. (min_conf가 0이면 그대로)
+    """
+    if min_conf <= 0:
+        return lines
+    result = []
+    for line in lines:
+        kept = [w for w in line.words if w.conf < 0 or w.conf >= min_conf]
+        if len(kept) == len(line.words):
+            result.append(line)
+        elif kept:
+            result.append(OcrLine(line.key, kept))
+    return result
+
+
+def to_dataframe(lines):
+    """디버깅/분석용으로 줄 목록을 pandas DataFrame으로 변환합니다. (pandas 필요)"""
+    import pandas as pd
+    return pd.DataFrame([
+        {'text': l.text, 'left': l.left, 'top': l.top, 'width': l.width, 'height': l.height, 'conf': l.conf}
+        for l in lines
+    ])
@@ -0,0 +1,82 @@
+"""
+신뢰도 기반 OCR 보정: 신뢰도가 애매한 줄(min_conf 이상 retry_conf 미만)만 잘라내 더 크게 키우고
+한 줄 모드(PSM 7)로 다시 인식해 더 나은 결과로 바꾼 뒤, 그래도 신뢰도가 낮은 단어는 잡음으로 보고 뺍니다.
+무거운 설정은 약한 줄의 작은 조각에만 쓰므로 전체 화면을 다시 인식하는 것보다 훨씬 쌉니다.
+"""
+import time
+
+import numpy as np
+from PIL import Image
+
+import ocr_engine
+import script_detect
+from ocr_model import OcrLine, OcrWord, filter_lines, group_lines
+from preprocess import invert_dark, to_gray
+
+# 다시 인식할 때 글자 높이를 이 크기(px)로 맞춥니다. (일반 전처리의 TARGET_TEXT_HEIGHT보다 크게)
+RETRY_TEXT_HEIGHT = 48
+RETRY_MIN_SCALE = 2.0
+RETRY_MAX_SCALE = 4.0
+# 한 캡처에서 다시 인식할 최대 줄 수 (신뢰도가 낮은 줄부터)
+MAX_RETRY_LINES = 8
+
+
+def weak_lines(lines, min_conf, retry_conf):
+    """다시 인식할 줄 목록 (신뢰도 낮은 순, 최대 MAX_RETRY_LINES개). min_conf 미만은 어차피 버리므로 제외합니다."""
+    weak = [line for line in lines if min_conf <= line.conf < retry_conf]
+    weak.sort(key=lambda line: line.conf)
+    return weak[:MAX_RETRY_LINES]
+
+
+def retry_line(engine, img, line, lang, origin=(0, 0)):
+    """
+    줄 하나를 잘라 키운 흑백 이미지로 한 줄 모드 OCR 을 다시 해 새 OcrLine을 반환합니다. (인식 실패 시 None)
+    origin은 img의 왼쪽 위가 줄 좌표계에서 놓인 위치입니다. (타일 OCR 등)
+    """
+    pad = max(4, line.height // 3)
+    x1 = max(0, line.left - origin[0] - pad)
+    y1 = max(0, line.top - origin[1] - pad)
+    x2 = min(img.width, line.left - origin[0] + line.width + pad)
+    y2 = min(img.height, line.top - origin[1] + line.height + pad)
+    if x2 <= x1 or y2 <= y1:
+        return None
+
+    gray = invert_dark(to_gray(np.asarray(img.crop((x1, y1, x2, y2)).convert('RGB'))))
+    scale = min(RETRY_MAX_SCALE, max(RETRY_MIN_SCALE, RETRY_TEXT_HEIGHT / max(1, line.height)))
+    crop = Image.fromarray(gray)
+    crop = crop.resize((round(crop.width * scale), round(crop.height * scale)), Image.Resampling.BICUBIC)
+
+    data = engine.image_to_data(crop, lang, psm=ocr_engine.PSM_SINGLE_LINE)
+    words = [OcrWord(w.text, round(w.left / scale) + x1 + origin[0], round(w.top / scale) + y1 + origin[1],
+                     round(w.width / scale), round(w.height / scale), w.conf)
+             for found in group_lines(data) for w in found.words]
+    if not words:
+        return None
+    words.sort(key=lambda w: w.left)
+    return OcrLine(line.key, words)
+
+
+def refine_lines(engine, img, lines, lang, min_conf=0, retry_conf=0, origin=(0, 0), timings=None):
+    """
+    약한 줄을 다시 인식해 신뢰도가 오른 경우에만 바꾸고, min_conf 미만 단어를 뺀 줄 목록을 반환합니다.
+    (줄 순서와 키는 유지되므로 영역/타일/언어 정보도 그대로 남음)
+    """
+    weak = weak_lines(lines, min_conf, retry_conf) if retry_conf > 0 else []
+    if weak:
+        start = time.perf_counter()
+        replaced = {}
+        for line in weak:
+            line_lang = script_detect.line_lang(line, lang)
+            if script_detect.is_auto(line_lang):
+                continue
+            try:
+                better = retry_line(engine, img, line, line_lang, origin)
+            except ocr_engine.OcrEngineError:
+                break
+            if better is not None and better.conf > line.conf:
+                replaced[id(line)] = better
+        if replaced:
+            lines = [replaced.get(id(line), line) for line in lines]
+        if timings is not None:
+            timings['retry'] = timings.get('retry', 0.0) + time.perf_counter() - start
+    return filter_lines(lines, min_conf)
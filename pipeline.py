@@ -0,0 +1,133 @@
+import itertools
+import queue
+import threading
+import time
+
+from tracing import new_trace_id
+
+
+class CaptureJob:
+    """캡처 한 건이 OCR → 번역 단계를 거치며 들고 다니는 상태"""
+    __slots__ = ('job_id', 'trace_id', 'img', 'ocr_lang', 'target_lang', 'tiled', 'detect_text', 'preset',
+                 'lines', 'translated', 'layout', 'timings', 'submitted_at', 'done')
+
+    def __init__(self, job_id, img, ocr_lang, target_lang, tiled=False, detect_text=False, preset='none',
+                 timings=None):
+        self.job_id = job_id
+        self.trace_id = new_trace_id()
+        self.img = img
+        self.ocr_lang = ocr_lang
+        self.target_lang = target_lang
+        self.tiled = tiled  # 큰 화면을 타일로 나눠 OCR/번역을 겹쳐 진행할지 여부
+        self.detect_text = detect_text  # 텍스트 후보 영역만 잘라 OCR 할지 여부
+        self.preset = preset  # OCR 전처리 프리셋 이름
+        self.lines = None
+        self.translated = None
+        self.layout = None  # 오버레이에 놓을 번역 박스 배치 (layout.LayoutBox 목록)
+        self.timings = dict(timings or {})  # 단계별 소요 시간(초). 캡처 시간처럼 넣기 전에 잰 값도 여기서 받습니다.
+        self.submitted_at = time.perf_counter()
+        self.done = threading.Event()
+
+
+def _put_latest(q, item, lock):
+    """큐가 가득 차 있으면 오래된 항목을 버리고 새 항목을 넣습니다."""
+    with lock:
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    stale = q.get_nowait()
+                    stale.done.set()
+                except queue.Empty:
+                    pass
+
+
+class TranslationPipeline:
+    """
+    캡처 → OCR → 번역 단계를 고정된 수의 작업 스레드와 크기 1의 큐로 연결합니다.
+
+    새 캡처가 들어오면 이전 캡처는 다음 단계 경계에서 폐기됩니다(single-flight).
+    실행 중인 Tesseract/DeepL 호출 자체는 중단하지 않고, 끝난 결과를 버립니다.
+    """
+    def __init__(self, ocr_stage, translate_stage, on_result, on_error,
+                 ocr_workers=1, translate_workers=1):
+        self.ocr_stage = ocr_stage
+        self.translate_stage = translate_stage
+        self.on_result = on_result
+        self.on_error = on_error
+
+        self._ids = itertools.count(1)
+        self._latest_id = 0
+        self._ocr_queue = queue.Queue(maxsize=1)
+        self._translate_queue = queue.Queue(maxsize=1)
+        self._queue_lock = threading.Lock()
+        self._closed = False
+
+        self._workers = []
+        for _ in range(ocr_workers):
+            self._start_worker(self._ocr_queue, self._run_ocr)
+        for _ in range(translate_workers):
+            self._start_worker(self._translate_queue, self._run_translate)
+
+    def _start_worker(self, source, handler):
+        worker = threading.Thread(target=self._worker_loop, args=(source, handler), daemon=True)
+        worker.start()
+        self._workers.append(worker)
+
+    def submit(self, img, ocr_lang, target_lang, tiled=False, detect_text=False, preset='none', timings=None):
+        """
+        새 캡처를 넣습니다. 아직 처리 중인 이전 캡처는 낡은 것으로 취급됩니다.
+        timings: 넣기 전에 잰 단계 시간 (캡처 등). 작업 스레드가 job을 받기 전에 채워 둡니다.
+        """
+        job = CaptureJob(next(self._ids), img, ocr_lang, target_lang, tiled, detect_text, preset, timings)
+        self._latest_id = job.job_id
+        _put_latest(self._ocr_queue, job, self._queue_lock)
+        return job
+
+    def is_stale(self, job):
+        return job.job_id != self._latest_id
+
+    def _worker_loop(self, source, handler):
+        while not self._closed:
+            try:
+                job = source.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if self.is_stale(job):
+                job.done.set()
+                continue
+            try:
+                handler(job)
+            except Exception as e:
+                if not self.is_stale(job):
+                    self.on_error(job, e)
+                job.done.set()
+
+    def _run_ocr(self, job):
+        job.timings['queue'] = time.perf_counter() - job.submitted_at
+        start = time.perf_counter()
+        self.ocr_stage(job)
+        job.timings['ocr'] = time.perf_counter() - start
+
+        if self.is_stale(job):
+            job.done.set()
+            return
+        _put_latest(self._translate_queue, job, self._queue_lock)
+
+    def _run_translate(self, job):
+        if job.lines:
+            start = time.perf_counter()
+            self.translate_stage(job)
+            job.timings['translate'] = time.perf_counter() - start
+
+        if not self.is_stale(job):
+            job.timings['total'] = time.perf_counter() - job.submitted_at
+            self.on_result(job)
+        job.done.set()
+
+    def close(self):
+        """작업 스레드를 종료합니다. 처리 중이던 결과는 전달되지 않습니다."""
+        self._closed = True
+        self._latest_id = -1
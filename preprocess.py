@@ -0,0 +1,147 @@
+import time
+
+import numpy as np
+from PIL import Image
+
+# Tesseract는 글자 높이가 대략 20~40px일 때 가장 정확합니다.
+TARGET_TEXT_HEIGHT = 32
+MIN_SCALE = 0.5
+MAX_SCALE = 3.0
+# 평균 밝기가 이 값보다 어두우면 다크 테마로 보고 반전합니다.
+DARK_THEME_THRESHOLD = 110
+# 적응형 이진화의 지역 평균 창 크기와 오프셋
+BINARIZE_WINDOW = 31
+BINARIZE_OFFSET = 10
+
+# 캡처 방식별로 고를 수 있는 전처리 프리셋 (적용 순서대로, 이름은 config.PREPROCESS_PRESET_NAMES와 같음)
+PRESETS = {
+    'none': (),
+    'fast': ('gray', 'invert'),
+    'ui': ('gray', 'invert', 'scale'),
+    'accurate': ('gray', 'invert', 'scale', 'binarize'),
+}
+
+
+def to_gray(arr):
+    """RGB 배열을 정수 연산으로 흑백(uint8) 배열로 바꿉니다. (ITU-R 601 가중치)"""
+    if arr.ndim == 2:
+        return arr
+    r = arr[..., 0].astype(np.uint16)
+    g = arr[..., 1].astype(np.uint16)
+    b = arr[..., 2].astype(np.uint16)
+    return ((r * 77 + g * 150 + b * 29) >> 8).astype(np.uint8)
+
+
+def invert_dark(gray):
+    """어두운 배경에 밝은 글자(다크 테마)면 반전해 흰 배경/검은 글자로 맞춥니다."""
+    if gray.mean() < DARK_THEME_THRESHOLD:
+        return 255 - gray
+    return gray
+
+
+def estimate_text_height(gray):
+    """
+    어두운 픽셀이 있는 행의 연속 구간(= 글줄) 높이의 중앙값으로 글자 크기를 추정합니다.
+    흰 배경/검은 글자를 전제로 하므로 invert_dark 이후에 호출합니다.
+    """
+    # 세로 테두리선처럼 모든 행에 걸친 얇은 선은 무시합니다.
+    ink_ratio = (gray < 128).mean(axis=1)
+    ink_rows = (ink_ratio > 0.002) & (ink_ratio < 0.6)
+    padded = np.concatenate(([False], ink_rows, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    heights = edges[1::2] - edges[::2]
+    heights = heights[heights >= 4]
+    if heights.size == 0:
+        return None
+    return float(np.median(heights))
+
+
+def scale_for_ocr(gray):
+    """작은 글자는 키우고 너무 큰 글자는 줄여 Tesseract에 맞는 크기로 만듭니다. (배율도 반환)"""
+    text_height = estimate_text_height(gray)
+    if text_height is None:
+        return gray, 1.0
+
+    scale = min(MAX_SCALE, max(MIN_SCALE, TARGET_TEXT_HEIGHT / text_height))
+    if 0.8 <= scale <= 1.25:
+        # 차이가 작으면 리사이즈 비용을 들이지 않습니다.
+        return gray, 1.0
+
+    height, width = gray.shape
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    resample = Image.Resampling.BICUBIC if scale > 1 else Image.Resampling.BOX
+    return np.asarray(Image.fromarray(gray).resize(size, resample)), scale
+
+
+def adaptive_binarize(gray, window=BINARIZE_WINDOW, offset=BINARIZE_OFFSET):
+    """적분 영상으로 구한 지역 평균보다 어두운 픽셀만 글자(검정)로 남깁니다."""
+    height, width = gray.shape
+    half = window // 2
+    integral = np.pad(gray.astype(np.int64).cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+
+    y1 = np.clip(np.arange(height) - half, 0, height)
+    y2 = np.clip(np.arange(height) + half + 1, 0, height)
+    x1 = np.clip(np.arange(width) - half, 0, width)
+    x2 = np.clip(np.arange(width) + half + 1, 0, width)
+
+    total = (integral[np.ix_(y2, x2)] - integral[np.ix_(y1, x2)]
+             - integral[np.ix_(y2, x1)] + integral[np.ix_(y1, x1)])
+    area = (y2 - y1)[:, None] * (x2 - x1)[None, :]
+    local_mean = total / area
+    return np.where(gray < local_mean - offset, 0, 255).astype(np.uint8)
+
+
+def preprocess(img, preset, timings=None):
+    """
+    프리셋에 따라 캡처를 OCR용으로 전처리합니다.
+    (OCR에 넘길 이미지, 원본 대비 배율)을 반환하며, timings가 주어지면 단계별 시간을 누적합니다.
+    """
+    steps = PRESETS.get(preset, ())
+    if not steps:
+        return img, 1.0
+
+    arr = np.asarray(img)
+    scale = 1.0
+    for step in steps:
+        start = time.perf_counter()
+        if step == 'gray':
+            arr = to_gray(arr)
+        elif step == 'invert':
+            arr = invert_dark(to_gray(arr))
+        elif step == 'scale':
+            arr, scale = scale_for_ocr(to_gray(arr))
+        elif step == 'binarize':
+            arr = adaptive_binarize(to_gray(arr))
+        if timings is not None:
+            timings[step] = timings.get(step, 0.0) + time.perf_counter() - start
+
+    return Image.fromarray(arr), scale
+
+
+def rescale_data(data, scale):
+    """전처리에서 바뀐 배율만큼 OCR 좌표를 원본 이미지 기준으로 되돌립니다."""
+    if scale == 1.0:
+        return data
+    for key in ('left', 'top', 'width', 'height'):
+        data[key] = [round(v / scale) for v in data[key]]
+    return data
+
+
+class PreprocessingEngine:
+    """OCR 엔진 앞에 전처리를 끼워 넣는 래퍼입니다. (영역/타일 OCR에서도 그대로 사용)"""
+
+    def __init__(self, engine, preset):
+        self.engine = engine
+        self.preset = preset
+        self.name = engine.name
+        self.timings = {}
+
+    def image_to_data(self, img, lang):
+        processed, scale = preprocess(img, self.preset, self.timings)
+        return rescale_data(self.engine.image_to_data(processed, lang), scale)
+
+    def warm_up(self, lang):
+        self.engine.warm_up(lang)
+
+    def close(self):
+        self.engine.close()
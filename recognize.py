@@ -0,0 +1,41 @@
+import time
+
+import ocr_refine
+import preprocess
+import script_detect
+import text_regions
+from ocr_model import group_lines
+
+
+def recognize(engine, img, lang, preset='none', detect_text=False, east_model_path='', timings=None,
+              min_conf=0, retry_conf=0):
+    """
+    캡처 한 장을 전처리 → (글자 영역 검출) → OCR → 줄 그룹화 순서로 처리해 OcrLine 목록을 반환합니다.
+    GUI(TranslatorApp)와 헤드리스 일괄 처리(batch.py)가 함께 사용합니다.
+    timings가 주어지면 단계별 소요 시간(초)을 기록합니다.
+    lang이 'auto'(또는 'auto:eng+jpn')면 글자 영역별로 언어를 감지해 OCR 합니다. (script_detect 참고)
+    신뢰도가 retry_conf 미만인 줄은 잘라서 다시 인식하고, min_conf 미만 단어는 버립니다. (ocr_refine 참고, 0이면 끔)
+    """
+    if timings is None:
+        timings = {}
+    if script_detect.is_auto(lang):
+        lines = script_detect.recognize_auto(engine, img, lang, preset, east_model_path, timings)
+        return ocr_refine.refine_lines(engine, img, lines, lang, min_conf, retry_conf, timings=timings)
+
+    # 프리셋으로 전처리한 뒤 OCR 합니다. (좌표는 원본 기준으로 복원됨)
+    wrapped = preprocess.PreprocessingEngine(engine, preset)
+    if detect_text:
+        # 글자 후보 영역만 잘라 OCR 하고 좌표를 전체 이미지 기준으로 되돌립니다.
+        start = time.perf_counter()
+        regions = text_regions.detect_regions(img, east_model_path)
+        timings['detect'] = time.perf_counter() - start
+        data = text_regions.ocr_regions(wrapped, img, lang, regions)
+    else:
+        data = wrapped.image_to_data(img, lang)
+    if wrapped.timings:
+        timings['preprocess'] = sum(wrapped.timings.values())
+
+    start = time.perf_counter()
+    lines = group_lines(data)
+    timings['group'] = time.perf_counter() - start
+    return ocr_refine.refine_lines(engine, img, lines, lang, min_conf, retry_conf, timings=timings)
@@ -0,0 +1,180 @@
+"""
+영역 차분 OCR: 같은 영역을 다시 캡처했을 때 이전 캡처와 비교해
+바뀐 가로 띠만 다시 OCR 하고, 바뀌지 않은 줄은 이전 결과(좌표 이동 포함)를 재사용합니다.
+채팅 로그처럼 한 줄이 추가되며 위로 밀리는(스크롤) 화면도 이동량을 찾아 맞춥니다.
+"""
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+from ocr_model import OcrLine, OcrWord
+
+# 정렬한 두 프레임의 같은 행에서 밝기 차이가 이 값보다 큰 픽셀이 있으면 바뀐 행으로 봅니다.
+PIXEL_THRESHOLD = 24
+# 바뀐 띠 위/아래에 더할 여백과, 이 간격 이하로 떨어진 띠는 하나로 합침 (px)
+BAND_PADDING = 6
+BAND_MERGE_GAP = 12
+# 바뀐 행이 이 비율 이상이면 띠로 나누지 않고 전체를 OCR 합니다.
+MAX_CHANGED_RATIO = 0.6
+# 기억해 둘 영역(캡처 위치+OCR 설정) 개수
+MAX_REGIONS = 8
+
+
+def _row_hashes(gray):
+    """행별 해시. 배경만 있는 행(모든 픽셀이 같음)은 스크롤 추정에 쓰지 않도록 None으로 둡니다."""
+    flat = (gray.min(axis=1) == gray.max(axis=1))
+    return [None if flat[y] else hash(gray[y].tobytes()) for y in range(gray.shape[0])]
+
+
+def estimate_scroll(prev_hashes, hashes):
+    """
+    새 프레임의 행 y가 이전 프레임의 행 y + dy 와 같다고 보는 세로 이동량 dy를 찾습니다.
+    같은 내용의 행끼리 이동량에 투표해 가장 많은 표를 얻은 값을 씁니다. (투표가 없으면 0)
+    """
+    rows_by_hash = {}
+    for y, h in enumerate(prev_hashes):
+        if h is not None:
+            rows_by_hash.setdefault(h, []).append(y)
+
+    votes = Counter()
+    for y, h in enumerate(hashes):
+        candidates = rows_by_hash.get(h)
+        # 같은 행이 너무 많이 반복되면(구분선 등) 이동량 추정에 도움이 되지 않습니다.
+        if candidates and len(candidates) <= 4:
+            for prev_y in candidates:
+                votes[prev_y - y] += 1
+    if not votes:
+        return 0
+    dy, count = votes.most_common(1)[0]
+    return dy if count > votes.get(0, 0) else 0
+
+
+def changed_rows(prev_gray, gray, dy):
+    """이전 프레임을 dy만큼 맞춘 뒤 바뀐 행을 bool 배열로 반환합니다. (이전 프레임 밖의 행은 바뀐 것으로 봄)"""
+    height = gray.shape[0]
+    changed = np.ones(height, dtype=bool)
+    start, end = max(0, -dy), min(height, prev_gray.shape[0] - dy)
+    if start < end:
+        diff = np.abs(gray[start:end].astype(np.int16) - prev_gray[start + dy:end + dy].astype(np.int16))
+        changed[start:end] = (diff > PIXEL_THRESHOLD).any(axis=1)
+    return changed
+
+
+def _widen_band(top, bottom, lines, height):
+    """
+    띠에 걸친 줄의 박스까지 띠를 넓힙니다. 넓힌 띠에 새로 걸리는 줄(붙어 있는 줄 등)이 있을 수 있으므로
+    더 넓어지지 않을 때까지 반복합니다.
+    """
+    while True:
+        new_top, new_bottom = top, bottom
+        for line in lines:
+            if line.top < new_bottom and new_top < line.top + line.height:
+                new_top = min(new_top, max(0, line.top - BAND_PADDING))
+                new_bottom = max(new_bottom, min(height, line.top + line.height + BAND_PADDING))
+        if (new_top, new_bottom) == (top, bottom):
+            return top, bottom
+        top, bottom = new_top, new_bottom
+
+
+def changed_bands(changed, lines, height):
+    """
+    바뀐 행을 (위, 아래) 띠 목록으로 묶습니다. 띠에 걸친 줄은 통째로 다시 인식하도록
+    띠를 그 줄의 박스까지 넓히므로, 어떤 줄도 띠에 반만 걸치지 않습니다.
+    """
+    padded = np.concatenate(([False], changed, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    bands = []
+    for top, bottom in zip(edges[::2], edges[1::2]):
+        top, bottom = _widen_band(max(0, int(top) - BAND_PADDING), min(height, int(bottom) + BAND_PADDING),
+                                  lines, height)
+        # 넓힌 띠가 앞 띠와 겹치거나 가까우면 합치고, 합친 띠를 다시 넓힙니다.
+        while bands and top - bands[-1][1] <= BAND_MERGE_GAP:
+            prev_top, prev_bottom = bands.pop()
+            top, bottom = _widen_band(min(prev_top, top), max(prev_bottom, bottom), lines, height)
+        bands.append((top, bottom))
+    return bands
+
+
+def shift_line(line, dy):
+    """줄(과 단어)의 세로 위치를 dy만큼 옮긴 새 OcrLine을 만듭니다."""
+    if dy == 0:
+        return line
+    return OcrLine(line.key, [OcrWord(w.text, w.left, w.top + dy, w.width, w.height, w.conf) for w in line.words])
+
+
+class RegionDiff:
+    """
+    영역별로 마지막 캡처(흑백 배열)와 줄 목록을 기억해 두고,
+    다음 캡처에서는 바뀐 띠만 ocr 콜백으로 인식해 나머지 줄과 합칩니다.
+    """
+    def __init__(self, max_regions=MAX_REGIONS):
+        self.max_regions = max_regions
+        self._regions = OrderedDict()
+        self._lock = threading.Lock()
+        # 통계: 전체 캡처 행 수 대비 실제로 OCR 한 행 수
+        self.rows_total = 0
+        self.rows_ocr = 0
+
+    def recognize(self, key, img, ocr):
+        """
+        key: 캡처 위치와 OCR 설정(언어/프리셋 등)을 묶은 값. 같은 key의 이전 결과만 재사용합니다.
+        ocr(img): 이미지(또는 잘라낸 띠)를 인식해 그 이미지 좌표의 OcrLine 목록을 반환하는 함수
+        """
+        gray = np.asarray(img.convert('L'))
+        hashes = _row_hashes(gray)
+        height = gray.shape[0]
+
+        with self._lock:
+            previous = self._regions.get(key)
+            if previous is not None:
+                self._regions.move_to_end(key)
+
+        lines = None
+        if previous is not None and previous[0].shape[1] == gray.shape[1]:
+            prev_gray, prev_hashes, prev_lines = previous
+            dy = estimate_scroll(prev_hashes, hashes)
+            changed = changed_rows(prev_gray, gray, dy)
+            if changed.mean() < MAX_CHANGED_RATIO:
+                # 이전 줄을 새 프레임 좌표로 옮기고, 화면 밖으로 밀려난 줄은 버립니다.
+                # 일부만 밀려난 줄은 보이는 부분을 다시 인식하도록 바뀐 행으로 표시합니다.
+                moved = []
+                for line in prev_lines:
+                    line = shift_line(line, -dy)
+                    if line.top >= 0 and line.top + line.height <= height:
+                        moved.append(line)
+                    else:
+                        changed[max(0, line.top):max(0, min(height, line.top + line.height))] = True
+                bands = changed_bands(changed, moved, height)
+                lines = self._merge(img, moved, bands, ocr)
+
+        if lines is None:
+            lines = ocr(img)
+            self.rows_ocr += height
+        self.rows_total += height
+
+        with self._lock:
+            self._regions[key] = (gray, hashes, lines)
+            while len(self._regions) > self.max_regions:
+                self._regions.popitem(last=False)
+        return lines
+
+    def _merge(self, img, moved, bands, ocr):
+        """바뀌지 않은 줄은 그대로 두고, 바뀐 띠는 다시 인식한 줄로 바꿉니다. (위→아래 순서)"""
+        width = img.size[0]
+        kept = [line for line in moved
+                if not any(top < line.top + line.height and line.top < bottom for top, bottom in bands)]
+        for top, bottom in bands:
+            self.rows_ocr += bottom - top
+            for line in ocr(img.crop((0, top, width, bottom))):
+                kept.append(shift_line(line, top))
+        kept.sort(key=lambda line: (line.top, line.left))
+        return kept
+
+    def forget(self, key=None):
+        """key의 이전 결과(없으면 전체)를 지웁니다."""
+        with self._lock:
+            if key is None:
+                self._regions.clear()
+            else:
+                self._regions.pop(key, None)
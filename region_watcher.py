@@ -0,0 +1,101 @@
+import threading
+import time
+
+from PIL import Image, ImageChops
+
+import screen_capture
+
+# 변화 감지용 축소 이미지 폭 (높이는 비율 유지)
+SIGNATURE_WIDTH = 96
+# 축소 이미지에서 픽셀 밝기 차이가 이 값보다 커야 변화로 봅니다.
+PIXEL_THRESHOLD = 24
+
+
+def region_signature(frame):
+    """
+    변화 비교용으로 캡처(screen_capture.Frame)를 작은 흑백 이미지로 줄입니다.
+    RGB 이미지를 만들지 않고 버퍼의 G 채널만 사용합니다.
+    """
+    width, height = frame.size
+    sig_height = max(1, round(height * SIGNATURE_WIDTH / max(1, width)))
+    return Image.fromarray(frame.signature_channel()).resize((SIGNATURE_WIDTH, sig_height))
+
+
+def has_changed(prev_sig, new_sig, threshold=PIXEL_THRESHOLD):
+    """두 축소 이미지의 블록 차이가 임계값을 넘는지 확인합니다."""
+    if prev_sig is None or prev_sig.size != new_sig.size:
+        return True
+    diff = ImageChops.difference(prev_sig, new_sig)
+    return diff.point(lambda p: 255 if p > threshold else 0).getbbox() is not None
+
+
+class RegionWatcher:
+    """
+    고정된 화면 영역을 일정 주기로 캡처하다가 내용이 바뀌었을 때만 callback을 호출합니다.
+
+    캡처와 처리는 하나의 백그라운드 스레드에서 순서대로 실행되므로,
+    번역이 느려도 프레임이 쌓이지 않고 처리가 끝난 뒤 최신 화면만 다시 확인합니다.
+    """
+    def __init__(self, bbox, callback, fps=2.0, on_error=None, capture=None):
+        self.bbox = bbox
+        self.capture = capture
+        self.callback = callback
+        self.interval = 1.0 / max(0.1, fps)
+        self.on_error = on_error
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.frames = 0
+        self.processed = 0
+
+    @property
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self):
+        # 캡처 객체(mss 핸들)는 감시 스레드 안에서 만들어 계속 재사용합니다.
+        capture = self.capture or screen_capture.create_capture()
+        try:
+            self._watch(capture)
+        finally:
+            if self.capture is None:
+                capture.close()
+
+    def _watch(self, capture):
+        processed_sig = None  # 마지막으로 번역한 화면
+        pending_sig = None    # 변화가 감지되어 안정되기를 기다리는 화면
+
+        while not self._stop_event.is_set():
+            tick_start = time.perf_counter()
+            try:
+                frame = capture.grab_frame(self.bbox)
+                self.frames += 1
+                sig = region_signature(frame)
+
+                if not has_changed(processed_sig, sig):
+                    # 정지 화면: OCR/번역 모두 건너뜀
+                    pending_sig = None
+                elif pending_sig is not None and not has_changed(pending_sig, sig):
+                    # 바뀐 뒤 한 프레임 동안 그대로면(자막 전환 완료) 처리
+                    processed_sig = sig
+                    pending_sig = None
+                    self.processed += 1
+                    # 처리할 프레임만 RGB 이미지로 변환합니다.
+                    self.callback(frame.to_image())
+                else:
+                    pending_sig = sig
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+                self._stop_event.set()
+                break
+
+            elapsed = time.perf_counter() - tick_start
+            self._stop_event.wait(max(0.0, self.interval - elapsed))
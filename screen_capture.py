@@ -0,0 +1,166 @@
+"""
+화면 캡처 계층: mss가 있으면 요청한 영역만 OS에서 BGRA 버퍼로 받아오고(잘라낸 뒤 변환),
+없으면 PIL.ImageGrab으로 대체합니다.
+
+Frame은 변환 전 버퍼를 NumPy 뷰로 감싼 것으로, 영역 감시처럼 대부분의 프레임을 버리는 경로는
+RGB 이미지를 만들지 않고 변화만 확인하고, OCR로 넘길 때만 to_image()로 한 번 변환합니다.
+"""
+import threading
+import time
+
+import numpy as np
+from PIL import Image
+
+try:
+    import mss
+except ImportError:
+    # mss가 없으면 PIL.ImageGrab(전체 화면을 캡처한 뒤 자르는 방식)을 사용합니다.
+    mss = None
+
+
+class Frame:
+    """캡처 한 장. pixels는 (높이, 너비, 채널) uint8 배열이며 mss 캡처에서는 복사 없는 BGRA 뷰입니다."""
+    __slots__ = ('pixels', 'order', 'bbox', 'capture_seconds', '_image')
+
+    def __init__(self, pixels, order, bbox, capture_seconds, image=None):
+        self.pixels = pixels
+        self.order = order
+        self.bbox = bbox
+        self.capture_seconds = capture_seconds
+        self._image = image
+
+    @property
+    def size(self):
+        return self.pixels.shape[1], self.pixels.shape[0]
+
+    @property
+    def nbytes(self):
+        return self.pixels.nbytes
+
+    def signature_channel(self):
+        """변화 감지용 단일 채널 뷰 (G 채널은 밝기와 가장 가깝고, BGRA/RGB 어느 쪽이든 인덱스 1)"""
+        return self.pixels[..., 1]
+
+    def to_image(self):
+        """OCR/표시용 RGB 이미지를 만듭니다. (BGRA → RGB 변환 한 번, 캡처 시간/위치는 img.info에 기록)"""
+        if self._image is None:
+            if self.order == 'BGRA':
+                height, width = self.pixels.shape[:2]
+                self._image = Image.frombuffer('RGB', (width, height), self.pixels, 'raw', 'BGRX', 0, 1)
+            else:
+                self._image = Image.fromarray(self.pixels)
+            self._image.info['capture_seconds'] = self.capture_seconds
+            self._image.info['bbox'] = self.bbox
+        return self._image
+
+
+class MssCapture:
+    """
+    mss 기반 캡처. mss 인스턴스(OS 핸들)는 스레드마다 하나씩 만들어 재사용합니다.
+    만든 인스턴스는 모두 기억해 두었다가 close()에서 한꺼번에 닫습니다.
+    """
+    name = 'mss'
+
+    def __init__(self):
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._generation = 0
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        # close() 뒤에는 이전 세대의 인스턴스가 닫혔으므로 새로 만듭니다.
+        if session is None or self._local.generation != self._generation:
+            session = mss.mss()
+            with self._sessions_lock:
+                self._sessions.append(session)
+                self._local.generation = self._generation
+            self._local.session = session
+        return session
+
+    def grab_frame(self, bbox=None):
+        start = time.perf_counter()
+        session = self._session()
+        if bbox is None:
+            # bbox가 없으면 ImageGrab.grab()처럼 주 모니터 전체를 캡처합니다.
+            # (mss의 bbox는 가상 데스크톱 물리 좌표라 보조 모니터/음수 좌표도 그대로 캡처됩니다.)
+            monitor = session.monitors[1]
+            bbox = (monitor['left'], monitor['top'],
+                    monitor['left'] + monitor['width'], monitor['top'] + monitor['height'])
+        shot = session.grab(bbox)
+        # shot.raw(bytearray)를 그대로 가리키는 뷰라 복사가 없습니다.
+        pixels = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return Frame(pixels, 'BGRA', bbox, time.perf_counter() - start)
+
+    def close(self):
+        """모든 스레드에서 만든 mss 인스턴스를 닫습니다."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._generation += 1
+            for session in sessions:
+                session.close()
+        self._local.session = None
+
+
+class PilCapture:
+    """PIL.ImageGrab 기반 캡처 (mss가 없을 때)."""
+    name = 'pil'
+
+    def __init__(self):
+        self._primary = None
+
+    def _needs_all_screens(self, bbox):
+        """bbox가 주 모니터를 벗어나면 all_screens로 가상 데스크톱 전체에서 잘라야 합니다."""
+        if bbox is None:
+            return False
+        if self._primary is None:
+            import monitors
+            found = monitors.list_monitors()
+            self._primary = found[0].bbox if found else ()
+        if not self._primary:
+            return bbox[0] < 0 or bbox[1] < 0
+        left, top, right, bottom = self._primary
+        return bbox[0] < left or bbox[1] < top or bbox[2] > right or bbox[3] > bottom
+
+    def grab_frame(self, bbox=None):
+        from PIL import ImageGrab
+        start = time.perf_counter()
+        if self._needs_all_screens(bbox):
+            # 주 모니터만 캡처하는 기본 동작으로는 보조 모니터 영역이 검게 나옵니다. (Windows/macOS)
+            img = ImageGrab.grab(bbox=bbox, all_screens=True)
+        else:
+            img = ImageGrab.grab(bbox=bbox)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        frame = Frame(np.asarray(img), 'RGB', bbox, time.perf_counter() - start, image=img)
+        img.info['capture_seconds'] = frame.capture_seconds
+        img.info['bbox'] = bbox
+        return frame
+
+    def close(self):
+        pass
+
+
+def create_capture():
+    """사용 가능한 가장 빠른 캡처 방식을 만듭니다."""
+    if mss is not None:
+        return MssCapture()
+    return PilCapture()
+
+
+_default_capture = None
+_default_lock = threading.Lock()
+
+
+def get_capture():
+    """프로그램 전체가 함께 쓰는 캡처 객체 (처음 호출할 때 만듦)"""
+    global _default_capture
+    with _default_lock:
+        if _default_capture is None:
+            _default_capture = create_capture()
+        return _default_capture
+
+
+def grab(bbox=None):
+    """영역을 캡처해 RGB 이미지로 반환합니다. (img.info에 capture_seconds, bbox 기록)"""
+    return get_capture().grab_frame(bbox).to_image()
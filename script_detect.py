@@ -0,0 +1,172 @@
+"""
+OCR 언어 자동 감지: 원본 언어를 'auto'(또는 'auto:eng+jpn+kor'처럼 후보 지정)로 두면
+축소한 캡처에서 Tesseract OSD로 문자 체계(script)를 검출하고, 글자 영역마다 그 문자 체계에 맞는
+언어 데이터 하나로만 OCR 합니다. ('eng+jpn+kor'처럼 언어를 합쳐 한 번에 돌리는 것보다 훨씬 빠름)
+영역 OCR은 스레드 풀에서 병렬로 실행되며, 언어별 OCR 워커는 엔진이 캡처 사이에 재사용합니다.
+
+인식한 줄의 언어는 줄 키의 page_num 자리에 (언어, 영역 번호)로 남기므로 line_lang()으로 꺼냅니다.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ocr_engine
+import text_regions
+from ocr_model import group_lines
+from preprocess import PreprocessingEngine
+
+AUTO_LANG = 'auto'
+# 문자 체계 → 쓸 수 있는 언어 데이터 (앞쪽 우선). 자동 감지 후보는 이 순서로 정렬하며, 첫 후보가 검출 실패 시 기본값입니다.
+SCRIPT_LANGS = {
+    'Latin': ('eng', 'fra', 'deu', 'spa', 'ita', 'por', 'nld', 'pol', 'vie', 'ind', 'tur'),
+    'Hangul': ('kor',),
+    'Japanese': ('jpn',),
+    'Katakana': ('jpn',),
+    'Hiragana': ('jpn',),
+    'Han': ('chi_sim', 'chi_tra', 'jpn', 'kor'),
+    'Cyrillic': ('rus', 'ukr'),
+    'Arabic': ('ara',),
+    'Greek': ('ell',),
+    'Thai': ('tha',),
+    'Devanagari': ('hin',),
+    'Hebrew': ('heb',),
+}
+# OSD 신뢰도가 이 값보다 낮으면 화면 전체에서 검출한 문자 체계를 씁니다.
+MIN_SCRIPT_CONF = 0.5
+# 화면 전체 문자 체계 검출은 긴 변을 이 크기 이하로 줄인 이미지에서 합니다.
+OSD_MAX_SIDE = 1600
+# 이보다 작은 영역(단어 몇 개)은 OSD가 실패하므로 따로 검출하지 않습니다. (px², px)
+MIN_OSD_AREA = 160 * 48
+MIN_OSD_HEIGHT = 20
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def is_auto(lang):
+    return bool(lang) and lang.split(':')[0] == AUTO_LANG
+
+
+def _get_executor():
+    """영역 OCR용 스레드 풀 (처음 쓸 때 만들고 이후 재사용)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # 엔진의 언어별 워커 수와 같은 폭이라 같은 언어의 영역끼리도 워커를 기다리지 않습니다.
+            _executor = ThreadPoolExecutor(max_workers=ocr_engine.WORKERS_PER_LANG, thread_name_prefix='ocr-lang')
+        return _executor
+
+
+def candidate_langs(engine, spec):
+    """
+    자동 감지 후보 언어 목록. 'auto:eng+jpn'이면 그 언어들, 'auto'면 설치된 언어 데이터 중
+    SCRIPT_LANGS에 있는 언어들입니다. (알 수 없으면 ['eng'])
+    """
+    if ':' in spec:
+        return [lang for lang in spec.split(':', 1)[1].split('+') if lang] or ['eng']
+    try:
+        installed = set(engine.languages())
+    except Exception:
+        installed = set()
+    candidates = []
+    for langs in SCRIPT_LANGS.values():
+        for lang in langs:
+            if lang in installed and lang not in candidates:
+                candidates.append(lang)
+    return candidates or ['eng']
+
+
+def pick_lang(script, candidates):
+    """문자 체계에 맞는 후보 언어 (없으면 None)"""
+    langs = SCRIPT_LANGS.get(script, ())
+    for lang in candidates:
+        if lang in langs:
+            return lang
+    return None
+
+
+def detect_lang(engine, img, candidates):
+    """이미지의 문자 체계를 검출해 후보 언어 중 하나를 고릅니다. (실패하면 None)"""
+    try:
+        found = engine.detect_script(img)
+    except ocr_engine.OcrEngineError:
+        # osd.traineddata가 없으면 검출할 수 없습니다.
+        return None
+    if found is None or found[1] < MIN_SCRIPT_CONF:
+        return None
+    return pick_lang(found[0], candidates)
+
+
+def _downscale(img):
+    scale = OSD_MAX_SIDE / max(img.size)
+    if scale >= 1:
+        return img
+    return img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))))
+
+
+def _ocr_region(engine, img, lang, preset, index, region):
+    """영역 하나를 OCR 해 전체 이미지 좌표의 데이터로 반환합니다. (page_num = (언어, 영역 번호))"""
+    x1, y1, x2, y2 = region
+    wrapped = PreprocessingEngine(engine, preset)
+    data = wrapped.image_to_data(img.crop(region), lang)
+    data['page_num'] = [(lang, index + 1)] * len(data['text'])
+    data['left'] = [left + x1 for left in data['left']]
+    data['top'] = [top + y1 for top in data['top']]
+    return data, sum(wrapped.timings.values())
+
+
+def recognize_auto(engine, img, spec=AUTO_LANG, preset='none', east_model_path='', timings=None):
+    """
+    문자 체계를 감지해 영역별로 맞는 언어로 OCR 하고 OcrLine 목록을 반환합니다.
+    (recognize.recognize에서 언어가 'auto'일 때 호출)
+    """
+    if timings is None:
+        timings = {}
+    executor = _get_executor()
+    candidates = candidate_langs(engine, spec)
+
+    start = time.perf_counter()
+    regions = text_regions.detect_regions(img, east_model_path)
+    if len(candidates) == 1:
+        region_langs = [candidates[0]] * len(regions)
+    else:
+        # 화면 전체(축소본)의 문자 체계를 기본값으로 하고, 충분히 큰 영역은 따로 검출합니다.
+        page_future = executor.submit(detect_lang, engine, _downscale(img), candidates)
+        futures = [executor.submit(detect_lang, engine, img.crop(region), candidates)
+                   if (region[2] - region[0]) * (region[3] - region[1]) >= MIN_OSD_AREA
+                   and region[3] - region[1] >= MIN_OSD_HEIGHT else None
+                   for region in regions]
+        page_lang = page_future.result() or candidates[0]
+        region_langs = [(future.result() if future is not None else None) or page_lang for future in futures]
+    timings['detect'] = time.perf_counter() - start
+
+    futures = [executor.submit(_ocr_region, engine, img, lang, preset, index, region)
+               for index, (region, lang) in enumerate(zip(regions, region_langs))]
+    merged = {key: [] for key in ocr_engine.DATA_KEYS}
+    preprocess_seconds = 0.0
+    for future in futures:
+        data, seconds = future.result()
+        preprocess_seconds += seconds
+        for key in ocr_engine.DATA_KEYS:
+            merged[key].extend(data[key])
+    if preprocess_seconds:
+        timings['preprocess'] = preprocess_seconds
+
+    start = time.perf_counter()
+    lines = group_lines(merged)
+    timings['group'] = time.perf_counter() - start
+    return lines
+
+
+def line_lang(line, default=None):
+    """recognize_auto로 인식한 줄의 언어 (그 외의 줄은 default)"""
+    page = line.key[0]
+    if isinstance(page, (tuple, list)) and page and isinstance(page[0], str):
+        return page[0]
+    return default
+
+
+def warm_up(engine, spec=AUTO_LANG):
+    """OSD 워커와 첫 후보 언어의 워커를 미리 로드합니다."""
+    engine.warm_up(ocr_engine.OSD_LANG)
+    engine.warm_up(candidate_langs(engine, spec)[0])
@@ -0,0 +1,103 @@
+"""
+batch.run_batch를 네트워크/Tesseract 없이 실행하는 테스트: 정해진 단어를 돌려주는 StubEngine과 StubTranslator를 씁니다.
+
+사용법:
+    python -m pytest tests
+"""
+import json
+import os
+import sys
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import batch  # noqa: E402
+import layout  # noqa: E402
+import translation  # noqa: E402
+from ocr_model import OcrLine, OcrWord  # noqa: E402
+from translation_cache import TranslationCache  # noqa: E402
+
+# 이미지와 상관없이 돌려줄 OCR 결과 (Output.DICT 형식): "Hello world" / "Bye" 두 줄
+STUB_DATA = {
+    'level': [5, 5, 5], 'page_num': [1, 1, 1], 'block_num': [1, 1, 1], 'par_num': [1, 1, 1],
+    'line_num': [1, 1, 2], 'word_num': [1, 2, 1],
+    'left': [10, 70, 10], 'top': [10, 10, 50], 'width': [50, 55, 40], 'height': [20, 20, 20],
+    'conf': [95.0, 95.0, 95.0], 'text': ['Hello', 'world', 'Bye'],
+}
+
+
+class StubEngine:
+    name = 'stub'
+    warm = True
+
+    def __init__(self, tesseract_cmd=''):
+        pass
+
+    def image_to_data(self, img, lang, psm=None):
+        return {key: list(values) for key, values in STUB_DATA.items()}
+
+
+def make_screenshots(folder, count):
+    for i in range(count):
+        img = Image.new('RGB', (200, 90), 'white')
+        ImageDraw.Draw(img).text((10, 10), f"Hello world {i}", fill='black')
+        img.save(os.path.join(folder, f"shot{i}.png"))
+
+
+def test_run_batch_with_stub_translator(tmp_path):
+    screenshots = tmp_path / 'shots'
+    out_dir = tmp_path / 'out'
+    screenshots.mkdir()
+    make_screenshots(str(screenshots), 3)
+
+    translator = translation.StubTranslator()
+    cache = TranslationCache(':memory:')
+    try:
+        stats = batch.run_batch(str(screenshots), str(out_dir), translator, cache, lang='eng', target_lang='KO',
+                                workers=1, batch_size=2, engine_factory=StubEngine)
+    finally:
+        cache.close()
+
+    assert stats['images'] == 3
+    assert stats['lines'] == 6
+    # 같은 줄은 번역 메모리에서 채워지므로 처음 두 줄만 번역기로 보냅니다.
+    assert translator.characters == len("Hello world") + len("Bye")
+
+    for i in range(3):
+        with open(out_dir / f"shot{i}.json", encoding='utf-8') as f:
+            result = json.load(f)
+        assert result['image'] == f"shot{i}.png"
+        assert [line['text'] for line in result['lines']] == ["Hello world", "Bye"]
+        assert [line['translation'] for line in result['lines']] == ["[KO] Hello world", "[KO] Bye"]
+        assert result['lines'][0]['box'] == [10, 10, 115, 20]
+        assert result['lines'][0]['conf'] == 95.0
+
+
+def test_run_batch_render_overlay(tmp_path):
+    make_screenshots(str(tmp_path), 1)
+    out_dir = tmp_path / 'out'
+    cache = TranslationCache(':memory:')
+    try:
+        batch.run_batch(str(tmp_path), str(out_dir), translation.StubTranslator(), cache,
+                        workers=1, render=True, engine_factory=StubEngine)
+    finally:
+        cache.close()
+    with Image.open(out_dir / 'shot0_overlay.png') as overlay:
+        assert overlay.size == (200, 90)
+        # 번역 박스(흰 바탕, 회색 테두리)가 줄 위치에 그려집니다.
+        assert overlay.getpixel((10, 10)) == (136, 136, 136)
+        assert overlay.getpixel((120, 12)) == (255, 255, 255)
+        assert overlay.getpixel((150, 80)) == (255, 255, 255)
+
+
+def test_render_overlay_uses_layout_boxes():
+    lines = [OcrLine((1, 1, 1, 1), [OcrWord('Hello', 10, 10, 60, 20)]),
+             OcrLine((1, 1, 1, 2), [OcrWord('Bye', 10, 32, 60, 20)])]
+    translated = ["a much longer translation that wraps", "second"]
+    img = Image.new('RGB', (120, 120), 'black')
+    boxes = layout.layout_lines(lines, translated)
+    out = batch.render_overlay(img, lines, translated)
+    # 긴 번역으로 늘어난 첫 박스에 밀려 내려간 두 번째 박스까지 그려집니다.
+    assert boxes[1].top > 32
+    assert out.getpixel((boxes[1].left, round(boxes[1].top + boxes[1].height) - 1)) == (136, 136, 136)
+    assert out.getpixel((100, 5)) == (0, 0, 0)
@@ -0,0 +1,121 @@
+"""
+history.HistoryStore 테스트: 전문 검색, CSV/JSONL 내보내기, 쓰기가 밀렸을 때 새 기록을 버리는 정책.
+
+사용법:
+    python -m pytest tests
+"""
+import csv
+import io
+import json
+import os
+import sys
+import threading
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import history  # noqa: E402
+from history import HistoryStore  # noqa: E402
+from ocr_model import OcrLine, OcrWord  # noqa: E402
+
+
+def make_lines(*texts):
+    return [OcrLine((1, 1, 1, i), [OcrWord(text, 10, 20 * i, 8 * len(text), 16, 90.0)])
+            for i, text in enumerate(texts, 1)]
+
+
+def record(store, texts, translated, img=None):
+    img = img or Image.new('RGB', (640, 360), 'white')
+    return store.record(img, make_lines(*texts), translated, timings={'ocr': 0.1234567},
+                        ocr_lang='eng', target_lang='KO')
+
+
+@pytest.fixture
+def filled_store(tmp_path):
+    """세 건을 기록하고 모두 쓴 뒤 다시 연 저장소"""
+    path = str(tmp_path / 'history.db')
+    store = HistoryStore(path)
+    img = Image.new('RGB', (1280, 720), 'navy')
+    img.info['bbox'] = (0, 0, 1280, 720)
+    assert record(store, ["Press START"], ["시작 버튼을 누르세요"], img)
+    assert record(store, ["Quest complete"], ["퀘스트 완료"])
+    assert record(store, ["Settings", "Audio"], ["설정", "소리"])
+    # close()는 큐에 남은 기록을 모두 쓴 뒤 닫습니다.
+    store.close()
+    store = HistoryStore(path)
+    yield store
+    store.close()
+
+
+def test_search(filled_store):
+    store = filled_store
+    assert store.fts
+    assert store.count() == 3
+    # 최신순
+    assert [row[4] for row in store.search()] == ["Settings\nAudio", "Quest complete", "Press START"]
+    assert [row[4] for row in store.search("complete")] == ["Quest complete"]
+    # 번역문도 찾고, 3글자 미만 검색어는 LIKE로 찾습니다.
+    assert [row[5] for row in store.search("버튼을")] == ["시작 버튼을 누르세요"]
+    assert [row[5] for row in store.search("소리")] == ["설정\n소리"]
+    # FTS 연산자처럼 보이는 검색어도 그대로 찾습니다.
+    assert store.search('"START OR') == []
+    assert store.search("100%") == []
+
+
+def test_get_detail(filled_store):
+    item = filled_store.get(filled_store.search("START")[0][0])
+    assert item['bbox'] == [0, 0, 1280, 720]
+    assert item['lines'] == [{'text': "Press START", 'translated': "시작 버튼을 누르세요", 'box': [10, 20, 88, 16]}]
+    assert item['timings'] == {'ocr': 0.123457}
+    with Image.open(io.BytesIO(item['thumbnail'])) as thumb:
+        assert thumb.format == 'JPEG'
+        assert thumb.size == (history.THUMBNAIL_SIZE, 180)
+    assert filled_store.get(12345) is None
+
+
+def test_export_csv_and_jsonl(filled_store, tmp_path):
+    csv_path = str(tmp_path / 'out.csv')
+    assert filled_store.export(csv_path) == 3
+    with open(csv_path, encoding='utf-8-sig', newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(history.CSV_COLUMNS)
+    # 오래된 기록부터 씁니다.
+    assert [row[4] for row in rows[1:]] == ["Press START", "Quest complete", "Settings\nAudio"]
+
+    jsonl_path = str(tmp_path / 'out.jsonl')
+    assert filled_store.export(jsonl_path, text="Quest") == 1
+    with open(jsonl_path, encoding='utf-8') as f:
+        items = [json.loads(line) for line in f]
+    assert len(items) == 1
+    assert items[0]['translated_text'] == "퀘스트 완료"
+    assert 'thumbnail' not in items[0]
+
+
+class BlockedStore(HistoryStore):
+    """release가 설정될 때까지 쓰기 스레드가 큐를 비우지 않는 저장소"""
+    release = None
+
+    def _write_loop(self):
+        self.release.wait(5)
+        super()._write_loop()
+
+
+def test_full_queue_drops_new_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, 'MAX_PENDING', 2)
+    BlockedStore.release = threading.Event()
+    store = BlockedStore(str(tmp_path / 'history.db'))
+    try:
+        assert record(store, ["one"], ["하나"])
+        assert record(store, ["two"], ["둘"])
+        assert not record(store, ["three"], ["셋"])
+        assert store.dropped == 1
+    finally:
+        BlockedStore.release.set()
+        store.close()
+
+    store = HistoryStore(str(tmp_path / 'history.db'))
+    try:
+        assert [row[4] for row in store.search()] == ["two", "one"]
+    finally:
+        store.close()
@@ -0,0 +1,86 @@
+"""
+layout 테스트: 글꼴 크기 이진 탐색(fit_font_size)과 겹친 박스 밀어내기(resolve_overlaps).
+글꼴 파일에 따라 결과가 달라지지 않도록 글자 폭/줄 높이가 크기에 비례하는 가짜 메트릭을 씁니다.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import layout  # noqa: E402
+from layout import LayoutBox, fit_font_size, layout_lines, resolve_overlaps  # noqa: E402
+from ocr_model import OcrLine, OcrWord  # noqa: E402
+
+
+class LinearMetrics:
+    """글자당 폭 0.5·size, 줄 높이 1.2·size"""
+
+    def text_width(self, text, size):
+        return len(text) * size * 0.5
+
+    def line_height(self, size):
+        return size * 1.2
+
+
+def box(left, top, width, height, text='x'):
+    return LayoutBox(left, top, width, height, text, 12, width)
+
+
+def test_fit_font_size_single_line_limited_by_height():
+    size, height = fit_font_size(LinearMetrics(), "Hi", 400, 30)
+    # 1.2·size + 여백 2 <= 30 인 가장 큰 크기
+    assert size == 23
+    assert height == 23 * 1.2
+
+
+def test_fit_font_size_is_largest_that_fits():
+    metrics = LinearMetrics()
+    text = "a fairly long translated sentence that needs wrapping"
+    for width, height in ((200, 60), (400, 40), (80, 200)):
+        size, text_height = fit_font_size(metrics, text, width, height)
+        assert size > layout.MIN_FONT_PX
+        assert text_height + layout.PADDING_Y * 2 <= height
+        wrap = width - layout.PADDING_X * 2
+        bigger = size + 1
+        if bigger <= min(layout.MAX_FONT_PX, height):
+            lines = layout.count_wrapped_lines(metrics, text, bigger, wrap)
+            assert lines * metrics.line_height(bigger) + layout.PADDING_Y * 2 > height
+
+
+def test_fit_font_size_falls_back_to_minimum():
+    size, _ = fit_font_size(LinearMetrics(), "word " * 50, 30, 10)
+    assert size == layout.MIN_FONT_PX
+
+
+def test_wrap_text_matches_count_wrapped_lines():
+    metrics = LinearMetrics()
+    for text, width in (("a fairly long translated sentence", 60), ("가나다라마바사아자차카타파하" * 2, 50),
+                        ("short", 400), ("mixed 가나다라마바사아자차카타파하 words", 45)):
+        wrapped = layout.wrap_text(metrics, text, 10, width)
+        assert len(wrapped) == layout.count_wrapped_lines(metrics, text, 10, width)
+        assert "".join(wrapped).replace(" ", "") == text.replace(" ", "")
+        assert all(metrics.text_width(line, 10) <= width for line in wrapped)
+
+
+def test_resolve_overlaps_pushes_down_only_overlapping_columns():
+    upper = box(0, 0, 100, 30)
+    lower = box(10, 20, 100, 20)
+    beside = box(200, 5, 50, 20)
+    chained = box(0, 45, 50, 10)
+    resolve_overlaps([chained, lower, beside, upper])
+    assert upper.top == 0
+    assert lower.top == 30 + layout.MIN_GAP
+    # 오른쪽 열은 왼쪽 박스와 가로로 겹치지 않으므로 그대로입니다.
+    assert beside.top == 5
+    # 밀려난 박스 아래에 있던 박스도 이어서 밀립니다.
+    assert chained.top == lower.top + lower.height + layout.MIN_GAP
+
+
+def test_layout_lines_skips_empty_translations():
+    lines = [OcrLine((1, 1, 1, 1), [OcrWord('Hello', 10, 10, 60, 20)]),
+             OcrLine((1, 1, 1, 2), [OcrWord('???', 10, 40, 30, 20)])]
+    boxes = layout_lines(lines, ["안녕하세요", "  "], LinearMetrics())
+    assert [b.text for b in boxes] == ["안녕하세요"]
+    assert (boxes[0].left, boxes[0].top, boxes[0].width) == (10, 10, 60)
@@ -0,0 +1,62 @@
+"""
+ocr_cache 테스트: 이미지 내용/설정으로 만든 키와, 디스크 저장(JSON) 후 다시 읽은 줄 목록을 확인합니다.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import script_detect  # noqa: E402
+from ocr_cache import OcrCache, lines_from_json, lines_to_json  # noqa: E402
+from ocr_model import OcrLine, OcrWord  # noqa: E402
+
+
+def make_lines():
+    return [OcrLine((('jpn', 2), 1, 1, 1), [OcrWord('設定', 10, 20, 40, 16, 91.5)]),
+            OcrLine(((3, 1), 1, 1, 2), [OcrWord('Hello', 5, 50, 30, 12, 88.0), OcrWord('world', 40, 50, 32, 12)]),
+            OcrLine((1, 2, 1, 1), [OcrWord('Bye', 5, 80, 20, 12, 70.0)])]
+
+
+def test_key_depends_on_pixels_and_settings():
+    img = Image.new('RGB', (32, 16), 'white')
+    same = Image.new('RGB', (32, 16), 'white')
+    changed = img.copy()
+    changed.putpixel((3, 3), (0, 0, 0))
+
+    key = OcrCache.make_key(img, 'tesserocr', 'eng', 'none')
+    assert OcrCache.make_key(same, 'tesserocr', 'eng', 'none') == key
+    assert OcrCache.make_key(changed, 'tesserocr', 'eng', 'none') != key
+    assert OcrCache.make_key(img, 'tesserocr', 'kor', 'none') != key
+    # 같은 바이트라도 크기가 다르면 다른 키입니다.
+    assert OcrCache.make_key(Image.new('RGB', (16, 32), 'white'), 'tesserocr', 'eng', 'none') != key
+
+
+def test_json_roundtrip_keeps_tuple_page_num():
+    lines = lines_from_json(lines_to_json(make_lines()))
+    assert [line.key for line in lines] == [line.key for line in make_lines()]
+    assert script_detect.line_lang(lines[0]) == 'jpn'
+    assert [(w.text, w.left, w.top, w.width, w.height, w.conf) for w in lines[1].words] == \
+        [('Hello', 5, 50, 30, 12, 88.0), ('world', 40, 50, 32, 12, -1.0)]
+    # 키는 그대로 딕셔너리 키로 쓸 수 있어야 합니다.
+    assert len({line.key for line in lines}) == 3
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    path = str(tmp_path / 'ocr_cache.db')
+    cache = OcrCache(path)
+    cache.put('k', make_lines())
+    cache.close()
+
+    cache = OcrCache(path)
+    try:
+        lines = cache.get('k')
+        assert [line.text for line in lines] == ['設定', 'Hello world', 'Bye']
+        assert lines[0].key[0] == ('jpn', 2)
+        assert cache.get('missing') is None
+        assert (cache.hits, cache.misses) == (1, 1)
+    finally:
+        cache.close()
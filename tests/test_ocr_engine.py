@@ -0,0 +1,112 @@
+"""
+ocr_engine의 워커 풀 테스트: Tesseract 없이 가짜 워커로 _PooledEngine의 재사용/종료 동작을 확인합니다.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+import threading
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ocr_engine  # noqa: E402
+from recognize import recognize  # noqa: E402
+
+
+class BlockingEngine(ocr_engine._PooledEngine):
+    """인식 도중 started를 알리고 proceed가 설정될 때까지 멈추는 엔진"""
+    name = 'blocking'
+
+    def __init__(self):
+        super().__init__(workers_per_lang=1)
+        self.started = threading.Event()
+        self.proceed = threading.Event()
+        self.ended = []
+
+    def _create_api(self, lang):
+        return object()
+
+    def _end_api(self, api):
+        self.ended.append(api)
+
+    def image_to_data(self, img, lang, psm=None):
+        api = self._acquire(lang)
+        try:
+            self.started.set()
+            self.proceed.wait(5)
+            return {key: [] for key in ocr_engine.DATA_KEYS}
+        finally:
+            self._release(lang, api)
+
+
+def test_pool_reuses_workers():
+    engine = BlockingEngine()
+    engine.proceed.set()
+    img = Image.new('RGB', (40, 20), 'white')
+    engine.image_to_data(img, 'eng')
+    engine.image_to_data(img, 'eng')
+    assert engine._created == {'eng': 1}
+    engine.close()
+    assert len(engine.ended) == 1
+
+
+def test_default_pool_width_follows_cores():
+    engine = ocr_engine._PooledEngine()
+    assert engine.workers_per_lang == ocr_engine.WORKERS_PER_LANG == (os.cpu_count() or 2)
+
+
+def test_close_during_recognize():
+    engine = BlockingEngine()
+    img = Image.new('RGB', (40, 20), 'white')
+    result = {}
+
+    def run():
+        try:
+            result['lines'] = recognize(engine, img, 'eng')
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert engine.started.wait(5)
+    # 인식 중인 워커는 아직 풀에 없으므로 닫아도 해제되지 않습니다.
+    engine.close()
+    assert engine.ended == []
+    engine.proceed.set()
+    thread.join(5)
+
+    assert result == {'lines': []}
+    # 인식이 끝나면서 돌려놓으려던 워커가 그 자리에서 해제됩니다.
+    assert len(engine.ended) == 1
+    with pytest.raises(ocr_engine.OcrEngineError):
+        engine.image_to_data(img, 'eng')
+
+
+def test_close_wakes_waiting_thread():
+    engine = BlockingEngine()
+    img = Image.new('RGB', (40, 20), 'white')
+    errors = []
+
+    def run():
+        try:
+            engine.image_to_data(img, 'eng')
+        except ocr_engine.OcrEngineError as e:
+            errors.append(e)
+
+    first = threading.Thread(target=run)
+    first.start()
+    assert engine.started.wait(5)
+    # 워커가 하나뿐이라 두 번째 호출은 풀에서 기다립니다.
+    second = threading.Thread(target=run)
+    second.start()
+    second.join(0.2)
+    engine.close()
+    second.join(5)
+    assert not second.is_alive()
+    assert len(errors) == 1
+    engine.proceed.set()
+    first.join(5)
+    assert len(engine.ended) == 1
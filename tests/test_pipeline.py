@@ -0,0 +1,123 @@
+"""
+pipeline.TranslationPipeline 테스트: 처리 중에 새 캡처가 들어오면 이전 캡처는 결과를 내지 않고(single-flight),
+대기 중이던 낡은 캡처는 다음 단계로 가지 않는지 확인합니다.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pipeline import TranslationPipeline  # noqa: E402
+
+
+class Recorder:
+    """OCR/번역 단계와 결과 콜백. 첫 OCR은 release가 설정될 때까지 멈춥니다."""
+
+    def __init__(self):
+        self.ocr_started = threading.Event()
+        self.release = threading.Event()
+        self.ocr_jobs = []
+        self.translated_jobs = []
+        self.results = []
+        self.errors = []
+
+    def ocr(self, job):
+        self.ocr_jobs.append(job.img)
+        self.ocr_started.set()
+        self.release.wait(5)
+        job.lines = [job.img]
+
+    def translate(self, job):
+        self.translated_jobs.append(job.img)
+        job.translated = [f"T({job.img})"]
+
+    def on_result(self, job):
+        self.results.append((job.img, job.translated))
+
+    def on_error(self, job, error):
+        self.errors.append((job.img, error))
+
+
+def make_pipeline(recorder):
+    return TranslationPipeline(recorder.ocr, recorder.translate, recorder.on_result, recorder.on_error)
+
+
+def test_single_job_passes_through_both_stages():
+    recorder = Recorder()
+    recorder.release.set()
+    pipeline = make_pipeline(recorder)
+    try:
+        job = pipeline.submit('a', 'eng', 'KO')
+        assert job.done.wait(5)
+        assert recorder.results == [('a', ['T(a)'])]
+        assert {'queue', 'ocr', 'translate', 'total'} <= set(job.timings)
+    finally:
+        pipeline.close()
+
+
+def test_timings_given_to_submit_are_there_before_ocr():
+    seen = []
+
+    def ocr(job):
+        seen.append(dict(job.timings))
+        job.lines = [job.img]
+
+    results = []
+    pipeline = TranslationPipeline(ocr, lambda job: None, results.append, lambda job, e: None)
+    try:
+        job = pipeline.submit('a', 'eng', 'KO', timings={'capture': 0.25})
+        assert job.done.wait(5)
+        assert seen[0]['capture'] == 0.25
+        assert results[0].timings['capture'] == 0.25
+    finally:
+        pipeline.close()
+
+
+def test_newer_capture_replaces_running_and_queued_ones():
+    recorder = Recorder()
+    pipeline = make_pipeline(recorder)
+    try:
+        first = pipeline.submit('first', 'eng', 'KO')
+        assert recorder.ocr_started.wait(5)
+        # 첫 캡처의 OCR이 도는 동안 두 장이 더 들어오면 큐에는 마지막 것만 남습니다.
+        second = pipeline.submit('second', 'eng', 'KO')
+        third = pipeline.submit('third', 'eng', 'KO')
+        assert second.done.wait(5)
+        recorder.release.set()
+        assert third.done.wait(5)
+        assert first.done.wait(5)
+
+        assert recorder.ocr_jobs == ['first', 'third']
+        # 첫 캡처는 OCR이 끝났을 때 이미 낡았으므로 번역하지 않습니다.
+        assert recorder.translated_jobs == ['third']
+        assert recorder.results == [('third', ['T(third)'])]
+        assert recorder.errors == []
+    finally:
+        pipeline.close()
+
+
+def test_error_of_stale_job_is_not_reported():
+    recorder = Recorder()
+    failing = threading.Event()
+
+    def ocr(job):
+        if job.img == 'bad':
+            failing.set()
+            recorder.release.wait(5)
+            raise RuntimeError("OCR 실패")
+        job.lines = [job.img]
+
+    pipeline = TranslationPipeline(ocr, recorder.translate, recorder.on_result, recorder.on_error)
+    try:
+        bad = pipeline.submit('bad', 'eng', 'KO')
+        assert failing.wait(5)
+        good = pipeline.submit('good', 'eng', 'KO')
+        recorder.release.set()
+        assert bad.done.wait(5) and good.done.wait(5)
+        assert recorder.errors == []
+        assert recorder.results == [('good', ['T(good)'])]
+    finally:
+        pipeline.close()
@@ -0,0 +1,97 @@
+"""
+preprocess 테스트: 흑백 변환, 다크 테마 반전, 글자 높이 추정/배율, 적응형 이진화와 좌표 복원.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import preprocess  # noqa: E402
+from preprocess import PreprocessingEngine  # noqa: E402
+
+
+def text_rows(line_height, lines=3, width=200, gap=20, background=255, ink=0):
+    """가로 줄무늬 '글줄'이 있는 흑백 배열 (글줄 높이 line_height)"""
+    height = gap + lines * (line_height + gap)
+    arr = np.full((height, width), background, dtype=np.uint8)
+    for i in range(lines):
+        top = gap + i * (line_height + gap)
+        arr[top:top + line_height, 10:150:3] = ink
+    return arr
+
+
+def test_to_gray_weights():
+    arr = np.array([[[255, 255, 255], [255, 0, 0], [0, 255, 0], [0, 0, 255]]], dtype=np.uint8)
+    gray = preprocess.to_gray(arr)
+    assert gray.dtype == np.uint8
+    assert gray.tolist() == [[255, 76, 149, 28]]
+    assert preprocess.to_gray(gray) is gray
+
+
+def test_invert_dark_theme_only():
+    dark = text_rows(10, background=30, ink=220)
+    assert preprocess.invert_dark(dark).mean() > 128
+    light = text_rows(16)
+    assert preprocess.invert_dark(light) is light
+
+
+def test_estimate_text_height_and_scale():
+    assert preprocess.estimate_text_height(text_rows(16)) == 16
+    assert preprocess.estimate_text_height(np.full((50, 50), 255, dtype=np.uint8)) is None
+
+    small, scale = preprocess.scale_for_ocr(text_rows(16))
+    assert scale == preprocess.TARGET_TEXT_HEIGHT / 16
+    assert small.shape[0] == round(text_rows(16).shape[0] * scale)
+    # 이미 알맞은 크기면 리사이즈하지 않습니다.
+    same = text_rows(30)
+    assert preprocess.scale_for_ocr(same) == (same, 1.0)
+
+
+def test_adaptive_binarize_handles_gradient_background():
+    arr = text_rows(12)
+    # 왼쪽은 밝고 오른쪽은 어두운 배경
+    background = np.linspace(250, 120, arr.shape[1]).astype(np.uint8)
+    arr = np.where(arr == 0, (background // 3)[None, :], background[None, :]).astype(np.uint8)
+    binary = preprocess.adaptive_binarize(arr)
+    assert set(np.unique(binary)) <= {0, 255}
+    assert (binary[:, 160:] == 255).all()
+    assert (binary[20:32, 10:150:3] == 0).all()
+
+
+def test_preprocess_presets():
+    img = Image.fromarray(np.stack([text_rows(16)] * 3, axis=-1))
+    assert preprocess.preprocess(img, 'none') == (img, 1.0)
+    timings = {}
+    processed, scale = preprocess.preprocess(img, 'accurate', timings)
+    assert processed.mode == 'L'
+    assert scale == preprocess.TARGET_TEXT_HEIGHT / 16
+    assert set(timings) == {'gray', 'invert', 'scale', 'binarize'}
+
+
+class RecordingEngine:
+    name = 'recording'
+
+    def __init__(self):
+        self.sizes = []
+
+    def image_to_data(self, img, lang):
+        self.sizes.append(img.size)
+        # 전처리된 이미지 좌표로 단어 하나를 돌려줍니다.
+        return {'left': [32], 'top': [64], 'width': [96], 'height': [32], 'text': ['word']}
+
+
+def test_preprocessing_engine_restores_coordinates():
+    engine = RecordingEngine()
+    img = Image.fromarray(text_rows(16))
+    wrapped = PreprocessingEngine(engine, 'ui')
+    data = wrapped.image_to_data(img, 'eng')
+    scale = preprocess.TARGET_TEXT_HEIGHT / 16
+    assert engine.sizes == [(round(img.width * scale), round(img.height * scale))]
+    assert (data['left'], data['top'], data['width'], data['height']) == ([16], [32], [48], [16])
+    assert wrapped.name == 'recording'
+    assert set(wrapped.timings) == {'gray', 'invert', 'scale'}
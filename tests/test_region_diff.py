@@ -0,0 +1,119 @@
+"""
+region_diff 테스트: 스크롤 이동량 추정, 바뀐 행을 띠로 묶기, 바뀌지 않은 줄 재사용.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import region_diff  # noqa: E402
+from ocr_model import OcrLine, OcrWord  # noqa: E402
+from region_diff import RegionDiff, changed_bands, changed_rows, estimate_scroll  # noqa: E402
+
+
+def line(top, height, text='x', left=0, width=50):
+    return OcrLine((1, 1, 1, top), [OcrWord(text, left, top, width, height)])
+
+
+def striped(rows, width=40):
+    """행마다 값이 다른 줄무늬 흑백 이미지 (값이 0인 행은 빈 배경)"""
+    arr = np.zeros((len(rows), width), dtype=np.uint8)
+    for y, value in enumerate(rows):
+        if value:
+            arr[y, ::2] = value
+    return arr
+
+
+def test_estimate_scroll_finds_shift():
+    prev = [None, 11, 12, 13, 14, 15, None]
+    # 채팅 로그처럼 두 행 위로 밀리고 아래에 새 행이 생긴 경우
+    now = [12, 13, 14, 15, None, 21, 22]
+    assert estimate_scroll(prev, now) == 2
+    assert estimate_scroll(prev, prev) == 0
+    assert estimate_scroll(prev, [31, 32, 33]) == 0
+
+
+def test_changed_rows_after_alignment():
+    prev = striped([0, 40, 80, 120, 160, 200])
+    now = striped([80, 120, 160, 200, 240, 250])
+    changed = changed_rows(prev, now, 2)
+    # 이전 프레임 밖에서 들어온 마지막 두 행만 바뀐 것으로 봅니다.
+    assert changed.tolist() == [False, False, False, False, True, True]
+    assert changed_rows(prev, now, 0).all()
+
+
+def test_changed_bands_widen_to_lines_and_merge():
+    height = 200
+    changed = np.zeros(height, dtype=bool)
+    changed[50:52] = True
+    changed[70:72] = True
+    changed[150:152] = True
+    lines = [line(40, 20), line(140, 20)]
+    bands = changed_bands(changed, lines, height)
+    pad = region_diff.BAND_PADDING
+    # 50행의 변화는 40~60 줄 전체로 넓혀지고, 가까운 70행 띠와 합쳐집니다.
+    assert bands == [(40 - pad, 72 + pad), (140 - pad, 160 + pad)]
+
+
+def test_changed_bands_include_stacked_touching_lines():
+    height = 200
+    changed = np.zeros(height, dtype=bool)
+    changed[50:52] = True
+    # 서로 붙은 세 줄. 아래 줄부터 놓여 있어 한 번 훑어서는 띠가 아래 줄까지 넓어지지 않습니다.
+    stacked = [line(100, 30, 'third'), line(70, 30, 'second'), line(40, 30, 'first')]
+    far = line(170, 20, 'far')
+    bands = changed_bands(changed, stacked + [far], height)
+    pad = region_diff.BAND_PADDING
+    assert bands == [(40 - pad, 130 + pad)]
+    # 띠에 반만 걸친 줄이 없어야 다시 인식할 때 잘리지 않습니다.
+    for item in stacked + [far]:
+        for top, bottom in bands:
+            overlaps = item.top < bottom and top < item.top + item.height
+            assert not overlaps or (top <= item.top and item.top + item.height <= bottom)
+
+
+def test_changed_bands_merge_after_widening():
+    height = 300
+    changed = np.zeros(height, dtype=bool)
+    changed[20:22] = True
+    changed[120:122] = True
+    # 두 번째 띠가 위로 긴 줄까지 넓어지면 첫 번째 띠와 겹칩니다.
+    bands = changed_bands(changed, [line(25, 100, 'tall')], height)
+    assert bands == [(14, 125 + region_diff.BAND_PADDING)]
+
+
+def test_region_diff_reuses_unchanged_lines():
+    calls = []
+
+    def ocr(img):
+        calls.append(img.size)
+        if img.size[1] == 120:
+            return [line(10, 12, 'first'), line(60, 12, 'second')]
+        return [line(4, 12, 'changed')]
+
+    arr = np.full((120, 80), 255, dtype=np.uint8)
+    arr[10:22, 5:40:2] = 0
+    arr[60:72, 5:40:2] = 0
+    diff = RegionDiff()
+    first = diff.recognize('key', Image.fromarray(arr), ocr)
+    assert [l.text for l in first] == ['first', 'second']
+
+    # 같은 화면이면 OCR 하지 않습니다.
+    again = diff.recognize('key', Image.fromarray(arr), ocr)
+    assert [l.text for l in again] == ['first', 'second']
+    assert calls == [(80, 120)]
+
+    # 두 번째 줄만 바뀌면 그 띠만 다시 인식하고 첫 줄은 재사용합니다.
+    arr[60:72, 5:40:2] = 255
+    arr[60:72, 6:40:2] = 0
+    merged = diff.recognize('key', Image.fromarray(arr), ocr)
+    assert [l.text for l in merged] == ['first', 'changed']
+    assert merged[1].top == 60 - region_diff.BAND_PADDING + 4
+    assert len(calls) == 2 and calls[1][1] < 120
+    assert diff.rows_total == 360
+    assert diff.rows_ocr == 120 + calls[1][1]
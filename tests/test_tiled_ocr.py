@@ -0,0 +1,61 @@
+"""
+tiled_ocr 테스트: 타일 분할과, 타일 하나의 줄을 담당 구간으로 고르고 전체 좌표로 옮기는 ocr_tile.
+프로세스 풀 대신 현재 프로세스에 StubEngine을 작업 엔진으로 설정해 ocr_tile을 바로 부릅니다.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ocr_engine  # noqa: E402
+import tiled_ocr  # noqa: E402
+
+
+class StubEngine:
+    """타일 좌표 y=10, 100, 190 에 한 줄씩 있는 OCR 결과"""
+    name = 'stub'
+
+    def __init__(self, tesseract_cmd=''):
+        pass
+
+    def image_to_data(self, img, lang, psm=None):
+        tops = [10, 100, 190]
+        n = len(tops)
+        return {'level': [5] * n, 'page_num': [1] * n, 'block_num': [1] * n, 'par_num': [1] * n,
+                'line_num': list(range(1, n + 1)), 'word_num': [1] * n, 'left': [5] * n, 'top': tops,
+                'width': [40] * n, 'height': [20] * n, 'conf': [90.0, 90.0, 20.0],
+                'text': ['top', 'middle', 'noise']}
+
+
+@pytest.fixture
+def stub_worker(monkeypatch):
+    monkeypatch.setattr(ocr_engine, '_worker_engine', None)
+    ocr_engine.init_worker('', StubEngine)
+
+
+def test_split_tiles_covers_height_without_gaps():
+    tiles = tiled_ocr.split_tiles(1100, tile_height=480, overlap=80)
+    assert tiles == [(0, 560, 0, 480), (400, 1040, 480, 960), (880, 1100, 960, 1100)]
+    for (_, _, _, core_bottom), (_, _, next_core_top, _) in zip(tiles, tiles[1:]):
+        assert core_bottom == next_core_top
+    assert tiled_ocr.split_tiles(0) == []
+
+
+def test_ocr_tile_keeps_lines_in_core_and_shifts_them(stub_worker):
+    tile = Image.new('RGB', (200, 220), 'white')
+    lines = tiled_ocr.ocr_tile(tile, 'eng', 1, crop_top=400, core_top=480, core_bottom=600)
+    # 중심이 담당 구간(480~600) 안에 있는 줄만 남고 전체 이미지 좌표로 옮겨집니다.
+    assert [(line.text, line.top) for line in lines] == [('middle', 500)]
+    # 타일 번호가 page_num에 붙어 다른 타일의 같은 줄 번호와 섞이지 않습니다.
+    assert lines[0].key[0] == (2, 1)
+
+
+def test_ocr_tile_filters_low_confidence_words(stub_worker):
+    tile = Image.new('RGB', (200, 220), 'white')
+    lines = tiled_ocr.ocr_tile(tile, 'eng', 0, crop_top=0, core_top=0, core_bottom=220, min_conf=30)
+    assert [line.text for line in lines] == ['top', 'middle']
@@ -0,0 +1,77 @@
+"""
+translation_cache 테스트: 정규화한 줄 키, LRU 제한, SQLite 영구 저장과 translate_lines의 캐시 사용을 확인합니다.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import translation  # noqa: E402
+from translation_cache import TranslationCache, normalize_line  # noqa: E402
+
+
+def test_normalize_line():
+    assert normalize_line("  Hello \t  world ") == "Hello world"
+    # 전각 문자/호환 문자는 NFKC로 합칩니다.
+    assert normalize_line("ＨＰ　１２０") == "HP 120"
+
+
+def test_get_put_uses_normalized_key():
+    cache = TranslationCache(':memory:')
+    try:
+        assert cache.get("Hello  world", 'eng', 'ko') is None
+        cache.put("Hello world", "안녕 세상", 'ENG', 'KO')
+        assert cache.get(" Ｈｅｌｌｏ world ", 'eng', 'ko') == "안녕 세상"
+        assert cache.get("Hello world", 'eng', 'JA') is None
+        assert (cache.hits, cache.misses) == (1, 2)
+    finally:
+        cache.close()
+
+
+def test_memory_is_lru_limited_and_db_keeps_everything(tmp_path):
+    path = str(tmp_path / 'translation_cache.db')
+    cache = TranslationCache(path, max_entries=2)
+    cache.put_many([("a", "A"), ("b", "B"), ("c", "C"), ("", "empty")], 'eng', 'KO')
+    assert len(cache._memory) == 2
+    # 메모리에서 밀려난 항목은 DB에서 다시 읽습니다.
+    assert cache.get("a", 'eng', 'KO') == "A"
+    assert cache.get("", 'eng', 'KO') is None
+    cache.close()
+
+    reopened = TranslationCache(path)
+    try:
+        assert [reopened.get(line, 'eng', 'KO') for line in "abc"] == ["A", "B", "C"]
+    finally:
+        reopened.close()
+
+
+def test_translate_lines_sends_only_missing_lines():
+    translator = translation.StubTranslator()
+    cache = TranslationCache(':memory:')
+    try:
+        cache.put("Bye", "안녕히", 'eng', 'KO')
+        result = translation.translate_lines(translator, cache, ["Hello", "Bye", "Hello"], 'eng', 'KO')
+        assert result == ["[KO] Hello", "안녕히", "[KO] Hello"]
+        assert translator.calls == 1
+        assert translator.characters == len("Hello")
+
+        translation.translate_lines(translator, cache, ["Hello"], 'eng', 'KO')
+        assert translator.calls == 1
+    finally:
+        cache.close()
+
+
+def test_translate_lines_dedups_on_normalized_key():
+    translator = translation.StubTranslator()
+    cache = TranslationCache(':memory:')
+    try:
+        result = translation.translate_lines(translator, cache, ["Hello  world", "Ｈｅｌｌｏ world", "Bye"],
+                                             'eng', 'KO')
+        # 공백/전각 표기만 다른 줄은 처음 나온 원문 하나만 보냅니다.
+        assert result == ["[KO] Hello world", "[KO] Hello world", "[KO] Bye"]
+        assert translator.characters == len("Hello  world") + len("Bye")
+        assert cache.get("Hello world", 'eng', 'KO') == "[KO] Hello world"
+    finally:
+        cache.close()
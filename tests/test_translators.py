@@ -0,0 +1,119 @@
+"""
+translators.TranslatorRouter 테스트: 실패한 백엔드 쉬기(cooldown), 사용량 한도(char_budget)와 기간,
+대체 백엔드 번역을 번역 메모리에 저장하지 않는 동작. 네트워크 없이 가짜 백엔드를 씁니다.
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import translation  # noqa: E402
+from translation_cache import TranslationCache  # noqa: E402
+from translators import TranslatorError, TranslatorRouter, create_router  # noqa: E402
+
+
+class FakeBackend:
+    """원문 앞에 백엔드 이름을 붙여 돌려주고, fail이 주어지면 그 오류를 냅니다."""
+
+    def __init__(self, name, char_budget=0, fail=None, used=None):
+        self.name = name
+        self.char_budget = char_budget
+        self.fail = fail
+        self.calls = 0
+        self.used = used
+
+    def translate_text(self, texts, target_lang, source_lang=None):
+        self.calls += 1
+        if self.fail is not None:
+            raise self.fail
+        return [translation.StubResult(f"{self.name}:{text}") for text in texts]
+
+
+class ReportingBackend(FakeBackend):
+    """제공자가 알려 주는 사용량이 있는 백엔드 (DeepL의 get_usage 대신)"""
+
+    def used_characters(self):
+        return self.used
+
+
+def test_failed_backend_cools_down():
+    primary = FakeBackend('primary', fail=TranslatorError("429", 'primary', 60))
+    fallback = FakeBackend('fallback')
+    router = TranslatorRouter([primary, fallback])
+
+    assert [r.text for r in router.translate_text(["a"], 'KO')] == ["fallback:a"]
+    router.translate_text(["b"], 'KO')
+    # 쉬는 동안에는 주 백엔드를 다시 부르지 않습니다.
+    assert (primary.calls, fallback.calls) == (1, 2)
+    assert router.stats()['primary'][1] == 1
+
+    router._states['primary'].cooldown_until = 0
+    primary.fail = None
+    assert router.translate_text(["c"], 'KO')[0].text == "primary:c"
+
+
+def test_error_without_cooldown_is_retried():
+    primary = FakeBackend('primary', fail=TranslatorError("언어 쌍 없음", 'primary', 0))
+    router = TranslatorRouter([primary, FakeBackend('fallback')])
+    router.translate_text(["a"], 'KO')
+    router.translate_text(["b"], 'KO')
+    assert primary.calls == 2
+
+
+def test_all_backends_failing_raises_last_error():
+    router = TranslatorRouter([FakeBackend('a', fail=TranslatorError("a")), FakeBackend('b', fail=TranslatorError("b"))])
+    with pytest.raises(TranslatorError, match="b"):
+        router.translate_text(["x"], 'KO')
+
+
+def test_char_budget_moves_requests_to_next_backend():
+    primary = FakeBackend('primary', char_budget=10)
+    fallback = FakeBackend('fallback')
+    router = TranslatorRouter([primary, fallback], budget_window=3600)
+
+    assert router.translate_text(["12345678"], 'KO')[0].backend == 'primary'
+    # 8 + 8 > 10 이므로 다음 백엔드로 보냅니다.
+    assert router.translate_text(["abcdefgh"], 'KO')[0].backend == 'fallback'
+    # 한도 기간이 지나면 로컬 집계가 0으로 돌아갑니다.
+    router._states['primary'].window_start -= 3600
+    assert router.translate_text(["abcdefgh"], 'KO')[0].backend == 'primary'
+
+
+def test_char_budget_prefers_provider_usage():
+    primary = ReportingBackend('primary', char_budget=100, used=95)
+    router = TranslatorRouter([primary, FakeBackend('fallback')])
+    assert router.translate_text(["123456"], 'KO')[0].backend == 'fallback'
+    # 과금 주기가 바뀌어 제공자 사용량이 줄면 다시 씁니다.
+    primary.used = 0
+    assert router.translate_text(["123456"], 'KO')[0].backend == 'primary'
+    # 사용량을 아직 모르면(None) 로컬 집계를 씁니다.
+    primary.used = None
+    assert router.translate_text(["123456"], 'KO')[0].backend == 'primary'
+
+
+def test_fallback_translations_are_not_cached():
+    primary = FakeBackend('primary', fail=TranslatorError("down", 'primary', 60))
+    router = TranslatorRouter([primary, FakeBackend('fallback')])
+    cache = TranslationCache(':memory:')
+    try:
+        assert translation.translate_lines(router, cache, ["Hello"], 'eng', 'KO') == ["fallback:Hello"]
+        assert cache.get("Hello", 'eng', 'KO') is None
+
+        router._states['primary'].cooldown_until = 0
+        primary.fail = None
+        assert translation.translate_lines(router, cache, ["Hello"], 'eng', 'KO') == ["primary:Hello"]
+        assert cache.get("Hello", 'eng', 'KO') == "primary:Hello"
+    finally:
+        cache.close()
+
+
+def test_create_router_stub():
+    router = create_router('stub')
+    assert router.name == 'stub'
+    assert router.translate_text(["a"], 'KO')[0].text == "[KO] a"
+    with pytest.raises(ValueError):
+        create_router('deepl')
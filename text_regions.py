@@ -0,0 +1,185 @@
+import threading
+
+import numpy as np
+
+import ocr_engine
+
+try:
+    import cv2
+except ImportError:
+    # OpenCV가 없으면 NumPy 에지 밀도 방식만 사용합니다.
+    cv2 = None
+
+# 에지 밀도 맵의 셀 크기 (px)
+CELL_SIZE = 8
+# 가로 밝기 차이가 이 값보다 크면 글자 경계(에지)로 봅니다.
+EDGE_THRESHOLD = 40
+# 셀 안의 에지 픽셀 비율이 이 값 이상이면 텍스트 후보 셀로 봅니다.
+MIN_EDGE_DENSITY = 0.06
+# 같은 줄로 이어 붙일 가로 간격 (셀 수)
+MERGE_GAP_CELLS = 3
+# 잘라낸 영역 주변에 더할 여백 (px)
+CROP_PADDING = 6
+# 후보 영역이 전체 이미지의 이 비율 이상이면 그냥 전체를 OCR 합니다.
+FULL_IMAGE_RATIO = 0.6
+
+# 모델 경로별로 한 번만 읽어 둔 EAST 모델: {(경로, 신뢰도, NMS): [모델, 입력 크기, 락]}
+_east_models = {}
+_east_models_lock = threading.Lock()
+
+
+def _runs(mask, max_gap=0):
+    """1차원 bool 배열에서 True 구간(start, end)을 찾습니다. max_gap 이하의 빈틈은 이어 붙입니다."""
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    runs = list(zip(edges[::2], edges[1::2]))
+
+    merged = []
+    for start, end in runs:
+        if merged and start - merged[-1][1] <= max_gap:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def detect_regions_numpy(gray):
+    """
+    흑백 배열에서 가로 에지 밀도를 셀 단위로 계산하고, 행/열 투영(XY-cut)으로
+    텍스트 후보 사각형 (x1, y1, x2, y2) 목록을 만듭니다.
+    """
+    height, width = gray.shape
+    rows, cols = height // CELL_SIZE, width // CELL_SIZE
+    if rows == 0 or cols == 0:
+        return [(0, 0, width, height)]
+
+    # 1. 가로 방향 밝기 차이 → 에지 맵
+    diff = np.abs(np.diff(gray.astype(np.int16), axis=1)) > EDGE_THRESHOLD
+    diff = diff[:rows * CELL_SIZE, :cols * CELL_SIZE - 1]
+    diff = np.pad(diff, ((0, 0), (0, 1)))
+
+    # 2. 셀 단위 에지 밀도
+    density = diff.reshape(rows, CELL_SIZE, cols, CELL_SIZE).mean(axis=(1, 3))
+    cells = density >= MIN_EDGE_DENSITY
+
+    # 3. 행 투영으로 가로 띠를 찾고, 띠 안에서 열 투영으로 가로 구간을 나눕니다.
+    regions = []
+    for row_start, row_end in _runs(cells.any(axis=1)):
+        band = cells[row_start:row_end]
+        for col_start, col_end in _runs(band.any(axis=0), MERGE_GAP_CELLS):
+            # 셀 1개짜리 점/테두리는 글자가 아닐 가능성이 높아 제외
+            if col_end - col_start < 2:
+                continue
+            regions.append((col_start * CELL_SIZE, row_start * CELL_SIZE,
+                            col_end * CELL_SIZE, row_end * CELL_SIZE))
+    return regions
+
+
+def _get_east_model(model_path, conf_threshold, nms_threshold):
+    """EAST 모델을 처음 쓸 때만 파일에서 읽고 이후 캡처에서는 재사용합니다."""
+    key = (model_path, conf_threshold, nms_threshold)
+    with _east_models_lock:
+        entry = _east_models.get(key)
+        if entry is None:
+            model = cv2.dnn_TextDetectionModel_EAST(model_path)
+            model.setConfidenceThreshold(conf_threshold)
+            model.setNMSThreshold(nms_threshold)
+            entry = _east_models[key] = [model, None, threading.Lock()]
+        return entry
+
+
+def detect_regions_east(img, model_path, conf_threshold=0.5, nms_threshold=0.4):
+    """OpenCV EAST 텍스트 검출 모델로 후보 사각형을 찾습니다. (cv2와 모델 파일 필요)"""
+    entry = _get_east_model(model_path, conf_threshold, nms_threshold)
+    model, _, lock = entry
+
+    # EAST 입력 크기는 32의 배수여야 합니다.
+    width, height = img.size
+    input_size = (max(32, (width // 32) * 32), max(32, (height // 32) * 32))
+
+    frame = cv2.cvtColor(np.asarray(img.convert('RGB')), cv2.COLOR_RGB2BGR)
+    # 모델 하나를 여러 스레드가 함께 쓰므로 입력 크기 설정과 추론은 락 안에서 합니다.
+    with lock:
+        if entry[1] != input_size:
+            model.setInputParams(1.0, input_size, (123.68, 116.78, 103.94), True)
+            entry[1] = input_size
+        rotated_rects, _ = model.detectTextRectangles(frame)
+
+    regions = []
+    for rect in rotated_rects:
+        points = cv2.boxPoints(rect)
+        x1, y1 = points.min(axis=0)
+        x2, y2 = points.max(axis=0)
+        regions.append((int(x1), int(y1), int(x2), int(y2)))
+    return regions
+
+
+def detect_regions(img, east_model_path=''):
+    """
+    캡처 이미지에서 텍스트 후보 영역을 찾아, 여백을 더하고 겹치는 영역을 합친 목록을 반환합니다.
+    EAST 모델 경로가 주어지고 OpenCV가 있으면 EAST를, 아니면 NumPy 방식을 사용합니다.
+    """
+    width, height = img.size
+    if cv2 is not None and east_model_path:
+        regions = detect_regions_east(img, east_model_path)
+    else:
+        regions = detect_regions_numpy(np.asarray(img.convert('L')))
+
+    padded = []
+    for x1, y1, x2, y2 in regions:
+        padded.append((max(0, x1 - CROP_PADDING), max(0, y1 - CROP_PADDING),
+                       min(width, x2 + CROP_PADDING), min(height, y2 + CROP_PADDING)))
+    return merge_overlapping(padded)
+
+
+def merge_overlapping(regions):
+    """겹치는 사각형을 하나로 합칩니다. (한 영역이 두 번 OCR 되지 않도록)"""
+    merged = sorted(regions, key=lambda b: (b[1], b[0]))
+    changed = True
+    while changed:
+        changed = False
+        result = []
+        for box in merged:
+            x1, y1, x2, y2 = box
+            for i, (mx1, my1, mx2, my2) in enumerate(result):
+                if x1 < mx2 and mx1 < x2 and y1 < my2 and my1 < y2:
+                    result[i] = (min(x1, mx1), min(y1, my1), max(x2, mx2), max(y2, my2))
+                    changed = True
+                    break
+            else:
+                result.append(box)
+        merged = result
+    return merged
+
+
+def ocr_regions(engine, img, lang, regions):
+    """
+    후보 영역만 잘라 OCR 하고, 좌표를 전체 이미지 기준으로 되돌린 Output.DICT 형식 데이터를 반환합니다.
+    영역 번호를 page_num에 넣어 영역 간 줄 번호가 섞이지 않게 합니다.
+    """
+    width, height = img.size
+    covered = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in regions)
+    if covered >= width * height * FULL_IMAGE_RATIO:
+        # 글자가 화면 대부분을 차지하면 잘라서 여러 번 돌리는 것보다 한 번에 처리하는 편이 빠릅니다.
+        return engine.image_to_data(img, lang)
+
+    merged = None
+    for index, (x1, y1, x2, y2) in enumerate(regions):
+        data = engine.image_to_data(img.crop((x1, y1, x2, y2)), lang)
+        data['page_num'] = [index + 1] * len(data['text'])
+        data['left'] = [left + x1 for left in data['left']]
+        data['top'] = [top + y1 for top in data['top']]
+        if merged is None:
+            merged = data
+        else:
+            for key, values in data.items():
+                merged[key].extend(values)
+
+    if merged is None:
+        return {key: [] for key in ocr_engine.DATA_KEYS}
+    return merged
+
+
+def ocr_with_detection(engine, img, lang, east_model_path=''):
+    """텍스트 후보 영역을 먼저 찾고, 그 영역만 OCR 합니다."""
+    return ocr_regions(engine, img, lang, detect_regions(img, east_model_path))
@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import ocr_engine
+import ocr_refine
+import text_regions
+from preprocess import PreprocessingEngine
+from ocr_model import group_lines
+
+# 가로 띠(tile) 하나의 높이와, 경계에 걸친 줄을 온전히 인식하기 위한 위/아래 겹침 폭 (px)
+TILE_HEIGHT = 480
+TILE_OVERLAP = 80
+
+
+def split_tiles(height, tile_height=TILE_HEIGHT, overlap=TILE_OVERLAP):
+    """
+    이미지 높이를 (잘라낼 위, 잘라낼 아래, 담당 구간 위, 담당 구간 아래) 목록으로 나눕니다.
+    담당 구간은 겹치지 않으며, 각 줄은 중심이 들어간 타일에서만 채택됩니다.
+    """
+    tiles = []
+    for core_top in range(0, height, tile_height):
+        core_bottom = min(height, core_top + tile_height)
+        tiles.append((max(0, core_top - overlap), min(height, core_bottom + overlap), core_top, core_bottom))
+    return tiles
+
+
+def ocr_tile(tile_img, lang, tile_index, crop_top, core_top, core_bottom, detect_text=False, east_model_path='',
+             preset='none', min_conf=0, retry_conf=0):
+    """
+    작업 프로세스에서 타일 하나를 인식하고 전체 이미지 좌표의 줄 목록을 반환합니다.
+    타일 번호를 page_num에 붙여 타일 간 줄 번호가 섞이지 않게 합니다.
+    약한 줄 재인식/잡음 단어 제거(ocr_refine)도 작업 프로세스에서 담당 구간의 줄에만 합니다.
+    """
+    engine = PreprocessingEngine(ocr_engine.worker_engine(), preset)
+    if detect_text:
+        data = text_regions.ocr_with_detection(engine, tile_img, lang, east_model_path)
+    else:
+        data = engine.image_to_data(tile_img, lang)
+    data['page_num'] = [(tile_index + 1, page) for page in data['page_num']]
+    data['top'] = [top + crop_top for top in data['top']]
+
+    lines = []
+    for line in group_lines(data):
+        center_y = line.top + line.height / 2
+        if core_top <= center_y < core_bottom:
+            lines.append(line)
+    return ocr_refine.refine_lines(ocr_engine.worker_engine(), tile_img, lines, lang, min_conf, retry_conf, origin=(0, crop_top))
+
+
+class TiledOcr:
+    """큰 캡처를 가로 띠로 나눠 프로세스 풀에서 병렬로 OCR 합니다."""
+
+    def __init__(self, tesseract_cmd='', max_workers=None):
+        self.tesseract_cmd = tesseract_cmd
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._executor = None
+
+    def _get_executor(self):
+        # 프로세스 풀은 첫 전체 화면 캡처 때 만들고 이후 계속 재사용합니다.
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 initializer=ocr_engine.init_worker,
+                                                 initargs=(self.tesseract_cmd,))
+        return self._executor
+
+    def iter_lines(self, img, lang, is_cancelled=None, detect_text=False, east_model_path='', preset='none',
+                   min_conf=0, retry_conf=0):
+        """
+        타일이 인식되는 대로 (타일 번호, 줄 목록)을 돌려줍니다. (완료 순서)
+        is_cancelled()가 True를 반환하면 남은 타일을 취소하고 멈춥니다.
+        """
+        width, height = img.size
+        executor = self._get_executor()
+        futures = {}
+        for index, (crop_top, crop_bottom, core_top, core_bottom) in enumerate(split_tiles(height)):
+            tile_img = img.crop((0, crop_top, width, crop_bottom))
+            future = executor.submit(ocr_tile, tile_img, lang, index, crop_top, core_top, core_bottom,
+                                     detect_text, east_model_path, preset, min_conf, retry_conf)
+            futures[future] = index
+
+        try:
+            for future in as_completed(futures):
+                if is_cancelled is not None and is_cancelled():
+                    return
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
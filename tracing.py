@@ -0,0 +1,127 @@
+import json
+import os
+import platform
+import threading
+import time
+import uuid
+from collections import deque
+
+# 단계별로 보관할 최근 측정값 개수 (p50/p95/p99 계산용)
+WINDOW_SIZE = 500
+
+# 통계 창에 표시할 단계 순서
+STAGES = ('capture', 'queue', 'preprocess', 'detect', 'ocr', 'group', 'retry', 'first', 'translate', 'layout', 'render', 'total')
+
+
+def new_trace_id():
+    """캡처 한 건을 여러 단계/머신의 기록에서 묶어 볼 수 있는 상관 ID"""
+    return uuid.uuid4().hex[:12]
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 쓰는 아무 일도 하지 않는 span"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'trace_id', 'name', 'start')
+
+    def __init__(self, tracer, trace_id, name):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.trace_id, self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Tracer:
+    """
+    캡처별 단계 소요 시간을 모아 최근 값의 백분위수를 계산하고,
+    trace_file이 지정되면 JSONL로도 기록합니다.
+    enabled가 False이면 span/record는 즉시 반환합니다.
+    """
+    def __init__(self, enabled=True, trace_file=''):
+        self.enabled = enabled
+        self.trace_file = trace_file
+        self._windows = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._host = platform.node()
+
+    def span(self, trace_id, name):
+        """with 문으로 감싼 구간의 시간을 기록합니다."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, trace_id, name)
+
+    def record(self, trace_id, name, seconds):
+        """이미 측정한 구간 시간을 기록합니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            window = self._windows.get(name)
+            if window is None:
+                window = self._windows[name] = deque(maxlen=WINDOW_SIZE)
+            window.append(seconds)
+
+            if self.trace_file:
+                self._write({'trace': trace_id, 'span': name, 'ms': round(seconds * 1000, 3),
+                             'ts': round(time.time(), 3), 'host': self._host, 'pid': os.getpid()})
+
+    def record_timings(self, trace_id, timings):
+        """단계별 시간 딕셔너리(CaptureJob.timings)를 한 번에 기록합니다."""
+        if not self.enabled:
+            return
+        for name, seconds in timings.items():
+            self.record(trace_id, name, seconds)
+
+    def _write(self, entry):
+        try:
+            if self._file is None:
+                self._file = open(self.trace_file, 'a', encoding='utf-8')
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+        except OSError:
+            # 기록 파일에 쓸 수 없으면 파일 기록만 끕니다.
+            self.trace_file = ''
+
+    def summary(self):
+        """단계별 (건수, p50, p95, p99) 를 초 단위로 반환합니다."""
+        with self._lock:
+            snapshot = {name: sorted(window) for name, window in self._windows.items()}
+
+        result = {}
+        for name, values in snapshot.items():
+            if not values:
+                continue
+            last = len(values) - 1
+            result[name] = (len(values),
+                            values[int(last * 0.50)],
+                            values[int(last * 0.95)],
+                            values[int(last * 0.99)])
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._windows.clear()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
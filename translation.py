@@ -0,0 +1,118 @@
+from translation_cache import normalize_line
+
+# DeepL 요청 한도: 요청당 텍스트 50개, 요청 본문 128 KiB (여유를 두고 계산)
+MAX_TEXTS_PER_REQUEST = 50
+MAX_REQUEST_BYTES = 120 * 1024
+
+
+class StubResult:
+    """deepl.TextResult 와 같은 모양의 번역 결과 (text 속성만 사용)"""
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+
+class StubTranslator:
+    """
+    네트워크 없이 동작하는 가짜 번역기입니다. (헤드리스 일괄 처리/오프라인 테스트용)
+    원문 앞에 대상 언어 코드를 붙여 돌려주며, 호출 횟수와 글자 수를 셉니다.
+    """
+    name = 'stub'
+
+    def __init__(self):
+        self.calls = 0
+        self.characters = 0
+
+    def translate_text(self, text, target_lang, source_lang=None):
+        texts = [text] if isinstance(text, str) else list(text)
+        self.calls += 1
+        self.characters += sum(len(t) for t in texts)
+        results = [StubResult(f"[{target_lang}] {t}") for t in texts]
+        return results[0] if isinstance(text, str) else results
+
+
+def chunk_texts(texts, max_texts=MAX_TEXTS_PER_REQUEST, max_bytes=MAX_REQUEST_BYTES):
+    """
+    텍스트 목록을 DeepL 요청 한도를 넘지 않는 묶음(시작 인덱스, 텍스트 목록)으로 나눕니다.
+    """
+    chunks = []
+    start = 0
+    current = []
+    current_bytes = 0
+
+    for i, text in enumerate(texts):
+        # 폼 인코딩 시 'text=' 와 구분자, 퍼센트 인코딩으로 늘어나는 양을 대략 3배로 잡습니다.
+        size = len(text.encode('utf-8')) * 3 + 6
+        if current and (len(current) >= max_texts or current_bytes + size > max_bytes):
+            chunks.append((start, current))
+            start = i
+            current = []
+            current_bytes = 0
+        current.append(text)
+        current_bytes += size
+
+    if current:
+        chunks.append((start, current))
+    return chunks
+
+
+def translate_batch(translator, texts, target_lang, source_lang=None, uncached=None):
+    """
+    여러 줄을 목록으로 번역해 입력과 같은 순서·개수의 번역 목록을 반환합니다.
+    한도를 넘는 요청은 자동으로 나눠 보냅니다.
+    uncached(set)가 주어지면 번역 메모리에 저장하면 안 되는 결과(대체 백엔드 번역)의 인덱스를 담습니다.
+    """
+    translated = [None] * len(texts)
+    for start, chunk in chunk_texts(texts):
+        results = translator.translate_text(chunk, target_lang=target_lang, source_lang=source_lang)
+        for offset, result in enumerate(results):
+            # 한 줄의 번역 결과는 한 줄로 유지해 OCR 박스와 1:1로 대응시킵니다.
+            translated[start + offset] = " ".join(result.text.split())
+            if uncached is not None and not getattr(result, 'cacheable', True):
+                uncached.add(start + offset)
+    return translated
+
+
+def translate_lines(translator, cache, lines, source_lang, target_lang):
+    """
+    줄 단위로 번역 메모리를 조회하고, 캐시에 없는 줄만 번역합니다.
+    반환값은 lines와 같은 순서의 번역 목록입니다.
+    """
+    translated_lines = [cache.get(line, source_lang, target_lang) for line in lines]
+
+    # 같은 줄이 여러 번 나오면 한 번만 전송합니다. 번역 메모리와 같은 정규화 키로 묶어
+    # 공백/전각 표기만 다른 줄도 한 번만 보내고, 처음 나온 원문을 대표로 씁니다.
+    missing = {}
+    for i, text in enumerate(translated_lines):
+        if text is None:
+            missing.setdefault(normalize_line(lines[i]), []).append(i)
+
+    if missing:
+        unique_lines = [lines[indices[0]] for indices in missing.values()]
+        uncached = set()
+        results = translate_batch(translator, unique_lines, target_lang, source_lang, uncached)
+        for indices, text in zip(missing.values(), results):
+            for i in indices:
+                translated_lines[i] = text
+        cache.put_many([(line, text) for i, (line, text) in enumerate(zip(unique_lines, results)) if i not in uncached],
+                       source_lang, target_lang)
+
+    return translated_lines
+
+
+def translate_lines_by_lang(translator, cache, lines, source_langs, target_lang):
+    """
+    줄마다 원본 언어가 다를 때(OCR 언어 자동 감지) 언어별로 묶어 translate_lines로 번역하고
+    lines와 같은 순서로 합칩니다.
+    """
+    groups = {}
+    for i, lang in enumerate(source_langs):
+        groups.setdefault(lang, []).append(i)
+
+    translated_lines = [None] * len(lines)
+    for lang, indices in groups.items():
+        results = translate_lines(translator, cache, [lines[i] for i in indices], lang, target_lang)
+        for i, text in zip(indices, results):
+            translated_lines[i] = text
+    return translated_lines
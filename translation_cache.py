@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import config
+
+# config.json 과 같은 폴더에 번역 메모리 DB를 둡니다.
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(config.CONFIG_FILE)), 'translation_cache.db')
+MAX_MEMORY_ENTRIES = 5000
+
+
+def normalize_line(text):
+    """캐시 키로 쓰기 위해 OCR 줄의 공백/유니코드 표기를 정규화합니다."""
+    text = unicodedata.normalize('NFKC', text)
+    return " ".join(text.split())
+
+
+class TranslationCache:
+    """
+    (정규화된 원본 줄, 원본 언어, 대상 언어) 단위의 번역 메모리입니다.
+    메모리에서는 LRU로 관리하고, 모든 항목은 SQLite 파일에 영구 저장합니다.
+    """
+    def __init__(self, path=CACHE_FILE, max_entries=MAX_MEMORY_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        try:
+            # 번역은 작업 스레드에서 실행되므로 스레드 간 공유를 허용하고 락으로 보호합니다.
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " source_line TEXT NOT NULL,"
+                " source_lang TEXT NOT NULL,"
+                " target_lang TEXT NOT NULL,"
+                " translated TEXT NOT NULL,"
+                " PRIMARY KEY (source_line, source_lang, target_lang))"
+            )
+            self._db.commit()
+        except sqlite3.Error:
+            # DB 파일을 열 수 없으면 메모리 캐시만 사용합니다.
+            self._db = None
+
+    @staticmethod
+    def _key(line, source_lang, target_lang):
+        return (normalize_line(line), source_lang.lower(), target_lang.upper())
+
+    def _remember(self, key, translated):
+        self._memory[key] = translated
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, line, source_lang, target_lang):
+        """캐시된 번역을 반환합니다. 없으면 None."""
+        key = self._key(line, source_lang, target_lang)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT translated FROM translations"
+                    " WHERE source_line = ? AND source_lang = ? AND target_lang = ?", key
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put_many(self, items, source_lang, target_lang):
+        """(원본 줄, 번역) 목록을 캐시에 저장합니다."""
+        with self._lock:
+            rows = []
+            for line, translated in items:
+                key = self._key(line, source_lang, target_lang)
+                if not key[0]:
+                    continue
+                self._remember(key, translated)
+                rows.append(key + (translated,))
+
+            if self._db is not None and rows:
+                try:
+                    self._db.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)", rows)
+                    self._db.commit()
+                except sqlite3.Error:
+                    pass
+
+    def put(self, line, translated, source_lang, target_lang):
+        self.put_many([(line, translated)], source_lang, target_lang)
+
+    def stats_text(self):
+        """상태 표시줄에 출력할 적중률 문자열을 만듭니다."""
+        total = self.hits + self.misses
+        if total == 0:
+            return "캐시 적중 0/0"
+        return f"캐시 적중 {self.hits}/{total} ({self.hits / total:.0%})"
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,322 @@
+"""
+번역 백엔드: DeepL(온라인), Argos Translate(오프라인, CTranslate2 CPU), HTTP 번역 서버(테스트용),
+그리고 지연 시간/사용량 한도에 따라 백엔드를 고르고 실패 시 다음 백엔드로 넘기는 라우터입니다.
+
+모든 백엔드는 deepl.Translator와 같은 모양의 translate_text(texts, target_lang, source_lang)를
+제공하며, 결과는 text 속성을 가진 객체 목록입니다.
+"""
+import importlib.util
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from translation import StubResult, StubTranslator
+
+# 선택 가능한 번역 엔진 ('auto'는 DeepL 우선, 실패/지연 시 로컬 모델)
+BACKEND_CHOICES = ('auto', 'deepl', 'argos', 'http', 'stub')
+DEFAULT_HTTP_URL = 'http://127.0.0.1:8765/translate'
+
+# 백엔드가 실패했을 때 다시 시도하기 전까지 쉬는 시간 (초)
+ERROR_COOLDOWN_SECONDS = 30
+RATE_LIMIT_COOLDOWN_SECONDS = 60
+QUOTA_COOLDOWN_SECONDS = 3600
+# 평균 응답 시간이 이 값을 넘으면 느린 백엔드로 보고 후순위로 미룹니다.
+SLOW_SECONDS = 1.5
+# 느려서 미룬 백엔드도 이 시간이 지나면 한 번 다시 써 보고 회복 여부를 확인합니다.
+PROBE_INTERVAL_SECONDS = 30
+# 응답 시간 이동 평균의 가중치
+LATENCY_ALPHA = 0.3
+# 사용량 한도(char_budget) 기간. 제공자가 사용량을 알려 주지 않는 백엔드는 이 기간마다 로컬에서 센 글자 수를 0으로 되돌립니다.
+# (DeepL은 get_usage의 과금 주기 사용량을 쓰므로 주기가 바뀌면 자동으로 줄어듦)
+BUDGET_WINDOW_SECONDS = 30 * 24 * 3600
+
+# Tesseract 언어 코드 → ISO 639-1 (Argos/HTTP 백엔드용)
+TESSERACT_TO_ISO = {
+    'eng': 'en', 'kor': 'ko', 'jpn': 'ja', 'chi_sim': 'zh', 'chi_tra': 'zt',
+    'fra': 'fr', 'deu': 'de', 'spa': 'es', 'ita': 'it', 'por': 'pt', 'rus': 'ru',
+    'vie': 'vi', 'tha': 'th', 'ind': 'id', 'ara': 'ar', 'tur': 'tr', 'pol': 'pl', 'nld': 'nl',
+}
+
+
+class TranslatorError(RuntimeError):
+    """번역 백엔드 오류. cooldown 초 동안 라우터가 해당 백엔드를 건너뜁니다. (0이면 건너뛰지 않음)"""
+
+    def __init__(self, message, backend='', cooldown=ERROR_COOLDOWN_SECONDS):
+        super().__init__(message)
+        self.backend = backend
+        self.cooldown = cooldown
+
+
+def to_iso_lang(code):
+    """Tesseract 코드(eng, eng+jpn)나 DeepL 코드(KO, EN-US)를 ISO 639-1 코드로 바꿉니다."""
+    if not code or code.split(':')[0] == 'auto':
+        # OCR 언어 자동 감지('auto')에서 언어를 모르는 줄은 번역 엔진의 자동 감지에 맡깁니다.
+        return None
+    first = code.split('+')[0]
+    if first in TESSERACT_TO_ISO:
+        return TESSERACT_TO_ISO[first]
+    return first.split('-')[0].lower()
+
+
+class DeepLBackend:
+    """
+    DeepL 공식 클라이언트 (deepl_client.DeepLClient: 연결 유지, 중복 요청 합치기, 재시도, 사용량 계산).
+    원본 언어는 DeepL 자동 감지에 맡깁니다.
+    """
+    name = 'deepl'
+
+    def __init__(self, api_key, char_budget=0):
+        import deepl
+        import deepl_client
+        self._deepl = deepl
+        self.client = deepl_client.DeepLClient(api_key)
+        self.char_budget = char_budget
+
+    def translate_text(self, texts, target_lang, source_lang=None):
+        deepl = self._deepl
+        try:
+            return self.client.translate_text(texts, target_lang=target_lang)
+        except deepl.QuotaExceededException as e:
+            raise TranslatorError(f"DeepL 사용 한도 초과: {e}", self.name, QUOTA_COOLDOWN_SECONDS) from e
+        except deepl.TooManyRequestsException as e:
+            cooldown = getattr(e, 'retry_after', None) or RATE_LIMIT_COOLDOWN_SECONDS
+            raise TranslatorError(f"DeepL 요청 과다(429): {e}", self.name, cooldown) from e
+        except deepl.DeepLException as e:
+            raise TranslatorError(f"DeepL API 오류: {e}", self.name) from e
+
+    def used_characters(self):
+        """이번 과금 주기에 쓴 글자 수 (DeepL 계정 사용량 기준, 아직 모르면 None)"""
+        return self.client.used_characters()
+
+    def warm_up(self):
+        self.client.warm_up()
+
+    def close(self):
+        self.client.close()
+
+
+class ArgosBackend:
+    """
+    Argos Translate 오프라인 번역 (CTranslate2로 CPU에서 실행).
+    언어 쌍별 번역 모델은 처음 쓸 때 한 번 불러와 재사용합니다.
+    """
+    name = 'argos'
+
+    def __init__(self, char_budget=0):
+        import argostranslate.translate
+        self._argos = argostranslate.translate
+        self.char_budget = char_budget
+        self._models = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_installed():
+        return importlib.util.find_spec('argostranslate') is not None
+
+    def _get_model(self, source, target):
+        key = (source, target)
+        with self._lock:
+            if key not in self._models:
+                languages = {lang.code: lang for lang in self._argos.get_installed_languages()}
+                model = None
+                if source in languages and target in languages:
+                    model = languages[source].get_translation(languages[target])
+                self._models[key] = model
+            return self._models[key]
+
+    def translate_text(self, texts, target_lang, source_lang=None):
+        source, target = to_iso_lang(source_lang), to_iso_lang(target_lang)
+        if source is None:
+            raise TranslatorError("Argos: 원본 언어를 알 수 없습니다.", self.name, 0)
+        model = self._get_model(source, target)
+        if model is None:
+            # 언어 패키지가 없는 쌍만 실패하므로 백엔드 전체를 쉬게 하지는 않습니다.
+            raise TranslatorError(f"Argos: 설치된 언어 패키지가 없습니다. ({source} → {target})", self.name, 0)
+        return [StubResult(model.translate(text)) for text in texts]
+
+
+class HttpBackend:
+    """
+    JSON HTTP 번역 서버 클라이언트. (mock_translate_server.py 등 로컬 테스트용)
+    요청: {"texts": [...], "source_lang": "en", "target_lang": "ko"}  응답: {"translations": [...]}
+    """
+    name = 'http'
+
+    def __init__(self, url=DEFAULT_HTTP_URL, timeout=5.0, char_budget=0):
+        self.url = url
+        self.timeout = timeout
+        self.char_budget = char_budget
+
+    def translate_text(self, texts, target_lang, source_lang=None):
+        body = json.dumps({'texts': list(texts), 'source_lang': to_iso_lang(source_lang),
+                           'target_lang': to_iso_lang(target_lang)}).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                retry_after = e.headers.get('Retry-After', '')
+                cooldown = float(retry_after) if retry_after.isdigit() else RATE_LIMIT_COOLDOWN_SECONDS
+                raise TranslatorError("HTTP 번역 서버 요청 과다(429)", self.name, cooldown) from e
+            raise TranslatorError(f"HTTP 번역 서버 오류: {e.code}", self.name) from e
+        except (urllib.error.URLError, TimeoutError, ValueError) as e:
+            raise TranslatorError(f"HTTP 번역 서버 연결 실패: {e}", self.name) from e
+        return [StubResult(text) for text in payload['translations']]
+
+
+class _BackendState:
+    __slots__ = ('latency', 'last_used', 'cooldown_until', 'characters', 'window_start', 'calls', 'failures')
+
+    def __init__(self):
+        self.latency = None
+        self.last_used = 0.0
+        self.cooldown_until = 0.0
+        # 한도 기간(window_start부터) 동안 이 백엔드로 보낸 글자 수
+        self.characters = 0
+        self.window_start = time.monotonic()
+        self.calls = 0
+        self.failures = 0
+
+
+class RoutedResult:
+    """라우터 결과: 번역한 백엔드와 번역 메모리에 저장할지 여부를 함께 담습니다."""
+    __slots__ = ('text', 'backend', 'cacheable')
+
+    def __init__(self, text, backend, cacheable):
+        self.text = text
+        self.backend = backend
+        self.cacheable = cacheable
+
+
+class TranslatorRouter:
+    """
+    선호 순서대로 놓인 백엔드 중 쓸 수 있는 것을 골라 번역합니다.
+    - 실패한 백엔드는 오류에 따른 시간 동안 건너뜁니다. (429는 Retry-After, 한도 초과는 1시간)
+    - 사용량 한도(char_budget)를 넘는 요청은 다음 백엔드로 보냅니다. 한도는 과금 주기 단위로,
+      백엔드가 used_characters()로 실제 사용량을 알려 주면(DeepL) 그 값을, 아니면 budget_window마다
+      0으로 되돌리는 로컬 집계를 씁니다.
+    - 평균 응답 시간이 slow_seconds를 넘는 백엔드는 후순위로 미루되, 주기적으로 다시 시도합니다.
+    첫 번째(주) 백엔드가 아닌 대체 백엔드의 번역은 번역 메모리에 저장하지 않아
+    주 백엔드가 회복되면 더 나은 번역으로 바뀔 수 있게 합니다.
+    """
+    def __init__(self, backends, slow_seconds=SLOW_SECONDS, budget_window=BUDGET_WINDOW_SECONDS):
+        if not backends:
+            raise ValueError("사용 가능한 번역 엔진이 없습니다.")
+        self.backends = list(backends)
+        self.slow_seconds = slow_seconds
+        self.budget_window = budget_window
+        self.name = '→'.join(backend.name for backend in self.backends)
+        self.last_backend = None
+        self._states = {backend.name: _BackendState() for backend in self.backends}
+        self._lock = threading.Lock()
+
+    def _used_characters(self, backend, state, now):
+        """한도 계산에 쓸 이번 기간 사용량 (락을 잡은 상태에서 호출)"""
+        if now - state.window_start >= self.budget_window:
+            state.characters = 0
+            state.window_start = now
+        used = backend.used_characters() if hasattr(backend, 'used_characters') else None
+        return state.characters if used is None else used
+
+    def _candidates(self, characters):
+        now = time.monotonic()
+        ready = []
+        with self._lock:
+            for backend in self.backends:
+                state = self._states[backend.name]
+                if state.cooldown_until > now:
+                    continue
+                budget = getattr(backend, 'char_budget', 0)
+                if budget and self._used_characters(backend, state, now) + characters > budget:
+                    continue
+                slow = (state.latency is not None and state.latency > self.slow_seconds
+                        and now - state.last_used < PROBE_INTERVAL_SECONDS)
+                ready.append((slow, backend))
+        # sort는 안정 정렬이므로 느리지 않은 백엔드끼리는 선호 순서가 유지됩니다.
+        ready.sort(key=lambda item: item[0])
+        return [backend for _, backend in ready]
+
+    def _record(self, backend, seconds, characters):
+        with self._lock:
+            state = self._states[backend.name]
+            state.latency = seconds if state.latency is None else (
+                LATENCY_ALPHA * seconds + (1 - LATENCY_ALPHA) * state.latency)
+            state.last_used = time.monotonic()
+            state.characters += characters
+            state.calls += 1
+
+    def _record_failure(self, backend, error):
+        cooldown = getattr(error, 'cooldown', ERROR_COOLDOWN_SECONDS)
+        with self._lock:
+            state = self._states[backend.name]
+            state.failures += 1
+            state.last_used = time.monotonic()
+            if cooldown:
+                state.cooldown_until = time.monotonic() + cooldown
+
+    def translate_text(self, texts, target_lang, source_lang=None):
+        characters = sum(len(text) for text in texts)
+        candidates = self._candidates(characters)
+        if not candidates:
+            # 모두 쉬는 중이면 쉬는 시간을 무시하고 선호 순서대로 시도합니다.
+            candidates = self.backends
+
+        last_error = None
+        for backend in candidates:
+            start = time.perf_counter()
+            try:
+                results = backend.translate_text(texts, target_lang=target_lang, source_lang=source_lang)
+            except Exception as e:
+                self._record_failure(backend, e)
+                last_error = e
+                continue
+            self._record(backend, time.perf_counter() - start, characters)
+            self.last_backend = backend.name
+            cacheable = backend is self.backends[0]
+            return [RoutedResult(result.text, backend.name, cacheable) for result in results]
+        raise last_error
+
+    def warm_up(self):
+        """연결을 미리 맺어 둘 수 있는 백엔드를 준비합니다. (실패해도 첫 번역 때 다시 시도)"""
+        for backend in self.backends:
+            if hasattr(backend, 'warm_up'):
+                try:
+                    backend.warm_up()
+                except Exception:
+                    pass
+
+    def close(self):
+        for backend in self.backends:
+            if hasattr(backend, 'close'):
+                backend.close()
+
+    def stats(self):
+        """백엔드별 (호출 수, 실패 수, 평균 응답 시간(초), 보낸 글자 수)"""
+        with self._lock:
+            return {name: (state.calls, state.failures, state.latency, state.characters)
+                    for name, state in self._states.items()}
+
+
+def create_router(choice, deepl_key='', http_url=DEFAULT_HTTP_URL, deepl_char_budget=0):
+    """설정의 번역 엔진 선택에 맞는 라우터를 만듭니다. 쓸 수 있는 엔진이 없으면 ValueError."""
+    backends = []
+    if choice in ('auto', 'deepl'):
+        if deepl_key:
+            backends.append(DeepLBackend(deepl_key, deepl_char_budget))
+        elif choice == 'deepl':
+            raise ValueError("DeepL API 키가 설정되지 않았습니다.")
+    if choice in ('auto', 'argos'):
+        if ArgosBackend.is_installed():
+            backends.append(ArgosBackend())
+        elif choice == 'argos':
+            raise ValueError("Argos Translate가 설치되어 있지 않습니다. (pip install argostranslate)")
+    if choice == 'http':
+        backends.append(HttpBackend(http_url))
+    if choice == 'stub':
+        backends.append(StubTranslator())
+    if not backends:
+        raise ValueError("사용 가능한 번역 엔진이 없습니다. DeepL API 키를 입력하거나 Argos Translate를 설치하세요.")
+    return TranslatorRouter(backends)